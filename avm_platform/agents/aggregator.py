@@ -0,0 +1,200 @@
+import numpy as np
+import pandas as pd
+
+from avm_platform.agents.config import AGGREGATION_ESTIMATOR, AGGREGATION_REJECT_OUTLIERS
+from avm_platform.agents.values import FAILURE_VALUES, FIELD_KINDS, typed_fields
+
+# Columns of an observations table: one typed value per (property, site, field)
+OBSERVATION_COLUMNS = ['property_id', 'site', 'field', 'value', 'confidence']
+
+# One consensus per (property, field)
+KEYS = ['property_id', 'field']
+
+# Scale turning a median absolute deviation into a standard deviation estimate
+MAD_SCALE = 1.4826
+
+
+def site_observations(property_id, data):
+    """(property_id, site, field, value, confidence) rows for one property's {site: result} dict"""
+    rows = []
+    for site, site_data in data.items():
+        if isinstance(site_data, dict):
+            for field, entry in typed_fields(site_data).items():
+                rows.append((property_id, site, field, entry['value'], entry['confidence']))
+    return rows
+
+
+def observations_frame(properties):
+    """Observations table for {property_id: {site: result}}, e.g. a batch of fetch_all results"""
+    rows = [row for property_id, data in properties.items() for row in site_observations(property_id, data)]
+    return pd.DataFrame(rows, columns=OBSERVATION_COLUMNS)
+
+
+# Estimators: observations (with a 'weight' column) -> consensus Series indexed by KEYS
+
+def mean_estimator(observations):
+    return observations.groupby(KEYS, sort=False)['value'].mean()
+
+
+def median_estimator(observations):
+    return observations.groupby(KEYS, sort=False)['value'].median()
+
+
+def trimmed_mean_estimator(observations, trim=0.2):
+    """Mean after dropping the lowest and highest ``trim`` fraction of each group's values.
+
+    At least one value is dropped from each end once a group has three values.
+    """
+    grouped = observations.groupby(KEYS, sort=False)['value']
+    rank = grouped.rank(method='first')
+    size = grouped.transform('size')
+    cut = np.where(size >= 3, np.maximum(1, np.floor(size * trim)), 0)
+    kept = observations[(rank > cut) & (rank <= size - cut)]
+    return kept.groupby(KEYS, sort=False)['value'].mean()
+
+
+def weighted_mean_estimator(observations):
+    """Mean weighted by site reliability x parse confidence"""
+    sums = observations.assign(weighted=observations['value'] * observations['weight']) \
+        .groupby(KEYS, sort=False)[['weighted', 'weight']].sum()
+    return (sums['weighted'] / sums['weight'].where(sums['weight'] > 0)).fillna(mean_estimator(observations))
+
+
+ESTIMATORS = {
+    'mean': mean_estimator,
+    'median': median_estimator,
+    'trimmed_mean': trimmed_mean_estimator,
+    'weighted_mean': weighted_mean_estimator,
+}
+
+
+def outlier_mask(observations, threshold=3.5, tolerance=0.25):
+    """True for observations to keep.
+
+    A value is an outlier when it sits further from its group's median than
+    ``threshold`` scaled MADs and ``tolerance`` (a fraction) of the median; the
+    second bound stops agreeing sites (MAD 0) from rejecting small differences.
+    Groups with fewer than three values have no majority and are kept whole.
+    """
+    grouped = observations.groupby(KEYS, sort=False)['value']
+    median = grouped.transform('median')
+    deviation = (observations['value'] - median).abs()
+    mad = deviation.groupby([observations[k] for k in KEYS], sort=False).transform('median')
+    limit = np.maximum(threshold * MAD_SCALE * mad, tolerance * median.abs())
+    return (grouped.transform('size') < 3) | (deviation <= limit)
+
+
+def learn_site_reliability(observations, consensus, floor=0.02):
+    """{site: weight in (0, 1]} from each site's median relative error against ``consensus``.
+
+    ``consensus`` is a consensus() frame over the same observations; a site
+    whose values are typically ``floor`` off the consensus gets weight 0.5.
+    """
+    merged = observations.merge(consensus[KEYS + ['estimate']], on=KEYS)
+    error = (merged['value'] - merged['estimate']).abs() / merged['estimate'].abs().where(merged['estimate'] != 0)
+    per_site = error.groupby(merged['site']).median().dropna()
+    return (floor / (per_site + floor)).to_dict()
+
+
+class AggregatorAgent:
+    def __init__(self, estimator=None, reject_outliers=None, site_weights=None):
+        # Name from ESTIMATORS or a callable(observations) -> Series indexed by (property_id, field)
+        self.estimator = estimator or AGGREGATION_ESTIMATOR
+        self.reject_outliers = AGGREGATION_REJECT_OUTLIERS if reject_outliers is None else reject_outliers
+        # {site: reliability weight} for weighted_mean; sites not listed weigh 1
+        self.site_weights = site_weights or {}
+
+    def consensus(self, observations):
+        """Long consensus table, one row per (property_id, field).
+
+        Columns: estimate, low/high (range of the values used), spread
+        ((high - low) / |estimate|), sources (values used), rejected (outliers
+        dropped) and confidence - the mean parse confidence, scaled down by the
+        spread and up with the number of agreeing sources.
+        """
+        observations = observations[observations['field'].isin(list(FIELD_KINDS))]
+        observations = observations.assign(value=pd.to_numeric(observations['value'], errors='coerce'))
+        observations = observations.dropna(subset=['value'])
+        confidence = observations['confidence'] if 'confidence' in observations else pd.Series(1.0, observations.index)
+        observations = observations.assign(
+            confidence=confidence.fillna(1.0),
+            weight=observations['site'].map(self.site_weights).fillna(1.0) * confidence.fillna(1.0),
+        )
+
+        keep = outlier_mask(observations) if self.reject_outliers else pd.Series(True, observations.index)
+        used = observations[keep]
+        estimator = ESTIMATORS[self.estimator] if isinstance(self.estimator, str) else self.estimator
+
+        grouped = used.groupby(KEYS, sort=False)
+        stats = grouped.agg(low=('value', 'min'), high=('value', 'max'), sources=('value', 'size'),
+                            parse_confidence=('confidence', 'mean'))
+        stats['estimate'] = estimator(used)
+        stats['rejected'] = (~keep).groupby([observations[k] for k in KEYS], sort=False).sum() \
+            .reindex(stats.index, fill_value=0).astype(int)
+        stats['spread'] = ((stats['high'] - stats['low']) / stats['estimate'].abs()).fillna(0.0)
+        coverage = 1 - 0.5 ** stats['sources']
+        stats['confidence'] = stats['parse_confidence'] * coverage * (1 - stats['spread']).clip(lower=0)
+        columns = ['estimate', 'low', 'high', 'spread', 'sources', 'rejected', 'confidence']
+        return stats[columns].reset_index()
+
+    def learn_weights(self, observations):
+        """Set site_weights from how well each site agrees with the median consensus of ``observations``"""
+        baseline = AggregatorAgent('median', self.reject_outliers).consensus(observations)
+        self.site_weights = learn_site_reliability(observations, baseline)
+        return self.site_weights
+
+    def aggregate_frame(self, observations):
+        """Per-property consensus values from an observations table.
+
+        ``observations`` needs property_id, site, field and value columns
+        (confidence is optional). Returns one row per property_id with a column
+        per numeric field and ``sources``, the number of sites with a value.
+        """
+        consensus = self.consensus(observations)
+        wide = consensus.pivot(index='property_id', columns='field', values='estimate')
+        valued = consensus[consensus['field'] == 'value'].set_index('property_id')
+        properties = pd.Index(consensus['property_id'].unique(), name='property_id')
+        wide = wide.reindex(index=properties, columns=pd.Index(list(FIELD_KINDS)))
+        wide['sources'] = (valued['sources'] + valued['rejected']).reindex(properties, fill_value=0).astype(int)
+        return wide
+
+    def aggregate(self, data):
+        """Consensus values, images and site status for one property's {site: result} dict"""
+        observations = pd.DataFrame(site_observations(0, data), columns=OBSERVATION_COLUMNS)
+        consensus = self.consensus(observations).set_index('field')
+
+        last_solds = []
+        images = []
+        # Track successful sites for better user feedback
+        successful_sites = []
+        failed_sites = []
+        valued = set(observations.loc[observations['field'] == 'value', 'site'])
+
+        for site, site_data in data.items():
+            if site in valued:
+                successful_sites.append(site.title())
+            else:
+                failed_sites.append(site.title())
+            if not isinstance(site_data, dict):
+                continue
+
+            # Extract last_sold (keep as-is)
+            if site_data.get('last_sold') is not None and site_data['last_sold'] not in FAILURE_VALUES:
+                last_solds.append(site_data['last_sold'])
+
+            # Extract images
+            if 'images' in site_data and site_data['images']:
+                images.extend(site_data['images'])
+
+        aggregated = {
+            **{field: consensus.at[field, 'estimate'] if field in consensus.index else None for field in FIELD_KINDS},
+            'last_sold': last_solds[0] if last_solds else None,
+            'images': images[:10] if images else [],  # Take first 10 images, avoid set() on dicts
+            'successful_sites': successful_sites,
+            'failed_sites': failed_sites,
+            'data_quality': f"{len(successful_sites)}/{len(data)} sites successful",
+            # Per-field agreement between sites: relative spread and 0-1 confidence
+            'spread': consensus['spread'].to_dict(),
+            'confidence': consensus['confidence'].round(3).to_dict(),
+        }
+        return aggregated, data
@@ -0,0 +1,92 @@
+import numpy as np
+
+from avm_platform.agents.irr import irr_batch, level_cashflows
+from avm_platform.agents.schedule import cash_flow_schedule, monthly_payment
+from avm_platform.agents.simulation import DEFAULT_PATHS, simulate
+
+# analyze_grid axes, in the order of the result dimensions
+GRID_AXES = ('purchase', 'reno', 'hold_months', 'ltv', 'interest')
+
+
+class AnalyzerAgent:
+    def __init__(self, settings):
+        self.settings = settings
+
+    def analyze_scenarios(self, aggregated, purchase, reno, hold_months, ltv=None, interest=None, arv=None, rent=None):
+        """Deal metrics for arrays of scenarios.
+
+        purchase, reno, hold_months, ltv and interest (percent; default to the
+        settings) broadcast against each other like NumPy operands, as do arv
+        and rent when given instead of the aggregated value and rent; every
+        metric comes back as an array of the broadcast shape.
+        """
+        s = self.settings
+        purchase, reno, hold_months = (np.asarray(a, dtype=float) for a in (purchase, reno, hold_months))
+        ltv = np.asarray(s['ltv'] if ltv is None else ltv, dtype=float) / 100
+        rate = np.asarray(s['interest'] if interest is None else interest, dtype=float) / 100 / 12
+        arv = np.asarray((aggregated['value'] or 0) if arv is None else arv, dtype=float)
+        rent = np.asarray((aggregated['rent'] or 0) if rent is None else rent, dtype=float)
+
+        hold_days = s['hold_days_base'] + (reno // 10000) * 7
+        carrying = np.maximum(0.007 * purchase, 500) * hold_days / 30
+        sale_costs = arv * (s['brokerage'] + s['sales_closing']) / 100
+        acquisition = purchase * s['acquisition'] / 100
+        net_profit = arv - purchase - reno - carrying - sale_costs - acquisition
+        down = purchase * (1 - ltv)
+        total_invest = down + reno
+        with np.errstate(divide='ignore', invalid='ignore'):
+            roi = np.where(total_invest != 0, net_profit / total_invest * 100, 0)
+            noi = rent * 12 * (1 - s['vacancy'] / 100 - s['maintenance'] / 100 - s['management'] / 100)
+            cap_rate = np.where(purchase != 0, noi / purchase * 100, 0)
+
+            # First payment of the loan schedule (ARM resets come after any realistic flip hold)
+            mortgage_monthly = monthly_payment(purchase * ltv, rate, s['amortization'] * 12)
+            cash_flow = rent - mortgage_monthly - rent * (s['vacancy'] + s['maintenance'] + s['management']) / 100
+            cash_on_cash = np.where(down != 0, cash_flow * 12 / down * 100, 0)
+
+        shape = np.broadcast_shapes(purchase.shape, reno.shape, hold_months.shape, ltv.shape, rate.shape,
+                                    arv.shape, rent.shape)
+        # Monthly cash flows, then the sale; one batched solve for every scenario
+        terminal = arv - down - carrying - sale_costs
+        irr = irr_batch(level_cashflows(-down - reno, cash_flow, hold_months, terminal)).reshape(shape) * 100
+        basis = purchase + reno + carrying + acquisition
+        metrics = {
+            'net_profit': net_profit,
+            'roi': roi,
+            'cap_rate': cap_rate,
+            'cash_flow': cash_flow,
+            'cash_on_cash': cash_on_cash,
+            'irr': irr,
+            'basis': basis,
+        }
+        return {name: np.broadcast_to(value, shape) for name, value in metrics.items()}
+
+    def analyze_grid(self, aggregated, purchase, reno, hold_months, ltv=None, interest=None):
+        """Deal metrics over every combination of the given axes (see GRID_AXES).
+
+        Each argument is a scalar (held fixed) or a 1-D array (a grid axis); the
+        metric arrays have one dimension per array argument, in GRID_AXES order.
+        E.g. purchase=np.arange(80e3, 121e3, 5e3), reno=[10e3, 20e3, 30e3] gives
+        a 9 x 3 offer-price sensitivity table for every metric.
+        """
+        values = dict(zip(GRID_AXES, (purchase, reno, hold_months,
+                                      self.settings['ltv'] if ltv is None else ltv,
+                                      self.settings['interest'] if interest is None else interest)))
+        axes = [name for name in GRID_AXES if np.ndim(values[name])]
+        grids = dict(zip(axes, np.ix_(*(np.asarray(values[name], dtype=float) for name in axes))))
+        args = {name: grids.get(name, values[name]) for name in GRID_AXES}
+        return self.analyze_scenarios(aggregated, **args)
+
+    def schedule(self, aggregated, user_inputs, months=12):
+        """Month-by-month loan and rental cash flow for the deal (see avm_platform.agents.schedule), one row"""
+        loan_amount = user_inputs.get('purchase', 0) * self.settings['ltv'] / 100
+        return cash_flow_schedule(aggregated['rent'] or 0, loan_amount, self.settings, months)
+
+    def analyze(self, aggregated, user_inputs):
+        metrics = self.analyze_scenarios(aggregated, user_inputs.get('purchase', 0), user_inputs.get('reno', 0),
+                                         user_inputs.get('hold_months', 12))
+        return {name: float(value) for name, value in metrics.items()}
+
+    def simulate(self, aggregated, user_inputs, paths=DEFAULT_PATHS, seed=None, distributions=None):
+        """Monte Carlo percentile bands for the deal (see avm_platform.agents.simulation)"""
+        return simulate(self, aggregated, user_inputs, paths, seed, distributions)
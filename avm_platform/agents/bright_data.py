@@ -0,0 +1,598 @@
+import asyncio
+import itertools
+import logging
+import time
+
+import httpx
+
+from avm_platform.agents.config import (
+    BRIGHT_DATA_API_BASE,
+    BRIGHT_DATA_REALTOR_DATASET,
+    BRIGHT_DATA_ZILLOW_DATASET,
+)
+from avm_platform.agents.normalizer import property_key
+from avm_platform.agents.polling import AdaptivePoller
+from avm_platform.agents.snapshot_cache import get_snapshot_cache
+from avm_platform.agents.values import with_typed
+
+logger = logging.getLogger(__name__)
+
+# Progress statuses meaning the snapshot can be downloaded
+READY_STATUSES = ('ready', 'completed')
+
+def zillow_url(address_dict):
+    """Zillow search URL the Zillow dataset is triggered with"""
+    street = address_dict['street'].replace(' ', '-')
+    city = address_dict['city'].replace(' ', '-')
+    return f"https://www.zillow.com/homes/{street}-{city}-{address_dict['state']}-{address_dict['zip']}_rb/"
+
+
+def realtor_url(address_dict):
+    """Direct Realtor.com property URL (more direct than search)"""
+    street = address_dict['street'].replace(' ', '-').lower()
+    city = address_dict['city'].replace(' ', '-').lower()
+    state = address_dict['state'].lower()
+    return f"https://www.realtor.com/realestateandhomes-detail/{street}_{city}_{state}_{address_dict['zip']}"
+
+
+def parse_zillow_record(property_data):
+    """Map a Zillow dataset record onto the fetcher result fields (with their typed values)"""
+    return with_typed({
+        'value': property_data.get('price', property_data.get('zestimate', 'N/A')),
+        'rent': property_data.get('rentZestimate', 'N/A'),
+        'beds': property_data.get('bedrooms', 'N/A'),
+        'baths': property_data.get('bathrooms', 'N/A'),
+        'sqft': property_data.get('livingArea', 'N/A'),
+        'year': property_data.get('yearBuilt', 'N/A'),
+        'taxes': property_data.get('taxHistory', [{}])[0].get('taxPaid', 'N/A') if property_data.get('taxHistory') else 'N/A',
+        'last_sold': property_data.get('priceHistory', [{}])[0].get('date', 'N/A') if property_data.get('priceHistory') else 'N/A',
+        'images': property_data.get('photos', [])[:5]  # First 5 images
+    })
+
+
+def parse_realtor_record(property_data):
+    """Map a Realtor dataset record onto the fetcher result fields (with their typed values)"""
+    return with_typed({
+        'value': property_data.get('price', property_data.get('list_price', property_data.get('estimate', 'N/A'))),
+        'rent': property_data.get('rent_estimate', property_data.get('rentEstimate', 'N/A')),
+        'beds': property_data.get('beds', property_data.get('bedrooms', 'N/A')),
+        'baths': property_data.get('baths', property_data.get('bathrooms', 'N/A')),
+        'sqft': property_data.get('sqft', property_data.get('square_feet', 'N/A')),
+        'year': property_data.get('year_built', property_data.get('yearBuilt', 'N/A')),
+        'taxes': property_data.get('tax_amount', property_data.get('taxes', 'N/A')),
+        'last_sold': property_data.get('last_sold_date', property_data.get('sold_date', 'N/A')),
+        'images': property_data.get('photos', property_data.get('images', []))[:5]
+    })
+
+
+def _url_key(url):
+    return (url or '').strip().lower().rstrip('/')
+
+
+def records_for_url(data, url, strict=False):
+    """Records of a (possibly multi-URL) snapshot that belong to ``url``.
+
+    Records are matched on the echoed ``input.url``, then on their own ``url``.
+    Snapshots without either are single-input snapshots and are returned whole,
+    unless ``strict`` (the snapshot is known to hold several inputs). Per-input
+    error records are dropped.
+    """
+    if not data:
+        return []
+    records = [r for r in (data if isinstance(data, list) else [data]) if isinstance(r, dict)]
+    key = _url_key(url)
+    echoed = [r for r in records if isinstance(r.get('input'), dict)]
+    if echoed:
+        matched = [r for r in echoed if _url_key(r['input'].get('url')) == key]
+    else:
+        matched = [r for r in records if _url_key(r.get('url')) == key]
+        if not matched and not strict:
+            matched = records
+    return [r for r in matched if not r.get('error')]
+
+
+def with_cached_fields(cached, placeholder):
+    """Failure placeholder, keeping any still-fresh cached facts (beds, year, ...)"""
+    return with_typed({**cached, **placeholder})
+
+
+# Result placeholders for lookups that produced no record, by lookup status
+PLACEHOLDERS = {
+    'trigger_failed': {'value': 'Trigger failed', 'rent': 'Trigger failed'},
+    'timeout': {'value': 'Processing...', 'rent': 'Processing...'},
+    'failed': {'value': 'Failed', 'rent': 'Failed'},
+    'no_data': {'value': 'No data found', 'rent': 'N/A'},
+}
+
+
+def cached_result(cache, label, key, source):
+    """(fresh result or None, cached fields): a result whose AVM fields are still fresh needs no lookup"""
+    cached, missing = cache.get_result(key, source)
+    if cached and 'avm' not in missing:
+        logger.info(f"{label} API: Using cached result for {key}")
+        return cached, cached
+    return None, cached
+
+
+def result_from_snapshot(cache, label, key, source, snapshot_id, data, url, parse):
+    """Parsed (and cached) record for ``url`` from a cached snapshot's data, or None if it has none"""
+    records = records_for_url(data, url)
+    if not records:
+        logger.warning(f"{label} API: Cached snapshot {snapshot_id} has no data")
+        return None
+    logger.info(f"{label} API: Using cached snapshot {snapshot_id}")
+    result = parse(records[0])
+    cache.put_result(key, source, result)
+    return result
+
+
+def finish_lookup(cache, label, key, source, parse, cached, pending, lookup, dataset_id, url, shared=False):
+    """Result for a (status, snapshot_id, records) lookup: the parsed record, or a placeholder.
+
+    A timed-out snapshot is kept as pending so a later lookup resolves it
+    instead of paying for a new trigger.
+    """
+    status, snapshot_id, records = lookup
+    if status == 'trigger_failed':
+        logger.error(f"{label} API: Trigger failed")
+        return with_cached_fields(cached, PLACEHOLDERS['trigger_failed'])
+    if status == 'timeout':
+        # Keep the snapshot; the next lookup (or resolve_deferred) picks it up
+        if not pending:
+            cache.put_pending(key, source, snapshot_id, dataset_id, url, shared=shared)
+        logger.warning(f"{label} API: Snapshot {snapshot_id} still running - deferred")
+        return with_cached_fields(cached, PLACEHOLDERS['timeout'])
+    cache.drop_pending(key, source)
+    if status == 'failed':
+        return with_cached_fields(cached, PLACEHOLDERS['failed'])
+    if not records:
+        logger.warning(f"{label} API: No data found")
+        return with_cached_fields(cached, PLACEHOLDERS['no_data'])
+
+    # Cache the snapshot and parsed result for future lookups
+    result = parse(records[0])
+    cache.put_snapshot(key, source, snapshot_id)
+    cache.put_result(key, source, result)
+    logger.info(f"{label} API: Successfully got property data")
+    return result
+
+# Bright Data Scraper API Agent - Uses Bright Data's proven scrapers
+class BrightDataScraperAgent:
+    def __init__(self, api_token, cache=None, poller=None, max_wait_minutes=0.5):
+        self.api_token = api_token
+        self.base_url = BRIGHT_DATA_API_BASE
+        self.headers = {
+            'Authorization': f'Bearer {api_token}',
+            'Content-Type': 'application/json'
+        }
+        # requests is only needed by this sync agent, not by the httpx-based async one
+        import requests
+
+        # One keep-alive session so trigger/progress/snapshot calls reuse the TLS connection
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # Persistent snapshot/result cache shared across Streamlit reruns
+        self.cache = cache or get_snapshot_cache()
+        self.poller = poller or AdaptivePoller(self.cache)
+        # Interactive wait budget per snapshot; slower snapshots are deferred, not dropped
+        self.max_wait_minutes = max_wait_minutes
+    
+    def trigger_scrape(self, dataset_id, url):
+        """Trigger a new scrape request and return snapshot ID"""
+        try:
+            endpoint = f"{self.base_url}/trigger?dataset_id={dataset_id}&format=json"
+            payload = [{"url": url}]
+            
+            response = self.session.post(endpoint, json=payload, timeout=30)
+            
+            if response.status_code == 200:
+                result = response.json()
+                return result.get('snapshot_id')
+            else:
+                logger.error(f"Bright Data trigger error: {response.status_code} - {response.text}")
+                return None
+        except Exception as e:
+            logger.error(f"Bright Data trigger error: {e}")
+            return None
+    
+    def get_snapshot_data(self, snapshot_id):
+        """Retrieve data from snapshot"""
+        try:
+            endpoint = f"{self.base_url}/snapshot/{snapshot_id}?format=json"
+            response = self.session.get(endpoint, timeout=30)
+            
+            if response.status_code == 200:
+                return response.json()
+            else:
+                logger.error(f"Bright Data snapshot error: {response.status_code} - {response.text}")
+                return None
+        except Exception as e:
+            logger.error(f"Bright Data snapshot error: {e}")
+            return None
+    
+    def check_progress(self, snapshot_id):
+        """One progress check: 'ready', 'failed', 'running', or None if the check itself failed"""
+        try:
+            response = self.session.get(f"{self.base_url}/progress/{snapshot_id}", timeout=15)
+            if response.status_code != 200:
+                logger.error(f"Progress check failed: {response.status_code} - {response.text}")
+                return None
+            progress = response.json()
+            status = progress.get('status', 'running')
+            logger.info(f"Progress check: snapshot={snapshot_id}, status={status}, records={progress.get('records', 0)}")
+            return 'ready' if status in READY_STATUSES else status
+        except Exception as e:
+            logger.error(f"Progress check error: {e}")
+            return None
+
+    def _wait(self, snapshot_id, max_wait_minutes, dataset_id=None, learn=True, check_first=False):
+        """Poll on the adaptive schedule; returns 'ready', 'failed' or 'timeout'"""
+        started = time.monotonic()
+        delays = self.poller.schedule(dataset_id, max_wait_minutes * 60)
+        if check_first:
+            # Deferred snapshots have usually finished by now - look before sleeping
+            delays = itertools.chain([0], delays)
+        for delay in delays:
+            time.sleep(delay)
+            status = self.check_progress(snapshot_id)
+            if status == 'ready':
+                if learn:
+                    self.poller.record(dataset_id, time.monotonic() - started)
+                return 'ready'
+            if status == 'failed':
+                logger.error(f"Snapshot {snapshot_id} failed")
+                return 'failed'
+        if learn:
+            # Took at least this long - keeps slow runs in the learned window
+            self.poller.record(dataset_id, time.monotonic() - started, censored=True)
+        logger.warning(f"Snapshot {snapshot_id} not ready after {max_wait_minutes} minutes")
+        return 'timeout'
+
+    def wait_for_completion(self, snapshot_id, max_wait_minutes=5, dataset_id=None):
+        """Wait for snapshot to complete"""
+        logger.info(f"Waiting up to {max_wait_minutes} minutes for snapshot {snapshot_id}")
+        return self._wait(snapshot_id, max_wait_minutes, dataset_id) == 'ready'
+
+    def _extract_value(self, data, field_names):
+        """Extract value from data using multiple possible field names"""
+        for field in field_names:
+            if field in data and data[field] is not None:
+                return data[field]
+        return 'N/A'
+    
+    def _lookup(self, dataset_id, url):
+        """Trigger -> wait -> fetch for ``url``; returns (status, snapshot_id, records) like the async agent"""
+        snapshot_id = self.trigger_scrape(dataset_id, url)
+        if not snapshot_id:
+            return 'trigger_failed', None, []
+        logger.info(f"Bright Data: Got snapshot ID: {snapshot_id}")
+        status = self._wait(snapshot_id, self.max_wait_minutes, dataset_id)
+        if status != 'ready':
+            return status, snapshot_id, []
+        data = self.get_snapshot_data(snapshot_id)
+        return ('ok' if data else 'no_data'), snapshot_id, records_for_url(data, url)
+
+    def _resume(self, pending):
+        """Wait on a deferred snapshot; returns (status, snapshot_id, records) like _lookup"""
+        snapshot_id = pending['snapshot_id']
+        status = self._wait(snapshot_id, self.max_wait_minutes, pending['dataset_id'], learn=False, check_first=True)
+        if status != 'ready':
+            return status, snapshot_id, []
+        data = self.get_snapshot_data(snapshot_id)
+        return ('ok' if data else 'no_data'), snapshot_id, records_for_url(data, pending['url'], strict=pending['shared'])
+
+    def _scrape(self, label, source, dataset_id, url, parse, key):
+        """Cached result, cached snapshot, or trigger -> wait -> fetch"""
+        logger.info(f"{label} API: Starting scrape for {url}")
+        result, cached = cached_result(self.cache, label, key, source)
+        if result:
+            return result
+        cached_snapshot = self.cache.get_snapshot(key, source)
+        if cached_snapshot:
+            result = result_from_snapshot(self.cache, label, key, source, cached_snapshot,
+                                          self.get_snapshot_data(cached_snapshot), url, parse)
+            if result:
+                return result
+        try:
+            pending = self.cache.get_pending(key, source)
+            if pending:
+                # A previous lookup timed out - resolve that snapshot instead of paying for a new one
+                logger.info(f"{label} API: Resuming deferred snapshot {pending['snapshot_id']}")
+                lookup = self._resume(pending)
+            else:
+                lookup = self._lookup(dataset_id, url)
+            return finish_lookup(self.cache, label, key, source, parse, cached, pending, lookup, dataset_id, url)
+        except Exception as e:
+            logger.error(f"Bright Data {label} scraper error: {e}")
+            return with_cached_fields(cached, PLACEHOLDERS['failed'])
+
+    def scrape_zillow(self, address_dict):
+        """Use Bright Data's Zillow scraper API with smart caching"""
+        return self._scrape('Zillow', 'zillow', BRIGHT_DATA_ZILLOW_DATASET, zillow_url(address_dict),
+                            parse_zillow_record, property_key(address_dict))
+
+    def scrape_realtor(self, address_dict):
+        """Use Bright Data's Realtor.com scraper API with trigger/wait pattern"""
+        return self._scrape('Realtor', 'realtor', BRIGHT_DATA_REALTOR_DATASET, realtor_url(address_dict),
+                            parse_realtor_record, property_key(address_dict))
+
+
+# Async variant: same trigger/snapshot/progress semantics on one pooled keep-alive
+# httpx client, so dataset calls can share an event loop with the browser fetchers
+class AsyncBrightDataScraperAgent:
+    def __init__(self, api_token, client=None, max_connections=20, batch_window=None, max_batch=50,
+                 batch_max_wait_minutes=5, cache=None, poller=None, max_wait_minutes=0.5):
+        self.api_token = api_token
+        self.base_url = BRIGHT_DATA_API_BASE
+        self.headers = {
+            'Authorization': f'Bearer {api_token}',
+            'Content-Type': 'application/json'
+        }
+        self.max_connections = max_connections
+        # Created lazily so it binds to the loop the agent is first used on;
+        # pass ``client`` to share an existing httpx.AsyncClient
+        self._client = client
+        self.cache = cache or get_snapshot_cache()
+        self.poller = poller or AdaptivePoller(self.cache)
+        # Interactive wait budget per snapshot; slower snapshots are deferred, not dropped
+        self.max_wait_minutes = max_wait_minutes
+        # With a batch window, concurrent lookups per dataset share one multi-URL trigger
+        self.batchers = {}
+        if batch_window is not None:
+            for dataset_id in (BRIGHT_DATA_ZILLOW_DATASET, BRIGHT_DATA_REALTOR_DATASET):
+                self.batchers[dataset_id] = TriggerBatcher(self, dataset_id, window=batch_window, max_batch=max_batch,
+                                                           max_wait_minutes=batch_max_wait_minutes)
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(30.0, connect=10.0),
+                limits=httpx.Limits(max_connections=self.max_connections,
+                                    max_keepalive_connections=self.max_connections,
+                                    keepalive_expiry=60.0),
+            )
+        return self._client
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    async def trigger_scrape(self, dataset_id, url):
+        """Trigger a new scrape request and return snapshot ID"""
+        return await self.trigger_scrape_many(dataset_id, [url])
+
+    async def trigger_scrape_many(self, dataset_id, urls):
+        """Trigger one snapshot covering several input URLs and return its ID"""
+        try:
+            endpoint = f"{self.base_url}/trigger?dataset_id={dataset_id}&format=json"
+            response = await self.client.post(endpoint, json=[{"url": url} for url in urls], headers=self.headers)
+            if response.status_code == 200:
+                return response.json().get('snapshot_id')
+            logger.error(f"Bright Data trigger error: {response.status_code} - {response.text}")
+            return None
+        except Exception as e:
+            logger.error(f"Bright Data trigger error: {e}")
+            return None
+
+    async def get_snapshot_data(self, snapshot_id):
+        """Retrieve data from snapshot"""
+        try:
+            response = await self.client.get(f"{self.base_url}/snapshot/{snapshot_id}?format=json", headers=self.headers)
+            if response.status_code == 200:
+                return response.json()
+            logger.error(f"Bright Data snapshot error: {response.status_code} - {response.text}")
+            return None
+        except Exception as e:
+            logger.error(f"Bright Data snapshot error: {e}")
+            return None
+
+    async def check_progress(self, snapshot_id):
+        """One progress check: 'ready', 'failed', 'running', or None if the check itself failed"""
+        try:
+            response = await self.client.get(f"{self.base_url}/progress/{snapshot_id}", headers=self.headers, timeout=15)
+            if response.status_code != 200:
+                logger.error(f"Progress check failed: {response.status_code} - {response.text}")
+                return None
+            progress = response.json()
+            status = progress.get('status', 'running')
+            logger.info(f"Progress check: snapshot={snapshot_id}, status={status}, records={progress.get('records', 0)}")
+            return 'ready' if status in READY_STATUSES else status
+        except Exception as e:
+            logger.error(f"Progress check error: {e}")
+            return None
+
+    async def _wait(self, snapshot_id, max_wait_minutes, dataset_id=None, learn=True, check_first=False):
+        """Poll on the adaptive schedule; returns 'ready', 'failed' or 'timeout'"""
+        started = time.monotonic()
+        delays = self.poller.schedule(dataset_id, max_wait_minutes * 60)
+        if check_first:
+            # Deferred snapshots have usually finished by now - look before sleeping
+            delays = itertools.chain([0], delays)
+        for delay in delays:
+            await asyncio.sleep(delay)
+            status = await self.check_progress(snapshot_id)
+            if status == 'ready':
+                if learn:
+                    self.poller.record(dataset_id, time.monotonic() - started)
+                return 'ready'
+            if status == 'failed':
+                logger.error(f"Snapshot {snapshot_id} failed")
+                return 'failed'
+        if learn:
+            # Took at least this long - keeps slow runs in the learned window
+            self.poller.record(dataset_id, time.monotonic() - started, censored=True)
+        logger.warning(f"Snapshot {snapshot_id} not ready after {max_wait_minutes} minutes")
+        return 'timeout'
+
+    async def wait_for_completion(self, snapshot_id, max_wait_minutes=5, dataset_id=None):
+        """Wait for snapshot to complete without blocking the event loop"""
+        logger.info(f"Waiting up to {max_wait_minutes} minutes for snapshot {snapshot_id}")
+        return await self._wait(snapshot_id, max_wait_minutes, dataset_id) == 'ready'
+
+    async def collect_snapshot(self, dataset_id, urls, max_wait_minutes=None):
+        """Trigger -> wait -> fetch for ``urls``; returns (status, snapshot_id, data).
+
+        status is 'ok', 'trigger_failed', 'failed', 'timeout' or 'no_data'.
+        """
+        snapshot_id = await self.trigger_scrape_many(dataset_id, urls)
+        if not snapshot_id:
+            return 'trigger_failed', None, None
+        status = await self._wait(snapshot_id, max_wait_minutes or self.max_wait_minutes, dataset_id)
+        if status != 'ready':
+            return status, snapshot_id, None
+        data = await self.get_snapshot_data(snapshot_id)
+        return ('ok' if data else 'no_data'), snapshot_id, data
+
+    async def _resume(self, pending, max_wait_minutes=None):
+        """Wait on a deferred snapshot; returns (status, snapshot_id, records) like _lookup"""
+        snapshot_id = pending['snapshot_id']
+        max_wait_minutes = self.max_wait_minutes if max_wait_minutes is None else max_wait_minutes
+        status = await self._wait(snapshot_id, max_wait_minutes, pending['dataset_id'], learn=False, check_first=True)
+        if status != 'ready':
+            return status, snapshot_id, []
+        data = await self.get_snapshot_data(snapshot_id)
+        return ('ok' if data else 'no_data'), snapshot_id, records_for_url(data, pending['url'], strict=pending['shared'])
+
+    async def _lookup(self, dataset_id, url):
+        """(status, snapshot_id, records for url), through the batcher when one is set"""
+        batcher = self.batchers.get(dataset_id)
+        if batcher is not None:
+            return await batcher.fetch(url)
+        status, snapshot_id, data = await self.collect_snapshot(dataset_id, [url])
+        return status, snapshot_id, records_for_url(data, url)
+
+    async def _scrape(self, label, source, dataset_id, url, parse, key):
+        """Cached result, cached snapshot, or fresh lookup - same placeholders as the sync agent"""
+        result, cached = cached_result(self.cache, label, key, source)
+        if result:
+            return result
+        cached_snapshot = self.cache.get_snapshot(key, source)
+        if cached_snapshot:
+            result = result_from_snapshot(self.cache, label, key, source, cached_snapshot,
+                                          await self.get_snapshot_data(cached_snapshot), url, parse)
+            if result:
+                return result
+        try:
+            pending = self.cache.get_pending(key, source)
+            if pending:
+                # A previous lookup timed out - resolve that snapshot instead of paying for a new one
+                logger.info(f"{label} API: Resuming deferred snapshot {pending['snapshot_id']}")
+                lookup = await self._resume(pending)
+            else:
+                lookup = await self._lookup(dataset_id, url)
+            return finish_lookup(self.cache, label, key, source, parse, cached, pending, lookup, dataset_id, url,
+                                 shared=dataset_id in self.batchers)
+        except Exception as e:
+            logger.error(f"Bright Data {label} scraper error: {e}")
+            return with_cached_fields(cached, PLACEHOLDERS['failed'])
+
+    async def scrape_zillow(self, address_dict):
+        """Use Bright Data's Zillow scraper API with smart caching"""
+        return await self._scrape('Zillow', 'zillow', BRIGHT_DATA_ZILLOW_DATASET, zillow_url(address_dict),
+                                  parse_zillow_record, property_key(address_dict))
+
+    async def scrape_realtor(self, address_dict):
+        """Use Bright Data's Realtor.com scraper API with trigger/wait pattern"""
+        return await self._scrape('Realtor', 'realtor', BRIGHT_DATA_REALTOR_DATASET, realtor_url(address_dict),
+                                  parse_realtor_record, property_key(address_dict))
+
+    async def resolve_deferred(self):
+        """Check every deferred snapshot once and cache the ones that have finished.
+
+        Returns the number resolved; still-running snapshots stay pending.
+        """
+        parsers = {'zillow': parse_zillow_record, 'realtor': parse_realtor_record}
+
+        async def resolve(item):
+            status, snapshot_id, records = await self._resume(item, max_wait_minutes=0)
+            if status == 'timeout':
+                return False
+            self.cache.drop_pending(item['key'], item['source'])
+            if not records or item['source'] not in parsers:
+                return False
+            self.cache.put_snapshot(item['key'], item['source'], snapshot_id)
+            self.cache.put_result(item['key'], item['source'], parsers[item['source']](records[0]))
+            return True
+
+        results = await asyncio.gather(*(resolve(item) for item in self.cache.pending_items()))
+        return sum(results)
+
+
+class TriggerBatcher:
+    """Coalesces concurrent lookups for one dataset into multi-URL triggers.
+
+    Lookups arriving within ``window`` seconds (or until ``max_batch`` URLs are
+    pending) go out as one trigger; the single snapshot is polled once and its
+    records are handed back to each caller by input URL.
+    """
+
+    def __init__(self, agent, dataset_id, window=1.0, max_batch=50, max_wait_minutes=5):
+        self.agent = agent
+        self.dataset_id = dataset_id
+        self.window = window
+        self.max_batch = max_batch
+        self.max_wait_minutes = max_wait_minutes
+        self._pending = []
+        self._timer = None
+        self._tasks = set()
+        self.stats = {'lookups': 0, 'triggers': 0, 'urls': 0}
+
+    async def fetch(self, url):
+        """Wait for the batch containing ``url``; returns (status, snapshot_id, records)"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((url, future))
+        self.stats['lookups'] += 1
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch):
+        urls = list(dict.fromkeys(url for url, _ in batch))
+        self.stats['triggers'] += 1
+        self.stats['urls'] += len(urls)
+        logger.info(f"Bright Data batch: triggering {len(urls)} URLs on {self.dataset_id}")
+        try:
+            status, snapshot_id, data = await self.agent.collect_snapshot(self.dataset_id, urls, self.max_wait_minutes)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for url, future in batch:
+            if not future.done():
+                future.set_result((status, snapshot_id, records_for_url(data, url, strict=len(urls) > 1)))
+
+
+_async_agents = {}
+
+
+def get_async_scraper(api_token):
+    """Shared async agent per token, so its connection pool survives Streamlit reruns.
+
+    The agent's client binds to the first loop it is used on - only use it from
+    the browser pool loop (e.g. inside ``run_in_browser_pool``).
+    """
+    if api_token not in _async_agents:
+        _async_agents[api_token] = AsyncBrightDataScraperAgent(api_token)
+    return _async_agents[api_token]
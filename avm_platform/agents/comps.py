@@ -0,0 +1,51 @@
+import asyncio
+import logging
+import random
+
+from avm_platform.agents.fetchers import get_fetch_pool
+from avm_platform.scraping.dom_extract import extract_records
+
+logger = logging.getLogger(__name__)
+
+class CompsGrabberAgent:
+    def __init__(self, proxy, cert_path=None, ignore_https_errors=False):
+        self.proxy = proxy
+        self.cert_path = cert_path
+        self.ignore_https_errors = ignore_https_errors
+
+    async def fetch_redfin_comps(self, page, address_dict):
+        """Fetch comparable properties from Redfin"""
+        try:
+            city = address_dict['city'].replace(' ', '-').lower()
+            state = address_dict['state'].upper()
+            street = address_dict['street'].replace(' ', '+')
+            
+            # Use Redfin's sold properties search
+            search_url = f"https://www.redfin.com/city/262/{state}/{city}/filter/address={street},sold-2y"
+            await self._retry_operation(page.goto, search_url, wait_until='domcontentloaded', timeout=90000)
+            await asyncio.sleep(random.uniform(3, 7))
+            
+            # Get sold comps from the page in a single evaluate
+            comps = await extract_records(page, 'redfin_comps')
+            
+            return comps
+        except Exception as e:
+            logger.error(f"Redfin comps fetch error: {e}")
+            return []
+
+    async def get_comps(self, address_dict):
+        """Get comparable properties using browser automation"""
+        try:
+            pool = get_fetch_pool(self.proxy, self.cert_path, self.ignore_https_errors)
+            async with pool.lease() as context:
+                page = await context.new_page()
+                comps = await self.fetch_redfin_comps(page, address_dict)
+                return comps
+        except Exception as e:
+            logger.error(f"CompsGrabber error: {e}")
+            return []
+
+def get_comps(address):
+    # Placeholder for legacy compatibility
+    logger.info(f"Comps API call placeholder for {address}")
+    return {}
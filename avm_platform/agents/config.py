@@ -0,0 +1,102 @@
+"""
+Shared configuration for the valuation agents: .env loading, Bright Data
+credentials/datasets, browser settings and the default analysis assumptions.
+"""
+
+import os
+
+# Load environment variables from .env file
+from pathlib import Path
+env_path = Path('.') / '.env'
+if env_path.exists():
+    with open(env_path) as f:
+        for line in f:
+            if line.strip() and not line.startswith('#') and '=' in line:
+                key, value = line.strip().split('=', 1)
+                os.environ[key] = value
+
+# Bright Data Configuration
+proxy_server = os.getenv("BRIGHT_DATA_HOST", "brd.superproxy.io:33335")
+BRIGHT_DATA_API_TOKEN = os.getenv("BRIGHT_DATA_API_TOKEN", "")
+
+# Bright Data Scraper API Endpoints - USA Properties Only
+BRIGHT_DATA_ZILLOW_DATASET = "gd_lfqkr8wm13ixtbd8f5"  # Zillow USA dataset ID
+BRIGHT_DATA_REALTOR_DATASET = "gd_m517agnc1jppzwgtmw"  # Realtor dataset ID (has USA properties)
+BRIGHT_DATA_ZILLOW_PRICE_HISTORY = "gd_lxu1cz9r88uiqsosl"  # Zillow price history dataset
+BRIGHT_DATA_API_BASE = "https://api.brightdata.com/datasets/v3"
+proxy_username = os.getenv("BRIGHT_DATA_USERNAME", "brd-customer-hl_dd2a0351-zone-residential_proxy_us1")
+proxy_password = os.getenv("BRIGHT_DATA_PASSWORD", "")
+
+# Bright Data proxy customization options
+def get_proxy_username(country=None, state=None, asn=None, ip=None):
+    """Generate customized Bright Data proxy username based on requirements"""
+    base_username = proxy_username
+    
+    if country:
+        base_username += f"-country-{country}"
+    if state:
+        base_username += f"-state-{state}"
+    if asn:
+        base_username += f"-asn-{asn}"
+    if ip:
+        base_username += f"-ip-{ip}"
+    
+    return base_username
+
+# Random User-Agents
+user_agents = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.101 Safari/537.36"
+]
+
+# Warm browser pool sizing (shared by SiteFetcherAgent and CompsGrabberAgent)
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "2"))
+BROWSER_POOL_MAX_NAVIGATIONS = int(os.getenv("BROWSER_POOL_MAX_NAVIGATIONS", "50"))
+
+# Cross-site consensus in AggregatorAgent: estimator (mean, median, trimmed_mean, weighted_mean)
+# and whether values far from the other sites' median are dropped first
+AGGREGATION_ESTIMATOR = os.getenv("AGGREGATION_ESTIMATOR", "median")
+AGGREGATION_REJECT_OUTLIERS = os.getenv("AGGREGATION_REJECT_OUTLIERS", "true").lower() == "true"
+
+# Streamlit app: how long (seconds) an address's fetched and aggregated site data is reused, and how many are kept
+RESULT_CACHE_TTL = int(os.getenv("RESULT_CACHE_TTL", "3600"))
+RESULT_CACHE_MAX_ENTRIES = int(os.getenv("RESULT_CACHE_MAX_ENTRIES", "256"))
+
+# Underwriting defaults used by AnalyzerAgent (Streamlit app and batch runs)
+DEFAULT_ANALYSIS_SETTINGS = {
+    'desired_profit': 20000,
+    'desired_roi': 20,
+    'acquisition': 1.5,
+    'brokerage': 3,
+    'sales_closing': 1.5,
+    'taxes': 1.2,
+    'insurance': 0.5,
+    'vacancy': 5,
+    'maintenance': 10,
+    'management': 8,
+    'bad_debt': 2,
+    'leasing_fee': 500,
+    'turnover': 1000,
+    'utilities': 100,
+    'cdd': 0,
+    'other_fee': 0,
+    'ltv': 80,
+    'interest': 5.5,
+    'amortization': 30,
+    'arm_length': 5,
+    'adjustable_rate': 1,
+    'hold_days_base': 60
+}
+
+# Default deal inputs when none are supplied
+DEFAULT_USER_INPUTS = {'purchase': 100000.0, 'reno': 20000.0, 'hold_months': 12}
+
+
+def build_proxy(username=None):
+    """Playwright proxy settings for the Bright Data residential zone"""
+    return {
+        "server": f"http://{proxy_server}",
+        "username": username or proxy_username,
+        "password": proxy_password
+    }
@@ -0,0 +1,407 @@
+import asyncio
+import logging
+import os
+import random
+
+import streamlit as st
+
+from avm_platform.agents.config import BROWSER_POOL_MAX_NAVIGATIONS, BROWSER_POOL_SIZE, user_agents
+from avm_platform.agents.values import with_typed
+from avm_platform.scraping.browser_pool import BrowserPool, get_browser_pool
+from avm_platform.scraping.dom_extract import extract_fields
+from avm_platform.scraping.readiness import ReadinessWaiter
+from avm_platform.scraping.routing import RequestRouter
+
+logger = logging.getLogger(__name__)
+
+# Enhanced stealth scripts to avoid detection
+STEALTH_INIT_SCRIPT = """
+    // Remove webdriver property
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined,
+    });
+
+    // Override the plugins property to use a custom getter
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5],
+    });
+
+    // Override the languages property to use a custom getter
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['en-US', 'en'],
+    });
+
+    // Mock chrome runtime
+    if (!window.chrome) {
+        window.chrome = { runtime: {} };
+    }
+
+    // Override permissions
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+        Promise.resolve({ state: Notification.permission }) :
+        originalQuery(parameters)
+    );
+
+    // Hide automation indicators
+    delete window.navigator.__proto__.webdriver;
+"""
+
+def get_fetch_pool(proxy, cert_path=None, ignore_https_errors=False, size=None):
+    """Return the shared warm browser pool for this proxy/SSL configuration (resized to ``size`` when given)"""
+    # Configure SSL certificate handling (must happen before Playwright starts)
+    ssl_configured = False
+    if cert_path and os.path.exists(cert_path):
+        # Try NODE_EXTRA_CA_CERTS for Node.js/Playwright
+        os.environ['NODE_EXTRA_CA_CERTS'] = cert_path
+        ssl_configured = True
+
+    def build_pool():
+        # Enhanced anti-bot detection arguments
+        browser_args = [
+            '--disable-http2',
+            '--no-sandbox',
+            '--disable-setuid-sandbox',
+            '--disable-dev-shm-usage',
+            '--disable-extensions',
+            '--disable-gpu',
+            '--disable-background-timer-throttling',
+            '--disable-backgrounding-occluded-windows',
+            '--disable-renderer-backgrounding',
+            '--disable-features=TranslateUI,VizDisplayCompositor',
+            '--disable-ipc-flooding-protection',
+            '--window-size=1920,1080',
+            '--start-maximized',
+            '--disable-blink-features=AutomationControlled',
+            '--disable-automation',
+            '--disable-web-security',
+            '--allow-running-insecure-content'
+        ]
+
+        if ssl_configured and not ignore_https_errors:
+            # With SSL certificate configured, rely on system trust
+            logger.info("Using SSL certificate - relying on macOS Keychain trust")
+        elif ignore_https_errors:
+            # Fallback to ignore SSL errors
+            browser_args.extend([
+                '--ignore-certificate-errors',
+                '--ignore-ssl-errors',
+                '--allow-running-insecure-content'
+            ])
+            logger.info("Using ignore SSL errors mode")
+
+        def context_options():
+            # Enhanced context options to mimic real browser (user agent rotated per pooled context)
+            return {
+                'user_agent': random.choice(user_agents),
+                'ignore_https_errors': ignore_https_errors and not ssl_configured,
+                'viewport': {'width': 1920, 'height': 1080},
+                'locale': 'en-US',
+                'timezone_id': 'America/New_York',
+                'permissions': ['geolocation'],
+                'geolocation': {'latitude': 41.0814, 'longitude': -81.5190},  # Akron, OH coordinates
+                'extra_http_headers': {
+                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
+                    'Accept-Language': 'en-US,en;q=0.9',
+                    'Accept-Encoding': 'gzip, deflate, br',
+                    'DNT': '1',
+                    'Connection': 'keep-alive',
+                    'Upgrade-Insecure-Requests': '1',
+                }
+            }
+
+        # Use Chromium for now (simplify to avoid timeout issues)
+        return BrowserPool(
+            launch_options={'proxy': proxy, 'args': browser_args},
+            context_options=context_options,
+            init_script=STEALTH_INIT_SCRIPT,
+            size=size or BROWSER_POOL_SIZE,
+            max_navigations=BROWSER_POOL_MAX_NAVIGATIONS,
+            # Skip images/fonts/media/trackers - we only read DOM text and img src attributes
+            router=RequestRouter(),
+        )
+
+    key = (proxy.get('server'), proxy.get('username'), cert_path if ssl_configured else None, ignore_https_errors)
+    return get_browser_pool(key, build_pool, size)
+
+class SiteFetcherAgent:
+    def __init__(self, proxy, cert_path=None, ignore_https_errors=False, polite_jitter=True, site_limits=None):
+        self.proxy = proxy
+        self.cert_path = cert_path
+        self.ignore_https_errors = ignore_https_errors
+        # Small random floor on readiness waits so we don't hammer sites at machine speed
+        self.polite_jitter = polite_jitter
+        # Optional {site: asyncio.Semaphore} capping concurrent fetches per site (batch runs)
+        self.site_limits = site_limits or {}
+
+    async def _limited(self, site, coro):
+        """Run a site fetch under that site's concurrency limit, if one is set"""
+        limit = self.site_limits.get(site)
+        if limit is None:
+            return await coro
+        async with limit:
+            return await coro
+
+    async def _retry_operation(self, func, *args, **kwargs):
+        """Retry operation with exponential backoff"""
+        retries = 3
+        backoff = 2.0
+        for attempt in range(retries):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"Attempt {attempt + 1} failed: {e}")
+                if attempt == retries - 1:
+                    raise
+                await asyncio.sleep(backoff ** attempt)
+        return None
+
+    async def fetch_zillow(self, page, address_dict):
+        street = address_dict['street'].replace(' ', '-')
+        city = address_dict['city'].replace(' ', '-')
+        state = address_dict['state']
+        zipcode = address_dict['zip']
+        # Use HTTPS and proven URL format for Zillow
+        url = f"https://www.zillow.com/homes/{street}-{city}-{state}-{zipcode}_rb/"
+        waiter = ReadinessWaiter('zillow', jitter=self.polite_jitter)
+        try:
+            await self._retry_operation(page.goto, url, wait_until='domcontentloaded', timeout=90000)
+            await waiter.wait(page, 'detail')
+            
+            # Simulate human scrolling
+            await page.evaluate('window.scrollTo(0, document.body.scrollHeight/4);')
+            await waiter.settle(page)
+            # Read every field and the gallery images in a single evaluate round trip
+            fields = await extract_fields(page, 'zillow')
+            return {**fields, 'meta': waiter.metadata()}
+        except Exception as e:
+            logger.error(f"Zillow fetch error: {e}")
+            st.warning("Partial or no data from Zillow")
+            return {'value': 'Failed', 'rent': 'Failed'}
+
+    async def fetch_redfin(self, page, address_dict):
+        waiter = ReadinessWaiter('redfin', jitter=self.polite_jitter)
+        try:
+            # Use search approach - more reliable than guessing property IDs
+            city = address_dict['city'].replace(' ', '-').lower()
+            state = address_dict['state'].upper()
+            street = address_dict['street'].replace(' ', '+')
+            
+            search_url = f"https://www.redfin.com/city/262/{state}/{city}/filter/address={street}"
+            await self._retry_operation(page.goto, search_url, wait_until='domcontentloaded', timeout=90000)
+            await waiter.wait(page, 'search')
+            
+            # Simulate human scrolling
+            await page.evaluate('window.scrollTo(0, document.body.scrollHeight/4);')
+            await waiter.settle(page)
+            
+            # Get first property link using evaluate for reliability
+            detail_url = await page.evaluate('''
+                () => {
+                    const link = document.querySelector('[data-rf-test-id="listing-link"] a, a[href*="/home/"], .listing-result a');
+                    return link ? link.href : null;
+                }
+            ''')
+            if detail_url and not detail_url.startswith('http'):
+                detail_url = f"https://www.redfin.com{detail_url}"
+            elif not detail_url:
+                return {'value': 'No property found', 'rent': 'Failed', 'meta': waiter.metadata()}
+                
+            await self._retry_operation(page.goto, detail_url, wait_until='domcontentloaded', timeout=90000)
+            await waiter.wait(page, 'detail')
+            
+            # Simulate human scrolling on property page
+            await page.evaluate('window.scrollTo(0, document.body.scrollHeight/3);')
+            await waiter.settle(page)
+            await page.evaluate('window.scrollTo(0, document.body.scrollHeight/2);')
+            await waiter.settle(page)
+            
+            # Get property data (fields + images) in a single evaluate round trip
+            fields = await extract_fields(page, 'redfin')
+            return {**fields, 'meta': waiter.metadata()}
+            
+        except Exception as e:
+            logger.error(f"Redfin fetch error: {e}")
+            st.warning("Partial or no data from Redfin")
+            return {'value': 'Failed', 'rent': 'Failed'}
+
+    async def fetch_homes(self, page, address_dict):
+        waiter = ReadinessWaiter('homes', jitter=self.polite_jitter)
+        try:
+            # Use search approach for Homes.com
+            street = address_dict['street'].replace(' ', '%20')
+            city = address_dict['city'].replace(' ', '%20')
+            state = address_dict['state']
+            zipcode = address_dict['zip']
+            
+            search_url = f"https://www.homes.com/search/?q={street}%2C%20{city}%2C%20{state}%20{zipcode}"
+            await self._retry_operation(page.goto, search_url, wait_until='domcontentloaded', timeout=90000)
+            await waiter.wait(page, 'search')
+            
+            # Simulate human scrolling
+            await page.evaluate('window.scrollTo(0, document.body.scrollHeight/4);')
+            await waiter.settle(page)
+            
+            # Get first property link using evaluate for reliability
+            detail_url = await page.evaluate('''
+                () => {
+                    const link = document.querySelector('a[href*="/property/"], .property-card a, .listing-card a');
+                    return link ? link.href : null;
+                }
+            ''')
+            
+            if detail_url and not detail_url.startswith('http'):
+                detail_url = f"https://www.homes.com{detail_url}"
+            elif not detail_url:
+                return {'value': 'No property found', 'rent': 'Failed', 'meta': waiter.metadata()}
+                
+            await self._retry_operation(page.goto, detail_url, wait_until='domcontentloaded', timeout=90000)
+            await waiter.wait(page, 'detail')
+            
+            # Simulate human scrolling on property page
+            await page.evaluate('window.scrollTo(0, document.body.scrollHeight/3);')
+            await waiter.settle(page)
+            await page.evaluate('window.scrollTo(0, document.body.scrollHeight/2);')
+            await waiter.settle(page)
+            
+            # Get property data (fields + images) in a single evaluate round trip
+            fields = await extract_fields(page, 'homes')
+            return {**fields, 'meta': waiter.metadata()}
+            
+        except Exception as e:
+            logger.error(f"Homes fetch error: {e}")
+            st.warning("Partial or no data from Homes.com")
+            return {'value': 'Failed', 'rent': 'Failed'}
+
+    async def fetch_realtor(self, page, address_dict):
+        """Fetch data from Realtor using direct URL pattern (similar to Zillow _rb approach)"""
+        waiter = ReadinessWaiter('realtor', jitter=self.polite_jitter)
+        try:
+            street = address_dict['street'].replace(' ', '-')
+            city = address_dict['city'].replace(' ', '-')
+            state = address_dict['state']
+            zipcode = address_dict['zip']
+            
+            # Try direct property URL first (like Zillow _rb pattern)  
+            # Format: /realestateandhomes-detail/[ADDRESS]_[CITY]_[STATE]_[ZIP]
+            direct_url = f"https://www.realtor.com/realestateandhomes-detail/{street}_{city}_{state}_{zipcode}"
+            
+            try:
+                logger.info(f"Trying Realtor direct URL: {direct_url}")
+                await self._retry_operation(page.goto, direct_url, wait_until='domcontentloaded', timeout=60000)
+                await waiter.wait(page, 'direct')
+                
+                # Check if we got a valid property page - all fields come back in one evaluate
+                fields = await extract_fields(page, 'realtor')
+                value = fields.get('value')
+                if value and value not in ['N/A', '']:
+                    logger.info(f"Realtor direct URL success!")
+                    return {**fields, 'meta': waiter.metadata()}
+            except Exception as direct_error:
+                logger.warning(f"Realtor direct URL failed, trying search fallback: {direct_error}")
+            
+            # Fallback: Use search approach if direct URL doesn't work
+            search_url = f"https://www.realtor.com/realestateandhomes-search/{city}_{state}/type-single-family-home?address={street.replace('-', '+')}+{zipcode}"
+            logger.info(f"Trying Realtor search: {search_url}")
+            await self._retry_operation(page.goto, search_url, wait_until='domcontentloaded', timeout=90000)
+            await waiter.wait(page, 'search')
+            
+            # Look for first property link
+            detail_url = await page.evaluate('''
+                () => {
+                    const link = document.querySelector('a[href*="/realestateandhomes-detail/"]');
+                    return link ? link.href : null;
+                }
+            ''')
+            
+            if not detail_url:
+                return {'value': 'No property found', 'rent': 'N/A', 'meta': waiter.metadata()}
+            
+            await self._retry_operation(page.goto, detail_url, wait_until='domcontentloaded', timeout=90000)
+            await waiter.wait(page, 'detail')
+            
+            # Get all property data with multiple selector fallbacks in one evaluate
+            fields = await extract_fields(page, 'realtor')
+            
+            logger.info(f"Realtor search fallback success!")
+            return {**fields, 'meta': waiter.metadata()}
+        except Exception as e:
+            logger.error(f"Realtor fetch error: {e}")
+            return {'value': 'Failed', 'rent': 'Failed'}
+
+    async def fetch_movoto(self, page, address_dict):
+        """Fetch data from Movoto"""
+        waiter = ReadinessWaiter('movoto', jitter=self.polite_jitter)
+        try:
+            street = address_dict['street'].replace(' ', '-').lower()
+            city = address_dict['city'].replace(' ', '-').lower()
+            state = address_dict['state'].lower()
+            zipcode = address_dict['zip']
+            
+            # Movoto URL pattern: https://www.movoto.com/state/city/street-zipcode/
+            movoto_url = f"https://www.movoto.com/{state}/{city}/{street}-{zipcode}/"
+            await self._retry_operation(page.goto, movoto_url, wait_until='domcontentloaded', timeout=90000)
+            await waiter.wait(page, 'detail')
+            
+            await page.evaluate('window.scrollTo(0, document.body.scrollHeight/4);')
+            await waiter.settle(page)
+            
+            # Get property data (fields + images) in a single evaluate round trip
+            fields = await extract_fields(page, 'movoto')
+            return {**fields, 'meta': waiter.metadata()}
+        except Exception as e:
+            logger.error(f"Movoto fetch error: {e}")
+            st.warning("Partial or no data from Movoto")
+            return {'value': 'Failed', 'rent': 'Failed'}
+
+    async def fetch_all(self, address_dict):
+        # Validate proxy credentials
+        if not self.proxy.get('username') or not self.proxy.get('password'):
+            logger.error("Proxy credentials not found. Please set BRIGHT_DATA_USERNAME and BRIGHT_DATA_PASSWORD environment variables.")
+            st.error("Proxy credentials missing. Please check your .env file.")
+            return {'zillow': {'value': 'Failed', 'rent': 'Failed'},
+                    'redfin': {'value': 'Failed', 'rent': 'Failed'},
+                    'homes': {'value': 'Failed', 'rent': 'Failed'},
+                    'realtor': {'value': 'Failed', 'rent': 'Failed'}}
+        
+        try:
+            pool = get_fetch_pool(self.proxy, self.cert_path, self.ignore_https_errors)
+            # Borrow a warm context from the shared pool instead of launching a browser per lookup
+            async with pool.lease() as context:
+                page1 = await context.new_page()
+                page2 = await context.new_page()
+                page3 = await context.new_page()
+                page4 = await context.new_page()
+                page5 = await context.new_page()
+                tasks = [
+                    self._limited('zillow', self.fetch_zillow(page1, address_dict)),
+                    self._limited('redfin', self.fetch_redfin(page2, address_dict)),
+                    self._limited('homes', self.fetch_homes(page3, address_dict)),
+                    self._limited('realtor', self.fetch_realtor(page4, address_dict)),
+                    self._limited('movoto', self.fetch_movoto(page5, address_dict))
+                ]
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+                if pool.router is not None:
+                    # Attach per-site blocked-request / bytes-saved counters
+                    for page, result in zip([page1, page2, page3, page4, page5], results):
+                        if isinstance(result, dict):
+                            result.setdefault('meta', {})['routing'] = pool.router.page_stats(page)
+        except Exception as e:
+            logger.error(f"Browser initialization error: {e}")
+            st.error(f"Failed to initialize browser: {str(e)}")
+            return {'zillow': {'value': 'Failed', 'rent': 'Failed'},
+                    'redfin': {'value': 'Failed', 'rent': 'Failed'},
+                    'homes': {'value': 'Failed', 'rent': 'Failed'},
+                    'realtor': {'value': 'Failed', 'rent': 'Failed'},
+                    'movoto': {'value': 'Failed', 'rent': 'Failed'}}
+        
+        data = {'zillow': results[0] if not isinstance(results[0], Exception) else {'value': 'Failed', 'rent': 'Failed'},
+                'redfin': results[1] if not isinstance(results[1], Exception) else {'value': 'Failed', 'rent': 'Failed'},
+                'homes': results[2] if not isinstance(results[2], Exception) else {'value': 'Failed', 'rent': 'Failed'},
+                'realtor': results[3] if not isinstance(results[3], Exception) else {'value': 'Failed', 'rent': 'Failed'},
+                'movoto': results[4] if not isinstance(results[4], Exception) else {'value': 'Failed', 'rent': 'Failed'}}
+        # Parse the display strings into typed numbers once, here, for the aggregator
+        for result in data.values():
+            with_typed(result)
+        return data
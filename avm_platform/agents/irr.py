@@ -0,0 +1,110 @@
+"""
+Batched IRR over a matrix of cash-flow rows.
+
+numpy_financial.irr finds the roots of a polynomial per call, which is slow for
+thousands of scenarios and properties. irr_batch solves every row at once:
+vectorized Newton steps from 0% for conventional rows (one sign change, so a
+single root), and for the rest - several sign changes, or Newton did not
+settle - a scan for sign changes of the NPV and bisection inside the bracket
+closest to 0%, the root numpy_financial would pick.
+"""
+
+import numpy as np
+
+# Rates must stay above -100% for the discount factors to exist
+MIN_RATE = -0.999999
+
+# Rates scanned for a bracket when Newton fails (per period)
+BRACKET_RATES = np.concatenate([-np.geomspace(0.999, 1e-4, 40), [0.0], np.geomspace(1e-4, 100, 60)])
+
+
+def _npv(rates, cashflows, periods):
+    """NPV of each row at its rate, and its derivative with respect to the rate"""
+    discount = (1 + rates)[:, None] ** -periods
+    npv = (cashflows * discount).sum(axis=1)
+    slope = -(periods * cashflows * discount).sum(axis=1) / (1 + rates)
+    return npv, slope
+
+
+def _sign_changes(cashflows):
+    """Number of sign changes along each row, skipping zeros"""
+    signs = np.sign(cashflows)
+    columns = np.arange(cashflows.shape[1])
+    last = np.maximum.accumulate(np.where(signs != 0, columns, 0), axis=1)
+    carried = np.take_along_axis(signs, last, axis=1)
+    return (carried[:, 1:] * carried[:, :-1] < 0).sum(axis=1)
+
+
+def _bisect(cashflows, periods, low, high, iterations=100):
+    npv_low, _ = _npv(low, cashflows, periods)
+    for _ in range(iterations):
+        mid = (low + high) / 2
+        npv_mid, _ = _npv(mid, cashflows, periods)
+        left = np.sign(npv_mid) == np.sign(npv_low)
+        low = np.where(left, mid, low)
+        npv_low = np.where(left, npv_mid, npv_low)
+        high = np.where(left, high, mid)
+    return (low + high) / 2
+
+
+def _bracket(cashflows, periods):
+    """(low, high, found) per row: the sign-change bracket of BRACKET_RATES nearest 0%"""
+    npv = np.stack([_npv(np.full(len(cashflows), rate), cashflows, periods)[0] for rate in BRACKET_RATES], axis=1)
+    changes = np.sign(npv[:, :-1]) * np.sign(npv[:, 1:]) <= 0
+    distance = np.where(changes, np.abs(BRACKET_RATES[:-1] + BRACKET_RATES[1:]), np.inf)
+    best = distance.argmin(axis=1)
+    found = np.isfinite(distance[np.arange(len(cashflows)), best])
+    return BRACKET_RATES[best], BRACKET_RATES[best + 1], found
+
+
+def irr_batch(cashflows, guess=0.0, tol=1e-10, max_iter=50):
+    """IRR per period of every row of a 2-D array of cash flows (shorter rows padded with 0).
+
+    Rows without both an inflow and an outflow, or without a root above -100%,
+    come back as NaN, as numpy_financial.irr returns them.
+    """
+    cashflows = np.atleast_2d(np.asarray(cashflows, dtype=float))
+    cashflows = np.nan_to_num(cashflows, nan=0.0)
+    periods = np.arange(cashflows.shape[1], dtype=float)
+    rates = np.full(len(cashflows), np.nan)
+    solvable = (cashflows > 0).any(axis=1) & (cashflows < 0).any(axis=1)
+
+    rate = np.full(int(solvable.sum()), float(guess))
+    rows = cashflows[solvable]
+    # Newton on the rows still moving; rows with several sign changes skip straight to the bracket
+    ambiguous = _sign_changes(rows) > 1
+    done = ambiguous.copy()
+    with np.errstate(over='ignore', divide='ignore', invalid='ignore'):
+        for _ in range(max_iter):
+            active = ~done
+            if not active.any():
+                break
+            npv, slope = _npv(rate[active], rows[active], periods)
+            step = npv / slope
+            updated = np.maximum(rate[active] - step, MIN_RATE)
+            settled = np.abs(step) <= tol * np.maximum(1, np.abs(updated))
+            rate[active] = updated
+            done[np.flatnonzero(active)[settled]] = True
+
+        # Several roots possible, or no convergence (flat slope, overflow, runaway): bracket instead
+        npv, _ = _npv(rate, rows, periods)
+        failed = ~done | ~np.isfinite(rate) | ~np.isfinite(npv) | (rate <= MIN_RATE) | ambiguous
+        if failed.any():
+            low, high, found = _bracket(rows[failed], periods)
+            fallback = np.full(int(failed.sum()), np.nan)
+            if found.any():
+                fallback[found] = _bisect(rows[failed][found], periods, low[found], high[found])
+            rate[failed] = fallback
+    rates[solvable] = rate
+    return rates
+
+
+def level_cashflows(initial, payment, periods, terminal):
+    """Cash-flow matrix for [initial] + [payment] * periods + [terminal] rows of (possibly) different lengths"""
+    initial, payment, periods, terminal = (np.ravel(a) for a in np.broadcast_arrays(
+        initial, payment, np.trunc(periods).astype(int), terminal))
+    columns = np.arange(int(periods.max(initial=0)) + 2)
+    cashflows = np.where((columns >= 1) & (columns <= periods[:, None]), payment[:, None], 0.0)
+    cashflows[:, 0] = initial
+    cashflows[np.arange(len(periods)), periods + 1] = terminal
+    return cashflows
@@ -0,0 +1,37 @@
+import re
+
+
+class NormalizerAgent:
+    def normalize(self, address):
+        # Enhanced regex pattern for better address parsing
+        # Handles formats like "1841 Marks Ave, Akron, OH 44305"
+        pattern = r'(\d+\s+[\w\s.]+?),\s*([\w\s]+?),\s*([A-Z]{2})\s*(\d{5}(?:-\d{4})?)?'
+        match = re.match(pattern, address.strip(), re.I)
+        if match:
+            street, city, state, zipcode = match.groups()
+            return {
+                'street': street.strip(),
+                'city': city.strip(),
+                'state': state.upper(),
+                'zip': zipcode.strip() if zipcode else None
+            }
+        
+        # Fallback pattern for addresses without ZIP
+        pattern2 = r'(\d+\s+[\w\s.]+?),\s*([\w\s]+?),\s*([A-Z]{2})'
+        match2 = re.match(pattern2, address.strip(), re.I)
+        if match2:
+            street, city, state = match2.groups()
+            return {
+                'street': street.strip(),
+                'city': city.strip(),
+                'state': state.upper(),
+                'zip': None
+            }
+        return None
+
+
+def property_key(address_dict):
+    """Stable key for a normalized address, e.g. '1841-marks-ave-akron-oh-44305'"""
+    street = address_dict['street'].replace(' ', '-')
+    city = address_dict['city'].replace(' ', '-')
+    return f"{street}-{city}-{address_dict['state']}-{address_dict['zip']}".lower()
@@ -0,0 +1,16 @@
+import streamlit as st
+
+
+class CRMNotifierAgent:
+    def notify(self, metrics, threshold):
+        if metrics['roi'] > threshold:
+            st.write("Alert: Property meets requirements! Review now.")
+            # Placeholder for email/SMS (add smtplib/Twilio with keys)
+
+    def notify_portfolio(self, portfolio):
+        """One alert for every flagged row of an analyze_portfolio() table"""
+        alerts = portfolio[portfolio['alert']]
+        if len(alerts):
+            st.write(f"Alert: {len(alerts)} of {len(portfolio)} properties meet requirements! Review now.")
+            columns = [c for c in ('rank', 'address', 'purchase', 'roi', 'irr', 'cap_rate') if c in alerts]
+            st.dataframe(alerts[columns])
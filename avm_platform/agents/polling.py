@@ -0,0 +1,87 @@
+"""
+Adaptive progress polling for Bright Data snapshots.
+
+Instead of checking every 5 seconds, the first checks come quickly and back
+off exponentially. Once a dataset has enough recorded completion times (kept
+in the snapshot cache), the poller sleeps straight to that dataset's 10th
+percentile, polls densely until its 90th, then backs off again.
+
+Snapshots that time out are recorded too, as censored observations: all that
+is known is that they took longer than the wait. The percentiles are
+Kaplan-Meier estimates, so slow datasets are not learned as fast ones just
+because their slow runs never finished inside the window.
+"""
+
+import time
+
+
+def survival_quantiles(observations, qs):
+    """Kaplan-Meier quantiles of (seconds, censored) observations; censored ones are lower bounds.
+
+    Without censoring this picks sorted_times[int(q * n)]. A quantile the
+    finished snapshots never reach is the longest observation.
+    """
+    # Finished before censored at equal times: a censored run was still at risk then
+    ordered = sorted(observations, key=lambda observation: (observation[0], observation[1]))
+    at_risk, survival, found = len(ordered), 1.0, {}
+    for seconds, censored in ordered:
+        if not censored:
+            survival *= (at_risk - 1) / at_risk
+            for q in qs:
+                if q not in found and 1 - survival > q + 1e-9:
+                    found[q] = seconds
+        at_risk -= 1
+    return tuple(found.get(q, ordered[-1][0]) for q in qs)
+
+
+class AdaptivePoller:
+    """Poll schedule for snapshot progress, learning completion times per dataset"""
+
+    def __init__(self, cache=None, initial=0.5, factor=1.6, max_interval=10.0, min_samples=5, history=200,
+                 clock=time.monotonic):
+        self.cache = cache
+        self.initial = initial
+        self.factor = factor
+        self.max_interval = max_interval
+        self.min_samples = min_samples
+        self.history = history
+        self.clock = clock
+
+    def quantiles(self, dataset_id):
+        """(p10, p50, p90) of completion seconds, or None until min_samples snapshots have finished"""
+        if self.cache is None or dataset_id is None:
+            return None
+        observations = self.cache.completion_observations(dataset_id, self.history)
+        if sum(not censored for _, censored in observations) < self.min_samples:
+            return None
+        return survival_quantiles(observations, (0.1, 0.5, 0.9))
+
+    def next_delay(self, elapsed, attempt, quantiles=None):
+        """Seconds to sleep before the next progress check"""
+        backoff = min(self.initial * self.factor ** attempt, self.max_interval)
+        if quantiles:
+            p10, _, p90 = quantiles
+            if elapsed < p10:
+                # Nothing finishes this early - skip straight to the completion window
+                return max(p10 - elapsed, self.initial)
+            if elapsed < p90:
+                return max(self.initial, min(backoff, (p90 - p10) / 6))
+        return backoff
+
+    def schedule(self, dataset_id, max_wait_seconds):
+        """Yield sleep durations until ``max_wait_seconds`` have passed (the last one lands on the deadline)"""
+        quantiles = self.quantiles(dataset_id)
+        started = self.clock()
+        attempt = 0
+        while True:
+            elapsed = self.clock() - started
+            remaining = max_wait_seconds - elapsed
+            if remaining <= 0:
+                return
+            yield min(self.next_delay(elapsed, attempt, quantiles), remaining)
+            attempt += 1
+
+    def record(self, dataset_id, seconds, censored=False):
+        """Remember how long a snapshot of ``dataset_id`` took to become ready (``censored``: still not ready)"""
+        if self.cache is not None and dataset_id is not None:
+            self.cache.record_completion(dataset_id, seconds, censored)
@@ -0,0 +1,251 @@
+import streamlit as st
+
+
+class OutputRendererAgent:
+    def render_site_status(self, aggregated):
+        """Which sites contributed to the aggregated values (cascade information)"""
+        successful_sites = aggregated['successful_sites']
+        failed_sites = aggregated['failed_sites']
+        if successful_sites:
+            st.success(f"✅ Data from {len(successful_sites)}/5 sites: {', '.join(successful_sites)}")
+        if failed_sites:
+            st.warning(f"⚠️ Failed sites: {', '.join(failed_sites)}")
+        if len(successful_sites) < 2:
+            st.error("❌ Less than 2 sites successful - data reliability may be low")
+
+    def render_summary(self, aggregated, metrics):
+        # Professional Property Summary with horizontal layout
+        st.subheader("🏠 Property Overview")
+        
+        # Property basics in horizontal layout
+        prop_col1, prop_col2, prop_col3, prop_col4 = st.columns(4)
+        
+        with prop_col1:
+            st.metric("💰 Property Value", f"${aggregated.get('value', 'N/A'):,}" if isinstance(aggregated.get('value'), (int, float)) else aggregated.get('value', 'N/A'))
+            
+        with prop_col2:
+            st.metric("🏠 Monthly Rent", f"${aggregated.get('rent', 'N/A'):,}" if isinstance(aggregated.get('rent'), (int, float)) else aggregated.get('rent', 'N/A'))
+            
+        with prop_col3:
+            beds_baths = f"{aggregated.get('beds', 'N/A')} bed / {aggregated.get('baths', 'N/A')} bath"
+            st.metric("🛌 Bed/Bath", beds_baths)
+            
+        with prop_col4:
+            st.metric("📅 Year Built", f"{int(aggregated.get('year', 0))}" if isinstance(aggregated.get('year'), (int, float)) and aggregated.get('year', 0) > 0 else 'N/A')
+        
+        # Investment Analysis
+        st.subheader("📊 Investment Analysis")
+        col1, col2, col3 = st.columns(3)
+        col1.metric("💹 Cap Rate", f"{metrics['cap_rate']:.2f}%" if metrics['cap_rate'] else "N/A")
+        col2.metric("💵 Monthly Cash Flow", f"${metrics['cash_flow']:.2f}" if metrics['cash_flow'] else "N/A")
+        col3.metric("📈 Cash on Cash", f"{metrics['cash_on_cash']:.2f}%" if metrics['cash_on_cash'] else "N/A")
+        
+        col4, col5, col6 = st.columns(3)
+        col4.metric("🚀 IRR", f"{metrics['irr']:.2f}%" if metrics['irr'] else "N/A")
+        col5.metric("🎯 Net Profit", f"${metrics['net_profit']:.0f}" if metrics['net_profit'] else "N/A")
+        col6.metric("📈 ROI", f"{metrics['roi']:.1f}%" if metrics['roi'] else "N/A")
+
+    def _cumulative_cash_flow(self, metrics, schedule=None):
+        """Cumulative monthly cash flow: the deal's schedule when given, else the flat monthly figure"""
+        if schedule is not None:
+            return schedule['cumulative'][0].tolist()
+        monthly_cash_flow = metrics.get('cash_flow', 0)
+        return [monthly_cash_flow * m for m in range(1, 13)]
+
+    def render_details(self, aggregated, site_data, images, metrics, schedule=None):
+        # Only the details tab draws charts and tables; keep matplotlib and pandas off the rerun path
+        import matplotlib.pyplot as plt
+        import pandas as pd
+
+        # Professional Property Data Display
+        st.subheader("📊 Property Valuation Summary")
+        
+        # Create a clean horizontal layout for key metrics
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("💰 Estimated Value", f"${aggregated.get('value', 'N/A'):,}" if isinstance(aggregated.get('value'), (int, float)) else aggregated.get('value', 'N/A'))
+            
+        with col2:
+            st.metric("🏠 Monthly Rent", f"${aggregated.get('rent', 'N/A'):,}" if isinstance(aggregated.get('rent'), (int, float)) else aggregated.get('rent', 'N/A'))
+            
+        with col3:
+            st.metric("🏛️ Annual Taxes", f"${aggregated.get('taxes', 'N/A'):,}" if isinstance(aggregated.get('taxes'), (int, float)) else aggregated.get('taxes', 'N/A'))
+            
+        with col4:
+            st.metric("📅 Last Sold", aggregated.get('last_sold', 'N/A'))
+        
+        # Property Details in a clean format
+        st.subheader("🏡 Property Details")
+        detail_col1, detail_col2, detail_col3, detail_col4 = st.columns(4)
+        
+        with detail_col1:
+            st.write("**🛏️ Bedrooms**")
+            st.write(f"{aggregated.get('beds', 'N/A')}")
+            
+        with detail_col2:
+            st.write("**🛁 Bathrooms**") 
+            st.write(f"{aggregated.get('baths', 'N/A')}")
+            
+        with detail_col3:
+            st.write("**📐 Square Feet**")
+            st.write(f"{aggregated.get('sqft', 'N/A'):,}" if isinstance(aggregated.get('sqft'), (int, float)) else aggregated.get('sqft', 'N/A'))
+            
+        with detail_col4:
+            st.write("**🏗️ Year Built**")
+            st.write(f"{int(aggregated.get('year', 0))}" if isinstance(aggregated.get('year'), (int, float)) and aggregated.get('year', 0) > 0 else 'N/A')
+
+        # Data Sources in a clean horizontal table
+        st.subheader("🌐 Data Sources Comparison")
+        
+        if site_data:
+            # Create a comprehensive comparison table showing ALL 5 sources
+            comparison_data = []
+            for site_name, site_info in site_data.items():
+                # Show ALL sites, regardless of success/failure
+                value = site_info.get('value', 'N/A')
+                rent = site_info.get('rent', 'N/A')
+                
+                # Determine status
+                if value not in ['N/A', 'Failed', 'API Error', 'Trigger failed', 'Timeout', 'Processing...', 'No property found', 'Dataset N/A', 'API N/A']:
+                    status = '✅ Success'
+                    formatted_value = f"${value:,}" if isinstance(value, (int, float)) else str(value)
+                    formatted_rent = f"${rent:,}" if isinstance(rent, (int, float)) else str(rent)
+                else:
+                    status = f'❌ {value}' if value in ['Failed', 'API Error', 'Trigger failed', 'Timeout', 'Processing...', 'No property found'] else '❌ Not Available'
+                    formatted_value = value
+                    formatted_rent = rent
+                
+                comparison_data.append({
+                    'Source': site_name.title(),
+                    'Property Value': formatted_value,
+                    'Rent Estimate': formatted_rent,
+                    'Status': status
+                })
+            
+            if comparison_data:
+                comparison_df = pd.DataFrame(comparison_data)
+                st.dataframe(comparison_df, use_container_width=True, hide_index=True)
+            else:
+                st.info("No data sources available")
+
+        # Property Images with clean presentation
+        st.subheader("📸 Property Images")
+        
+        # Filter and prioritize images by source (Zillow first, then others)
+        zillow_images = aggregated.get('images', [])
+        
+        if zillow_images:
+            # Process only first 4-6 images to avoid wrong property images
+            valid_images = []
+            for img in zillow_images[:4]:  # Limit to first 4 to ensure correct property
+                try:
+                    image_url = None
+                    if isinstance(img, dict):
+                        if 'mixedSources' in img and 'jpeg' in img['mixedSources']:
+                            jpeg_sources = img['mixedSources']['jpeg']
+                            if jpeg_sources and isinstance(jpeg_sources, list) and len(jpeg_sources) > 0:
+                                image_url = jpeg_sources[-1].get('url')
+                        elif 'url' in img:
+                            image_url = img['url']
+                    elif isinstance(img, str) and img.startswith('http'):
+                        image_url = img
+                    
+                    if image_url and 'zillow' in image_url.lower():  # Prioritize Zillow images
+                        valid_images.append(image_url)
+                except Exception as e:
+                    continue
+            
+            if valid_images:
+                # Display images in a grid layout
+                cols = st.columns(2)  # Use 2 columns for better visibility
+                for i, url in enumerate(valid_images[:4]):  # Max 4 images
+                    with cols[i % 2]:
+                        try:
+                            st.image(url, caption=f"Property Image {i+1}", use_container_width=True)
+                        except Exception as e:
+                            st.markdown(f"🔗 [Image {i+1}]({url})")
+            else:
+                st.info("Images found but may not be from correct property source")
+        else:
+            st.info("No images available for this property")
+
+        # Investment Analysis Chart
+        st.subheader("📈 12-Month Cash Flow Projection")
+        fig, ax = plt.subplots(figsize=(12, 6))
+        cumulative = self._cumulative_cash_flow(metrics, schedule)
+        months = range(1, len(cumulative) + 1)
+        
+        # Create a professional-looking chart
+        ax.plot(months, cumulative, marker='o', linewidth=3, markersize=8, color='#2E86AB', markerfacecolor='#F24236')
+        ax.fill_between(months, cumulative, alpha=0.3, color='#2E86AB')
+        
+        ax.set_title('Projected Cumulative Cash Flow', fontsize=16, fontweight='bold', pad=20)
+        ax.set_xlabel('Month', fontsize=12)
+        ax.set_ylabel('Cumulative Cash Flow ($)', fontsize=12)
+        ax.grid(True, alpha=0.3)
+        ax.axhline(y=0, color='red', linestyle='--', alpha=0.7, linewidth=2)
+        
+        # Add value annotations
+        for i, v in enumerate(cumulative):
+            if i % 2 == 0:  # Show every other month to avoid crowding
+                ax.annotate(f'${v:,.0f}', (i+1, v), textcoords="offset points", 
+                           xytext=(0,15), ha='center', fontsize=10, fontweight='bold')
+        
+        plt.tight_layout()
+        st.pyplot(fig)
+        
+        # Key Investment Metrics
+        st.subheader("💼 Investment Analysis")
+        
+        metric_col1, metric_col2, metric_col3 = st.columns(3)
+        
+        with metric_col1:
+            st.metric("💰 Monthly Cash Flow", f"${metrics.get('cash_flow', 0):,.0f}")
+            st.metric("📊 Cap Rate", f"{metrics.get('cap_rate', 0):.2f}%")
+            
+        with metric_col2:
+            st.metric("🏦 Cash-on-Cash ROI", f"{metrics.get('coc_return', 0):.2f}%")
+            st.metric("💡 Total ROI", f"{metrics.get('total_return', 0):.2f}%")
+            
+        with metric_col3:
+            st.metric("⚡ Break-Even Point", f"{metrics.get('break_even', 0):.0f} months" if metrics.get('break_even', 0) > 0 else "N/A")
+            st.metric("🎯 Recommendation", "✅ Analyze" if metrics.get('cash_flow', 0) > 0 else "❌ Pass")
+        
+        # Cash Flow Projection Chart
+        st.subheader("📈 12-Month Cash Flow Projection")
+        if metrics.get('cash_flow', 0) != 0:
+            fig, ax = plt.subplots(figsize=(12, 6))
+            cumulative = self._cumulative_cash_flow(metrics, schedule)
+            months = list(range(1, len(cumulative) + 1))
+            
+            # Create professional chart
+            ax.plot(months, cumulative, marker='o', linewidth=3, markersize=8, 
+                   color='#2E86AB', markerfacecolor='#F24236')
+            ax.fill_between(months, cumulative, alpha=0.3, color='#2E86AB')
+            
+            ax.set_title('Projected Cumulative Cash Flow', fontsize=16, fontweight='bold', pad=20)
+            ax.set_xlabel('Month', fontsize=12)
+            ax.set_ylabel('Cumulative Cash Flow ($)', fontsize=12)
+            ax.grid(True, alpha=0.3)
+            ax.axhline(y=0, color='red', linestyle='--', alpha=0.7, linewidth=2)
+            
+            # Add value annotations
+            for i, v in enumerate(cumulative):
+                if i % 2 == 0:  # Show every other month to avoid crowding
+                    ax.annotate(f'${v:,.0f}', (i+1, v), textcoords="offset points", 
+                               xytext=(0,15), ha='center', fontsize=10, fontweight='bold')
+            
+            plt.tight_layout()
+            st.pyplot(fig)
+        else:
+            st.info("No cash flow data available for chart")
+        
+        # Comparable Properties section 
+        st.subheader("🏘️ Comparable Properties")
+        # Skip comps API call - using direct Bright Data integration
+        comps = {}
+        if comps:
+            st.table(pd.DataFrame(comps))
+        else:
+            st.info("Comparable properties analysis not available")
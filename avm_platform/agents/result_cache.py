@@ -0,0 +1,69 @@
+"""
+In-process cache of aggregated lookups for the Streamlit app.
+
+Keyed by the normalized property key (see ``normalizer.property_key``) and the
+scraping method, so a repeated Analyze of the same address - or any rerun
+after it - reuses the fetched and aggregated site data and only the deal
+analysis is recomputed. Entries expire after ``ttl`` seconds and the least
+recently used are dropped past ``max_entries``.
+
+Unlike ``snapshot_cache`` nothing is written to disk; the app keeps one
+instance per server process (st.cache_resource), shared by all sessions.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from avm_platform.agents.normalizer import property_key
+
+
+class ResultCache:
+    """TTL + LRU mapping of (property key, method) -> value; thread-safe across Streamlit sessions"""
+
+    def __init__(self, ttl=3600, max_entries=256, clock=time.time):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(address_dict, method):
+        return property_key(address_dict), method
+
+    def get(self, address_dict, method):
+        """(value, age in seconds) for a fresh entry, or None"""
+        key = self.key(address_dict, method)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, stored_at = entry
+            age = self.clock() - stored_at
+            if age >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value, age
+
+    def put(self, address_dict, method, value):
+        key = self.key(address_dict, method)
+        with self._lock:
+            self._entries[key] = (value, self.clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, address_dict=None, method=None):
+        """Drop one entry, every method's entry for an address, or (no arguments) everything"""
+        with self._lock:
+            if address_dict is None:
+                self._entries.clear()
+                return
+            prefix = property_key(address_dict)
+            for key in [k for k in self._entries if k[0] == prefix and method in (None, k[1])]:
+                del self._entries[key]
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,114 @@
+"""
+Monthly loan amortization and rental cash-flow schedules.
+
+Every input broadcasts to one row per property, and every output is a
+(properties, months) array, so a whole batch is scheduled in one call.
+
+Loans follow the analysis settings: fixed for ``arm_length`` years, then the
+rate moves up ``adjustable_rate`` percentage points at each yearly reset
+(capped at ``ARM_LIFETIME_CAP`` points over the start rate) and the payment is
+re-amortized over the remaining term. arm_length 0 or adjustable_rate 0 is a
+fixed-rate loan. The rental side charges expected vacancy as lost rent at each
+lease turnover, together with the turnover and leasing costs.
+"""
+
+import numpy as np
+
+# Months between ARM rate resets once the fixed period ends
+ARM_RESET_MONTHS = 12
+
+# Lifetime cap on ARM increases, in percentage points over the start rate
+ARM_LIFETIME_CAP = 5.0
+
+# Lease length; vacancy and turnover costs land at each lease end
+LEASE_MONTHS = 12
+
+
+def monthly_payment(principal, monthly_rate, payments):
+    """Level payment that amortizes ``principal`` over ``payments`` months (0% loans pay straight principal)"""
+    principal, monthly_rate, payments = np.broadcast_arrays(*(np.asarray(a, dtype=float)
+                                                              for a in (principal, monthly_rate, payments)))
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        level = principal * monthly_rate / (1 - (1 + monthly_rate) ** -payments)
+        straight = principal / payments
+    payment = np.where(monthly_rate != 0, level, straight)
+    return np.where(payments > 0, payment, 0.0)
+
+
+def amortization_schedule(principal, annual_rate, months, amortization_years=30, arm_length=0, adjustable_rate=0,
+                          rate_cap=ARM_LIFETIME_CAP):
+    """{'rate', 'payment', 'interest', 'principal', 'balance'} arrays of shape (properties, months).
+
+    ``annual_rate`` and ``adjustable_rate`` are percent; ``balance`` is what is
+    owed after each month's payment. Months past the loan term are all zero.
+    """
+    principal, start_rate = (np.ravel(a) for a in np.broadcast_arrays(np.asarray(principal, dtype=float),
+                                                                       np.asarray(annual_rate, dtype=float)))
+    term = int(round(amortization_years * 12))
+    month = np.arange(1, months + 1)
+
+    # Constant-rate segments: the fixed period, then one per reset
+    fixed = int(round(arm_length * 12)) if arm_length and adjustable_rate else term
+    starts = [0] + list(range(fixed, min(term, months), ARM_RESET_MONTHS))
+    ends = starts[1:] + [min(term, months)]
+
+    rate = np.zeros((len(principal), months))
+    payment = np.zeros_like(rate)
+    balance = np.zeros_like(rate)
+    opening = principal.copy()
+    for reset, (start, end) in enumerate(zip(starts, ends)):
+        if end <= start:
+            continue
+        annual = start_rate + min(reset * adjustable_rate, rate_cap)
+        r = annual[:, None] / 100 / 12
+        pay = monthly_payment(opening, annual / 100 / 12, term - start)[:, None]
+        k = month[start:end][None, :] - start
+        with np.errstate(divide='ignore', invalid='ignore'):
+            growth = (1 + r) ** k
+            remaining = np.where(r != 0, opening[:, None] * growth - pay * (growth - 1) / r,
+                                 opening[:, None] - pay * k)
+        rate[:, start:end] = annual[:, None]
+        payment[:, start:end] = pay
+        balance[:, start:end] = np.maximum(remaining, 0)
+        opening = balance[:, end - 1].copy()
+
+    previous = np.concatenate([principal[:, None], balance[:, :-1]], axis=1)
+    interest = np.where(payment > 0, previous * rate / 100 / 12, 0.0)
+    return {
+        'rate': rate,
+        'payment': payment,
+        'interest': interest,
+        'principal': payment - interest,
+        'balance': balance,
+    }
+
+
+def cash_flow_schedule(rent, loan_amount, settings, months=12, annual_rate=None, lease_months=LEASE_MONTHS):
+    """Loan schedule plus monthly rental cash flow, shape (properties, months).
+
+    Adds 'rent', 'operating' (maintenance + management), 'vacancy' (rent lost
+    at lease turnover: lease_months x the vacancy percentage), 'turnover'
+    (turnover + leasing fee at each lease end), 'cash_flow' and 'cumulative'.
+    """
+    annual_rate = settings['interest'] if annual_rate is None else annual_rate
+    rent, loan_amount, annual_rate = (np.ravel(a) for a in np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (rent, loan_amount, annual_rate))))
+    loan = amortization_schedule(loan_amount, annual_rate, months, settings['amortization'],
+                                 settings.get('arm_length', 0), settings.get('adjustable_rate', 0))
+
+    month = np.arange(1, months + 1)
+    lease_end = (month % lease_months == 0)[None, :]
+    gross = np.broadcast_to(rent[:, None], (len(rent), months))
+    operating = gross * (settings['maintenance'] + settings['management']) / 100
+    vacancy = np.where(lease_end, gross * lease_months * settings['vacancy'] / 100, 0.0)
+    turnover = np.where(lease_end, settings.get('turnover', 0) + settings.get('leasing_fee', 0), 0.0) * (gross > 0)
+    cash_flow = gross - operating - vacancy - turnover - loan['payment']
+    return {
+        **loan,
+        'rent': gross.copy(),
+        'operating': operating,
+        'vacancy': vacancy,
+        'turnover': turnover,
+        'cash_flow': cash_flow,
+        'cumulative': cash_flow.cumsum(axis=1),
+    }
@@ -0,0 +1,99 @@
+"""
+Monte Carlo deal risk on top of AnalyzerAgent.analyze_scenarios.
+
+ARV, rent, reno overrun, hold time and interest rate are sampled per path from
+distributions built off the aggregated multi-site data (the sites' spread and
+consensus confidence set how uncertain ARV and rent are); all paths then run
+through the vectorized analyzer in one call and come back as percentile bands.
+
+Distributions are ``(kind, *params)`` tuples: a numpy Generator method and its
+leading arguments, e.g. ('normal', 150000, 12000) or ('triangular', 1.0, 1.05, 1.4),
+or ('fixed', value).
+"""
+
+import numpy as np
+
+DEFAULT_PATHS = 100_000
+
+# Percentiles reported for every simulated metric
+PERCENTILES = (5, 25, 50, 75, 95)
+
+# ARV/rent relative standard deviation: at least 5%, plus up to 10% more as consensus confidence drops
+MIN_RELATIVE_SD = 0.05
+LOW_CONFIDENCE_SD = 0.10
+
+# Reno cost multiplier (rarely under budget, occasionally well over) and hold time vs. plan
+RENO_OVERRUN = ('triangular', 0.95, 1.05, 1.5)
+HOLD_STRETCH = (0.8, 1.0, 1.5)
+
+# Standard deviation of the loan rate around the settings rate, in percentage points
+INTEREST_SD = 0.5
+
+SIMULATED_METRICS = ('net_profit', 'roi', 'irr', 'cash_flow')
+
+
+def _relative_sd(aggregated, field):
+    spread = (aggregated.get('spread') or {}).get(field) or 0.0
+    confidence = (aggregated.get('confidence') or {}).get(field) or 0.0
+    # Sites' range is roughly +-2 sd
+    return max(spread / 2, MIN_RELATIVE_SD + LOW_CONFIDENCE_SD * (1 - confidence))
+
+
+def deal_distributions(aggregated, user_inputs, settings):
+    """Sampling distributions for one deal, from the aggregated values and the deal inputs"""
+    arv = aggregated.get('value') or 0
+    rent = aggregated.get('rent') or 0
+    hold = user_inputs.get('hold_months', 12)
+    return {
+        'arv': ('normal', arv, arv * _relative_sd(aggregated, 'value')),
+        'rent': ('normal', rent, rent * _relative_sd(aggregated, 'rent')),
+        'reno_overrun': RENO_OVERRUN,
+        'hold_months': ('triangular', *(hold * stretch for stretch in HOLD_STRETCH)),
+        'interest': ('normal', settings['interest'], INTEREST_SD),
+    }
+
+
+def sample(distributions, paths, rng):
+    """{name: array of ``paths`` draws} for each distribution"""
+    draws = {}
+    for name, (kind, *params) in distributions.items():
+        if kind == 'fixed':
+            draws[name] = np.full(paths, float(params[0]))
+        elif kind == 'triangular' and params[0] == params[2]:
+            # Degenerate (e.g. a zero hold); numpy rejects left == right
+            draws[name] = np.full(paths, float(params[0]))
+        else:
+            draws[name] = getattr(rng, kind)(*params, size=paths)
+    return draws
+
+
+def percentile_bands(values):
+    """{'p5': ..., ..., 'p95': ..., 'mean': ...} of an array, ignoring NaN (unsolvable IRRs)"""
+    finite = values[np.isfinite(values)]
+    if not len(finite):
+        return {f"p{q}": None for q in PERCENTILES} | {'mean': None}
+    bands = dict(zip((f"p{q}" for q in PERCENTILES), np.percentile(finite, PERCENTILES).tolist()))
+    return bands | {'mean': float(finite.mean())}
+
+
+def simulate(analyzer, aggregated, user_inputs, paths=DEFAULT_PATHS, seed=None, distributions=None):
+    """Percentile bands of net profit, ROI, IRR and cash flow over ``paths`` sampled deals.
+
+    ``distributions`` overrides entries of deal_distributions() by name.
+    """
+    specs = {**deal_distributions(aggregated, user_inputs, analyzer.settings), **(distributions or {})}
+    draws = sample(specs, paths, np.random.default_rng(seed))
+    metrics = analyzer.analyze_scenarios(
+        aggregated,
+        user_inputs.get('purchase', 0),
+        user_inputs.get('reno', 0) * np.maximum(draws['reno_overrun'], 0),
+        np.maximum(np.rint(draws['hold_months']), 1),
+        interest=np.maximum(draws['interest'], 0),
+        arv=np.maximum(draws['arv'], 0),
+        rent=np.maximum(draws['rent'], 0),
+    )
+    result = {'paths': paths}
+    for name in SIMULATED_METRICS:
+        result[name] = percentile_bands(metrics[name])
+    result['probability_of_loss'] = float((metrics['net_profit'] < 0).mean())
+    return result
@@ -0,0 +1,286 @@
+"""
+Persistent Bright Data snapshot / result cache.
+
+SQLite-backed and keyed by the normalized property key (see
+``normalizer.property_key``) plus the source ('zillow', 'realtor'). Two kinds
+of entries are stored:
+
+- snapshot IDs, so a known snapshot can be re-read instead of re-triggered
+- parsed results, split into field classes with their own TTLs - AVM values
+  go stale in a day, while facts like year built and square footage hold for
+  months
+
+It also keeps snapshots that timed out ("pending", resolved on a later lookup
+instead of being re-triggered) and per-dataset completion times for the
+adaptive poller.
+
+Expired rows are misses and are dropped by ``evict()``, which also trims the
+least recently used results once the table grows past ``max_entries``.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Which result fields belong to which TTL class; unknown fields count as 'avm'
+FIELD_CLASSES = {
+    'avm': ['value', 'rent'],
+    'history': ['taxes', 'last_sold'],
+    'facts': ['beds', 'baths', 'sqft', 'year'],
+    'media': ['images'],
+}
+
+DAY = 24 * 3600
+
+# Seconds each field class (and snapshot IDs) stay fresh
+DEFAULT_TTLS = {
+    'snapshot': 1 * DAY,
+    'pending': 1 * DAY,
+    'completion': 30 * DAY,
+    'avm': 1 * DAY,
+    'history': 7 * DAY,
+    'media': 30 * DAY,
+    'facts': 180 * DAY,
+}
+
+DEFAULT_CACHE_PATH = os.getenv("AVM_CACHE_PATH", ".avm_cache/snapshots.sqlite3")
+
+_FIELD_TO_CLASS = {field: cls for cls, fields in FIELD_CLASSES.items() for field in fields}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    key TEXT NOT NULL,
+    source TEXT NOT NULL,
+    snapshot_id TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (key, source)
+);
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT NOT NULL,
+    source TEXT NOT NULL,
+    field_class TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    PRIMARY KEY (key, source, field_class)
+);
+CREATE INDEX IF NOT EXISTS results_last_access ON results (last_access);
+CREATE TABLE IF NOT EXISTS pending (
+    key TEXT NOT NULL,
+    source TEXT NOT NULL,
+    snapshot_id TEXT NOT NULL,
+    dataset_id TEXT NOT NULL,
+    url TEXT NOT NULL,
+    shared INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (key, source)
+);
+CREATE TABLE IF NOT EXISTS completion_times (
+    dataset_id TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    recorded_at REAL NOT NULL,
+    censored INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS completion_times_dataset ON completion_times (dataset_id, recorded_at);
+"""
+
+
+def _new_stats():
+    return {'hits': 0, 'partial_hits': 0, 'misses': 0, 'snapshot_hits': 0, 'snapshot_misses': 0,
+            'writes': 0, 'evictions': 0}
+
+
+class SnapshotCache:
+    """SQLite cache of snapshot IDs and parsed results with per-field-class TTLs"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttls=None, max_entries=50_000, evict_every=200, clock=time.time):
+        self.path = str(path)
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.max_entries = max_entries
+        self.evict_every = evict_every
+        self.clock = clock
+        self.stats = _new_stats()
+        self._lock = threading.Lock()
+        if self.path != ':memory:':
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        # Shared by the Streamlit threads and the browser pool loop thread, guarded by _lock
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(completion_times)")]
+            if 'censored' not in columns:
+                # Cache files created before timed-out snapshots were recorded
+                self._conn.execute("ALTER TABLE completion_times ADD COLUMN censored INTEGER NOT NULL DEFAULT 0")
+            self._conn.commit()
+
+    def _fresh(self, field_class, created_at):
+        return self.clock() - created_at < self.ttls.get(field_class, self.ttls['avm'])
+
+    def get_snapshot(self, key, source):
+        """Cached snapshot ID for (key, source), or None if missing/expired"""
+        with self._lock:
+            row = self._conn.execute("SELECT snapshot_id, created_at FROM snapshots WHERE key = ? AND source = ?",
+                                     (key, source)).fetchone()
+        if row and self._fresh('snapshot', row[1]):
+            self.stats['snapshot_hits'] += 1
+            return row[0]
+        self.stats['snapshot_misses'] += 1
+        return None
+
+    def put_snapshot(self, key, source, snapshot_id):
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?, ?)",
+                               (key, source, snapshot_id, self.clock()))
+            self._conn.commit()
+        self._wrote()
+
+    def put_pending(self, key, source, snapshot_id, dataset_id, url, shared=False):
+        """Keep a timed-out snapshot so a later lookup can resolve it instead of re-triggering"""
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO pending VALUES (?, ?, ?, ?, ?, ?, ?)",
+                               (key, source, snapshot_id, dataset_id, url, int(shared), self.clock()))
+            self._conn.commit()
+
+    def get_pending(self, key, source):
+        """Pending snapshot dict for (key, source), or None if missing/expired"""
+        items = self.pending_items(key=key, source=source)
+        return items[0] if items else None
+
+    def pending_items(self, key=None, source=None):
+        """Unexpired pending snapshots, optionally filtered by key/source"""
+        query = "SELECT key, source, snapshot_id, dataset_id, url, shared, created_at FROM pending WHERE created_at >= ?"
+        params = [self.clock() - self.ttls['pending']]
+        if key is not None:
+            query += " AND key = ?"
+            params.append(key)
+        if source is not None:
+            query += " AND source = ?"
+            params.append(source)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        columns = ('key', 'source', 'snapshot_id', 'dataset_id', 'url', 'shared', 'created_at')
+        return [dict(zip(columns, row), shared=bool(row[5])) for row in rows]
+
+    def drop_pending(self, key, source):
+        with self._lock:
+            self._conn.execute("DELETE FROM pending WHERE key = ? AND source = ?", (key, source))
+            self._conn.commit()
+
+    def record_completion(self, dataset_id, seconds, censored=False):
+        """Record how long a snapshot took; ``censored`` marks a timed-out snapshot (a lower bound)"""
+        with self._lock:
+            self._conn.execute("INSERT INTO completion_times (dataset_id, seconds, recorded_at, censored) "
+                               "VALUES (?, ?, ?, ?)", (dataset_id, seconds, self.clock(), int(censored)))
+            self._conn.commit()
+
+    def completion_times(self, dataset_id, limit=200):
+        """Most recent completion times (seconds) recorded for a dataset, finished snapshots only"""
+        return [seconds for seconds, censored in self.completion_observations(dataset_id, limit) if not censored]
+
+    def completion_observations(self, dataset_id, limit=200):
+        """Most recent (seconds, censored) observations for a dataset, timed-out snapshots included"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seconds, censored FROM completion_times WHERE dataset_id = ? "
+                "ORDER BY recorded_at DESC LIMIT ?", (dataset_id, limit)).fetchall()
+        return [(row[0], bool(row[1])) for row in rows]
+
+    def get_result(self, key, source):
+        """Fresh cached fields for (key, source) and the set of field classes not fresh.
+
+        A full hit has no missing classes; a partial hit (e.g. stale AVM, fresh
+        facts) returns the fresh fields so a failed refetch can still use them.
+        """
+        now = self.clock()
+        fields, fresh = {}, set()
+        with self._lock:
+            rows = self._conn.execute("SELECT field_class, payload, created_at FROM results WHERE key = ? AND source = ?",
+                                      (key, source)).fetchall()
+            for field_class, payload, created_at in rows:
+                if self._fresh(field_class, created_at):
+                    fields.update(json.loads(payload))
+                    fresh.add(field_class)
+            if fresh:
+                self._conn.execute("UPDATE results SET last_access = ? WHERE key = ? AND source = ?", (now, key, source))
+                self._conn.commit()
+        missing = set(FIELD_CLASSES) - fresh
+        if not fresh:
+            self.stats['misses'] += 1
+        elif 'avm' in missing:
+            self.stats['partial_hits'] += 1
+        else:
+            self.stats['hits'] += 1
+        return fields, missing
+
+    def put_result(self, key, source, result):
+        """Store a parsed result, one row per field class"""
+        by_class = {}
+        for field, value in result.items():
+            by_class.setdefault(_FIELD_TO_CLASS.get(field, 'avm'), {})[field] = value
+        now = self.clock()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                [(key, source, cls, json.dumps(fields, default=str), now, now) for cls, fields in by_class.items()])
+            self._conn.commit()
+        self._wrote()
+
+    def _wrote(self):
+        self.stats['writes'] += 1
+        if self.stats['writes'] % self.evict_every == 0:
+            self.evict()
+
+    def evict(self):
+        """Drop expired rows, then least recently used results beyond max_entries"""
+        now = self.clock()
+        removed = 0
+        with self._lock:
+            removed += self._conn.execute("DELETE FROM snapshots WHERE created_at < ?",
+                                          (now - self.ttls['snapshot'],)).rowcount
+            removed += self._conn.execute("DELETE FROM pending WHERE created_at < ?",
+                                          (now - self.ttls['pending'],)).rowcount
+            removed += self._conn.execute("DELETE FROM completion_times WHERE recorded_at < ?",
+                                          (now - self.ttls['completion'],)).rowcount
+            for field_class in FIELD_CLASSES:
+                removed += self._conn.execute("DELETE FROM results WHERE field_class = ? AND created_at < ?",
+                                              (field_class, now - self.ttls[field_class])).rowcount
+            count = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            if count > self.max_entries:
+                removed += self._conn.execute(
+                    "DELETE FROM results WHERE rowid IN (SELECT rowid FROM results ORDER BY last_access LIMIT ?)",
+                    (count - self.max_entries,)).rowcount
+            self._conn.commit()
+        self.stats['evictions'] += removed
+        if removed:
+            logger.info(f"Snapshot cache: evicted {removed} rows")
+        return removed
+
+    def metrics(self):
+        """Hit/miss counters plus current table sizes"""
+        with self._lock:
+            snapshots = self._conn.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
+            results = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        lookups = self.stats['hits'] + self.stats['partial_hits'] + self.stats['misses']
+        return {**self.stats, 'snapshot_rows': snapshots, 'result_rows': results,
+                'hit_rate': self.stats['hits'] / lookups if lookups else 0.0}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_caches = {}
+
+
+def get_snapshot_cache(path=DEFAULT_CACHE_PATH):
+    """Process-wide cache per database path (agents are recreated on every Streamlit rerun)"""
+    if path not in _caches:
+        _caches[path] = SnapshotCache(path)
+    return _caches[path]
@@ -0,0 +1,203 @@
+"""
+Typed numeric values for scraped property fields.
+
+Fetchers, Bright Data records and SmartPropertyExtractor all hand back strings
+like "$92,000 - $118,000", "3 beds", "1,589 Sq Ft" or "$1,200/mo". They are
+parsed once, at ingestion, into typed values:
+
+    {'value': 105000.0, 'low': 92000.0, 'high': 118000.0, 'unit': 'usd', 'confidence': 0.7, 'raw': '...'}
+
+``value`` is the midpoint for ranges, money is normalized to its field's
+period (rent per month, taxes per year) and area to the field's unit.
+Failure placeholders ('Failed', 'Processing...', ...) and out-of-range
+numbers come back as None instead of a number.
+"""
+
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# Placeholders fetchers and the Bright Data agents return instead of a value
+FAILURE_VALUES = frozenset({
+    '', 'Failed', 'N/A', 'No data found', 'API Error', 'API N/A', 'Trigger failed', 'Timeout',
+    'Processing...', 'Dataset N/A', 'No property found',
+})
+
+SQFT_PER_ACRE = 43560
+
+# kind -> (unit, plausible (min, max) for the normalized value)
+KINDS = {
+    'money': ('usd', (1000, 1e9)),
+    'rent': ('usd/month', (50, 1e5)),
+    'tax': ('usd/year', (1, 1e6)),
+    'price_per_sqft': ('usd/sqft', (1, 1e5)),
+    'count': ('count', (0, 50)),
+    'area': ('sqft', (100, 1e6)),
+    'lot': ('acres', (0.001, 1e5)),
+    'year': ('year', (1700, 2100)),
+}
+
+# Fetcher / Bright Data result field -> kind
+FIELD_KINDS = {
+    'value': 'money',
+    'rent': 'rent',
+    'beds': 'count',
+    'baths': 'count',
+    'sqft': 'area',
+    'year': 'year',
+    'taxes': 'tax',
+}
+
+# SmartPropertyExtractor property_data field -> (result field, kind); avm_* fields are added below
+SMART_FIELDS = {
+    'price': ('value', 'money'),
+    'beds': ('beds', 'count'),
+    'baths': ('baths', 'count'),
+    'sqft': ('sqft', 'area'),
+    'year_built': ('year', 'year'),
+    'property_tax': ('taxes', 'tax'),
+    'lot_size': ('lot_size', 'lot'),
+    'price_per_sqft': ('price_per_sqft', 'price_per_sqft'),
+    'mortgage_estimate': ('mortgage_estimate', 'rent'),
+}
+
+_AMOUNT = r'(\$)?\s*(\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?|\.\d+)\s*([KkMm]\b)?'
+_RANGE = re.compile(_AMOUNT + r'\s*(?:-|–|—|to)\s*' + _AMOUNT, re.I)
+_NUMBER = re.compile(_AMOUNT)
+_YEAR = re.compile(r'\b(1[7-9]\d\d|20\d\d)\b')
+_MONTHLY = re.compile(r'/\s*mo\b|/\s*month|\bper\s+month|\bmonthly|\ba\s+month', re.I)
+_YEARLY = re.compile(r'/\s*yr\b|/\s*year|\bper\s+year|\bannual(?:ly)?|\ba\s+year', re.I)
+_ACRES = re.compile(r'\bacres?\b|\bac\b', re.I)
+_SQFT = re.compile(r'sq\.?\s*f(?:ee)?t|sqft|square\s+f(?:ee|oo)t|ft²', re.I)
+_STUDIO = re.compile(r'\bstudio\b', re.I)
+
+_MULTIPLIERS = {'k': 1e3, 'm': 1e6}
+
+
+def _amount(dollar, digits, suffix):
+    number = float(digits.replace(',', ''))
+    return number * _MULTIPLIERS[suffix.lower()] if suffix else number
+
+
+def _typed(value, low, high, unit, confidence, raw):
+    return {'value': value, 'low': low, 'high': high, 'unit': unit, 'confidence': round(confidence, 2), 'raw': raw}
+
+
+def _parse_text(text, kind):
+    """(value, low, high, confidence) parsed from a display string, or None"""
+    if kind == 'year':
+        match = _YEAR.search(text)
+        return (int(match.group(1)),) * 3 + (0.9,) if match else None
+    if kind == 'count' and _STUDIO.search(text) and not _NUMBER.search(text):
+        return 0.0, 0.0, 0.0, 0.9
+
+    confidence = 0.9
+    match = _RANGE.search(text)
+    if match:
+        low, high = _amount(*match.groups()[:3]), _amount(*match.groups()[3:])
+        if low > high:
+            low, high = high, low
+        confidence = 0.7
+        shorthand = match.group(3) or match.group(6)
+    else:
+        matches = list(_NUMBER.finditer(text))
+        if not matches:
+            return None
+        if kind in ('money', 'rent', 'tax', 'price_per_sqft'):
+            # "Last sold: March 2020 for $85,000" - the dollar amount, not the year
+            matches = [m for m in matches if m.group(1)] or matches
+        match = matches[0]
+        low = high = _amount(*match.groups())
+        shorthand = match.group(3)
+    if shorthand:
+        # "$1.2K" is a rounded figure
+        confidence -= 0.1
+
+    scale = 1
+    if kind == 'rent' and _YEARLY.search(text):
+        scale = 1 / 12
+    elif kind == 'tax' and _MONTHLY.search(text):
+        scale = 12
+    elif kind == 'area' and _ACRES.search(text):
+        scale = SQFT_PER_ACRE
+    elif kind == 'lot' and _SQFT.search(text):
+        scale = 1 / SQFT_PER_ACRE
+    elif kind == 'lot' and not _ACRES.search(text):
+        # Bare lot size: small numbers are acres, large ones square feet
+        scale = 1 if high < 100 else 1 / SQFT_PER_ACRE
+        confidence -= 0.2
+    low, high = low * scale, high * scale
+    return (low + high) / 2, low, high, confidence
+
+
+def parse_typed(raw, kind):
+    """Typed value for one raw field of the given kind (see KINDS), or None"""
+    if raw is None or isinstance(raw, bool):
+        return None
+    unit, (minimum, maximum) = KINDS[kind]
+    if isinstance(raw, (int, float)):
+        number = int(raw) if kind == 'year' else float(raw)
+        parsed = (number, number, number, 1.0)
+    elif isinstance(raw, str):
+        text = raw.strip()
+        if text in FAILURE_VALUES:
+            return None
+        parsed = _parse_text(text, kind)
+        if parsed is None:
+            return None
+    else:
+        return None
+    value, low, high, confidence = parsed
+    if not minimum <= value <= maximum:
+        logger.debug(f"Discarding implausible {kind} {raw!r} -> {value}")
+        return None
+    return _typed(value, low, high, unit, confidence, raw)
+
+
+def typed_fields(site_data, kinds=FIELD_KINDS):
+    """{field: typed value} for a site result, reusing its 'typed' entries whose raw value is unchanged"""
+    cached = site_data.get('typed') or {}
+    typed = {}
+    for field, kind in kinds.items():
+        raw = site_data.get(field)
+        entry = cached.get(field)
+        if entry is None or entry.get('raw') != raw:
+            entry = parse_typed(raw, kind)
+        if entry is not None:
+            typed[field] = entry
+    return typed
+
+
+def with_typed(site_data):
+    """Attach the typed values to a fetcher / Bright Data result (in place) and return it.
+
+    Results with nothing numeric (failure placeholders) are left without a 'typed' key.
+    """
+    if isinstance(site_data, dict):
+        typed = typed_fields(site_data)
+        if typed:
+            site_data['typed'] = typed
+        else:
+            site_data.pop('typed', None)
+    return site_data
+
+
+def normalize_smart_data(property_data):
+    """Typed values, keyed by result field, for a SmartPropertyExtractor property_data dict.
+
+    Smart price strings lose their leading '$' ('92,000 - $118,000'); the
+    AVM provider estimates (avm_*) are kept under their own names.
+    """
+    typed = {}
+    for field, raw in property_data.items():
+        if field in SMART_FIELDS:
+            target, kind = SMART_FIELDS[field]
+        elif field.startswith('avm_'):
+            target, kind = field, 'money'
+        else:
+            continue
+        entry = parse_typed(raw, kind)
+        if entry is not None and target not in typed:
+            typed[target] = entry
+    return typed
@@ -13,14 +13,58 @@ import time
 import random
 import ssl
 from dotenv import load_dotenv
-from smart_extraction import SmartPropertyExtractor
+from smart_extraction import SmartPropertyExtractor, is_quiet
 
 load_dotenv()
 
+# Landmark sections of a homes.com property page for scoped extraction. The first
+# selector that matches wins; a section with no match is read from the body text
+# instead (see SmartPropertyExtractor.extract_from_sections).
+HOMES_SECTION_LANDMARKS = {
+    'header': ['.property-info', '[data-testid="property-info"]', '.ldp-header'],
+    'facts': ['.property-details', '#details', '.ldp-details'],
+    'history': ['.property-history', '#price-tax-history', '.tax-history'],
+    'avm': ['.home-value', '#home-value', '.avm-section'],
+    'schools': ['.schools', '#schools'],
+    'neighborhood': ['.neighborhood', '#neighborhood', '.demographics'],
+    'risk': ['.environmental-risk', '#environmental-risk', '.climate-risk'],
+}
+
+# One round trip: the text of every landmark, plus the body text only if a landmark is missing
+SECTION_TEXT_SCRIPT = """
+(landmarks) => {
+    const sections = {};
+    let missing = false;
+    for (const [name, selectors] of Object.entries(landmarks)) {
+        sections[name] = null;
+        for (const selector of selectors) {
+            let nodes = [];
+            try { nodes = Array.from(document.querySelectorAll(selector)); } catch (e) {}
+            if (nodes.length) {
+                sections[name] = nodes.map(node => node.textContent).join('\\n');
+                break;
+            }
+        }
+        if (sections[name] === null) missing = true;
+    }
+    return {sections, body: missing ? document.body.textContent : null};
+}
+"""
+
 class PropertyScraper:
-    def __init__(self, address, site):
+    def __init__(self, address, site, quiet=None, screenshots=None, scoped=None):
         self.address = address
         self.site = site.lower()
+        # Quiet mode: log_step and extraction don't print (default: smart_extraction's global switch).
+        # Step screenshots default to off in quiet mode; SCRAPER_SCREENSHOTS=true/false overrides.
+        self.quiet = is_quiet(quiet)
+        if screenshots is None:
+            screenshots = os.getenv("SCRAPER_SCREENSHOTS", "false" if self.quiet else "true").lower() == "true"
+        self.screenshots = screenshots
+        # Scoped extraction: read landmark sections instead of the whole body (SCRAPER_SCOPED_EXTRACTION=true)
+        if scoped is None:
+            scoped = os.getenv("SCRAPER_SCOPED_EXTRACTION", "false").lower() == "true"
+        self.scoped = scoped
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.screenshots_dir = f"screenshots/screenshots_{self.site}_{self.timestamp}"
         self.data = {
@@ -34,7 +78,8 @@ class PropertyScraper:
         }
 
         # Create screenshots directory
-        os.makedirs(self.screenshots_dir, exist_ok=True)
+        if self.screenshots:
+            os.makedirs(self.screenshots_dir, exist_ok=True)
 
         # No-proxy test flag (disable proxy for isolate; env NO_PROXY=true to toggle)
         self.no_proxy = os.getenv("NO_PROXY", "false").lower() == "true"
@@ -82,16 +127,20 @@ class PropertyScraper:
         return paths[0]
 
     async def log_step(self, step, message, page=None, take_screenshot=True):
-        print(f"\n🔍 [{step}] {message}")
+        if not self.quiet:
+            print(f"\n🔍 [{step}] {message}")
         self.data["steps_completed"].append(f"{step}: {message}")
 
-        if page and take_screenshot:
+        if page and take_screenshot and self.screenshots:
             screenshot_path = f"{self.screenshots_dir}/{step.lower().replace(' ', '_')}.png"
             try:
                 await page.screenshot(path=screenshot_path, full_page=True)
-                print(f"📸 Screenshot saved: {screenshot_path}")
+                if not self.quiet:
+                    print(f"📸 Screenshot saved: {screenshot_path}")
             except Exception as e:
-                print(f"⚠️ Screenshot failed: {e}")
+                self.data["errors"].append(f"Screenshot failed at {step}: {e}")
+                if not self.quiet:
+                    print(f"⚠️ Screenshot failed: {e}")
 
     async def debug_page_content(self, page, step_name):
         """Debug what's actually on the page"""
@@ -384,8 +433,14 @@ class PropertyScraper:
 
         try:
             # Get page content for smart extraction
-            print("🧠 Using smart pattern extraction instead of rigid CSS selectors")
-            page_content = await page.text_content("body")
+            if not self.quiet:
+                print("🧠 Using smart pattern extraction instead of rigid CSS selectors")
+            landmarks = None
+            if self.scoped:
+                landmarks = await page.evaluate(SECTION_TEXT_SCRIPT, HOMES_SECTION_LANDMARKS)
+                page_content = landmarks['body'] or '\n'.join(text for text in landmarks['sections'].values() if text)
+            else:
+                page_content = await page.text_content("body")
 
             if not page_content or len(page_content.strip()) < 100:
                 self.data["errors"].append("No sufficient page content found")
@@ -394,8 +449,12 @@ class PropertyScraper:
             # Initialize smart extractor
             extractor = SmartPropertyExtractor()
 
-            # Perform smart extraction
-            extraction_result = extractor.extract_from_content(page_content)
+            # Perform smart extraction in a pool worker so the regexes don't stall the event loop
+            if landmarks:
+                extraction_result = await extractor.extract_from_sections_async(
+                    landmarks['sections'], quiet=self.quiet, fallback=landmarks['body'])
+            else:
+                extraction_result = await extractor.extract_from_content_async(page_content, quiet=self.quiet)
 
             # Update our data structure
             if extraction_result['found']:
@@ -5,9 +5,227 @@ Standalone module for pattern-based property data extraction
 Safe to modify without affecting main scraper
 """
 
-import re
+import asyncio
 import json
-from typing import Dict, List, Optional, Tuple
+import math
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# Characters re.IGNORECASE treats as ASCII letters but str.lower() does not
+# (U+0130 would also change the length); folded before the anchor scan so
+# anchor positions line up with the original text
+_ANCHOR_FOLD_CHARS = 'İıſ'
+_ANCHOR_FOLD = str.maketrans(dict(zip(_ANCHOR_FOLD_CHARS, 'iis')))
+
+
+def _fold(text: str) -> str:
+    """Lowercase ``text`` for literal searches, keeping positions aligned with the original"""
+    if not text.isascii() and any(char in text for char in _ANCHOR_FOLD_CHARS):
+        text = text.translate(_ANCHOR_FOLD)
+    return text.lower()
+
+
+# Global quiet switch: no per-match prints. A per-call ``quiet=`` overrides it;
+# SMART_EXTRACTION_QUIET=1 turns it on for the whole process (and pool workers).
+_QUIET = os.getenv('SMART_EXTRACTION_QUIET', '').lower() in ('1', 'true', 'yes')
+
+
+def set_quiet(quiet: bool = True):
+    """Turn quiet mode on or off for every extractor in this process"""
+    global _QUIET
+    _QUIET = bool(quiet)
+
+
+def is_quiet(quiet: Optional[bool] = None) -> bool:
+    """Effective quiet setting: the per-call value if given, else the global one"""
+    return _QUIET if quiet is None else bool(quiet)
+
+
+class ExtractionTrace:
+    """
+    Structured record of what an extraction did, the quiet-mode stand-in for prints
+
+    ``events`` holds (event, field, value) tuples in order; ``counters`` counts
+    them per event ('match', 'avm', 'override', 'pattern_added', 'pattern_test').
+    """
+
+    def __init__(self):
+        self.events: List[Tuple[str, Optional[str], object]] = []
+        self.counters: Dict[str, int] = {}
+
+    def record(self, event: str, field: Optional[str] = None, value: object = None):
+        self.events.append((event, field, value))
+        self.counters[event] = self.counters.get(event, 0) + 1
+
+    def fields(self, event: str = 'match') -> List[str]:
+        return [field for kind, field, _ in self.events if kind == event]
+
+
+def _emit(quiet: Optional[bool], trace: Optional[ExtractionTrace], message: str, event: str,
+          field: Optional[str] = None, value: object = None):
+    if trace is not None:
+        trace.record(event, field, value)
+    if not is_quiet(quiet):
+        print(message)
+
+
+class CompiledPatternEngine:
+    """
+    Extraction patterns compiled once and matched with first-match semantics
+
+    Instead of one findall per pattern over the whole page, the page is
+    lowercased once and scanned for each pattern's literal anchors: a pattern
+    whose anchors never occur is skipped, and a pattern whose match must start
+    with an anchor is searched from the anchor's first occurrence. Results are
+    identical to taking findall(...)[0] for every pattern.
+    """
+
+    def __init__(self, patterns: List[Tuple[str, str, str]], anchors: Optional[Dict[str, Dict]] = None,
+                 flags: int = re.IGNORECASE):
+        """
+        Args:
+            patterns: (category, field, regex) in extraction order
+            anchors: field -> {'any': [literals], 'start': bool}; every match of the
+                field's pattern contains one of the (lowercase) literals, and with
+                'start' it begins with one
+        """
+        anchors = anchors or {}
+        self.entries = []
+        for category, field, pattern in patterns:
+            spec = anchors.get(field)
+            literals = tuple(spec['any']) if spec else ()
+            for literal in literals:
+                if literal != literal.lower() or not literal.isascii():
+                    raise ValueError(f"Anchor {literal!r} for '{field}' must be lowercase ASCII")
+            self.entries.append((category, field, re.compile(pattern, flags), literals,
+                                 bool(spec and spec.get('start'))))
+        self.literals = sorted({literal for entry in self.entries for literal in entry[3]})
+
+    def anchor_positions(self, text: str) -> Dict[str, int]:
+        """First position of every anchor literal in ``text`` (-1 if absent)"""
+        folded = _fold(text)
+        return {literal: folded.find(literal) for literal in self.literals}
+
+    def first_matches(self, text: str) -> Tuple[List[Tuple[str, str, str]], int]:
+        """(category, field, value) for every pattern that matched, plus the number skipped by anchors"""
+        positions = self.anchor_positions(text)
+        matches, skipped = [], 0
+        for category, field, regex, literals, start in self.entries:
+            pos = 0
+            if literals:
+                found = [positions[literal] for literal in literals if positions[literal] >= 0]
+                if not found:
+                    skipped += 1
+                    continue
+                if start:
+                    pos = min(found)
+            match = regex.search(text, pos)
+            if not match:
+                continue
+            if regex.groups:
+                # findall semantics: the lone group, or the first non-empty one
+                value = next((group for group in match.groups() if group), None)
+            else:
+                value = match.group(0)
+            if value:
+                matches.append((category, field, value))
+        return matches, skipped
+
+
+# Compiled engines shared across extractor instances (scrape_property builds a
+# new extractor per page), keyed by the exact patterns and anchors
+_ENGINES = {}
+
+
+def _engine_for(core_patterns: Dict[str, str], extended_patterns: Dict[str, str],
+                anchors: Dict[str, Dict]) -> CompiledPatternEngine:
+    key = (tuple(core_patterns.items()), tuple(extended_patterns.items()),
+           tuple((field, tuple(spec['any']), bool(spec.get('start'))) for field, spec in anchors.items()))
+    if key not in _ENGINES:
+        patterns = ([('core', field, pattern) for field, pattern in core_patterns.items()]
+                    + [('extended', field, pattern) for field, pattern in extended_patterns.items()])
+        _ENGINES[key] = CompiledPatternEngine(patterns, anchors)
+    return _ENGINES[key]
+
+
+# Dollar amounts as shown on listing pages: $118,000, $1,250/year, $1.2K
+_DOLLAR_AMOUNT = re.compile(r'\$(\d[\d,]*(?:\.\d+)?)([KM]\b)?', re.IGNORECASE)
+_DOLLAR_SUFFIXES = {'k': 1_000, 'm': 1_000_000}
+
+
+def parse_dollar_amount(digits: str, suffix: Optional[str] = None) -> Optional[float]:
+    """'118,000' -> 118000.0, ('1.2', 'K') -> 1200.0; None if not a number"""
+    try:
+        value = float(digits.replace(',', ''))
+    except ValueError:
+        return None
+    return value * _DOLLAR_SUFFIXES.get((suffix or '').lower(), 1)
+
+
+class AVMSectionParser:
+    """
+    Provider -> estimate parser for the AVM ("Home Value") section
+
+    A provider block starts at the provider's name (often repeated in its
+    header and blurb) and ends at the first dollar amount after it, which is
+    that provider's estimate. Provider names are located with literal searches
+    and dollar amounts with one forward regex scan; the two position-sorted
+    streams are merged once, so parsing is linear in the page size and never
+    backtracks. A block that runs past ``window`` characters or into another
+    provider's name has no value.
+    """
+
+    def __init__(self, providers: Dict[str, str], window: int = 1000):
+        """
+        Args:
+            providers: property_data field -> provider name as shown on the page
+            window: Max characters between a provider's last mention and its value
+        """
+        self.providers = dict(providers)
+        self.window = window
+        self._names = {field: name.lower() for field, name in self.providers.items()}
+
+    def _mentions(self, folded: str):
+        for field, name in self._names.items():
+            pos = folded.find(name)
+            while pos >= 0:
+                yield pos, field
+                pos = folded.find(name, pos + len(name))
+
+    def parse(self, text: str) -> List[Dict]:
+        """Estimates in page order: [{'field', 'provider', 'value', 'text', 'position'}]"""
+        if not text:
+            return []
+        mentions = sorted(self._mentions(_fold(text)))
+        if not mentions:
+            return []
+
+        estimates, found = [], set()
+        block_field, block_end = None, -1
+        amounts = _DOLLAR_AMOUNT.finditer(text, mentions[0][0])
+        amount = next(amounts, None)
+        for pos, field in mentions + [(len(text), None)]:
+            # Close the open block with the first amount before this mention
+            while amount is not None and amount.start() < pos:
+                if block_field is not None and amount.start() - block_end <= self.window:
+                    value = parse_dollar_amount(*amount.groups())
+                    if value is not None:
+                        estimates.append({'field': block_field, 'provider': self.providers[block_field],
+                                          'value': int(value) if value.is_integer() else value,
+                                          'text': amount.group(0), 'position': amount.start()})
+                        found.add(block_field)
+                block_field = None
+                amount = next(amounts, None)
+            if field is None:
+                break
+            # Repeated mentions of the open provider extend its block; a provider
+            # that already has a value is not parsed again
+            block_field = None if field in found else field
+            block_end = pos + len(self._names[field])
+        return estimates
 
 
 class SmartPropertyExtractor:
@@ -23,7 +241,7 @@ class SmartPropertyExtractor:
             'beds': r'(\d+)\s*beds?',                                           # 3 beds
             'baths': r'(\d+\.?\d*)\s*baths?',                                  # 1 bath, 2.5 baths
             'sqft': r'(\d{1,3}(?:,\d{3})*)\s*(?:sq\.?\s*ft|sqft)',           # 1,589 Sq Ft
-            'address': r'(\d+.*?(?:Ave|St|Rd|Dr|Ln|Ct|Cir|Pl|Way|Blvd|Pkwy))', # Street addresses
+            'address': r'(\d+.{0,80}?(?:Ave|St|Rd|Dr|Ln|Ct|Cir|Pl|Way|Blvd|Pkwy))', # Street addresses
         }
 
         # Extended patterns for additional data
@@ -34,112 +252,227 @@ class SmartPropertyExtractor:
             'lot_size': r'([\d.]+)\s*acres?',
             'price_per_sqft': r'\$(\d+)/sq\.?\s*ft',
             'status': r'(For Sale|Not Listed|Off Market|Sold|Pending|FOR SALE|NOT LISTED)',
-            'last_sold': r'Last sold.*?\$[\d,]+',
-            'hoa_fees': r'HOA.*?\$[\d,]+',
-            'property_tax': r'(?:Property tax|Tax).*?\$[\d,]+',
-            'estimate_value': r'(?:Est\.?\s*Value|Estimate).*?\$[\d,]+',
-            'mortgage_estimate': r'(?:Est\.?\s*mortgage|Monthly payment).*?\$[\d,]+',
-
-            # AVM Providers (capture provider name and dollar value from deep scroll content)
-            'avm_collateral_analytics': r'Collateral Analytics[\s\S]{0,500}\$[\d,]+',
-            'avm_ice_mortgage': r'ICE Mortgage Technology[\s\S]{0,500}\$[\d,]+',
-            'avm_first_american': r'First American[\s\S]{0,500}\$[\d,]+',
-            'avm_quantarium': r'Quantarium[\s\S]{0,500}\$[\d,]+',
-            'avm_housecanary': r'HouseCanary[\s\S]{0,500}\$[\d,]+',
-            'avm_average_value': r'Average Value[\s\S]{0,100}\$[\d,]+',
+            'last_sold': r'Last sold.{0,120}?\$[\d,]+',
+            'hoa_fees': r'HOA.{0,120}?\$[\d,]+',
+            'property_tax': r'(?:Property tax|Tax).{0,120}?\$[\d,]+',
+            'estimate_value': r'(?:Est\.?\s*Value|Estimate).{0,120}?\$[\d,]+',
+            'mortgage_estimate': r'(?:Est\.?\s*mortgage|Monthly payment).{0,120}?\$[\d,]+',
 
             # Purchase & Mortgage History
-            'purchase_history': r'(?:Purchase|Bought).*?\$[\d,]+.*?\d{4}',
-            'mortgage_history': r'(?:Mortgage|Loan).*?\$[\d,]+',
+            'purchase_history': r'(?:Purchase|Bought).{0,120}?\$[\d,]+.{0,120}?\d{4}',
+            'mortgage_history': r'(?:Mortgage|Loan).{0,120}?\$[\d,]+',
 
             # Tax History
-            'tax_assessment': r'(?:Tax Assessment|Assessed Value).*?\$[\d,]+',
-            'tax_paid': r'(?:Tax Paid|Property Tax).*?\$[\d,]+',
-            'land_value': r'(?:Land Value).*?\$[\d,]+',
-            'improvement_value': r'(?:Improvement|Building) Value.*?\$[\d,]+',
+            'tax_assessment': r'(?:Tax Assessment|Assessed Value).{0,120}?\$[\d,]+',
+            'tax_paid': r'(?:Tax Paid|Property Tax).{0,120}?\$[\d,]+',
+            'land_value': r'(?:Land Value).{0,120}?\$[\d,]+',
+            'improvement_value': r'(?:Improvement|Building) Value.{0,120}?\$[\d,]+',
 
             # Demographics
-            'college_grads': r'(\d+)%.*?(?:college|degree|grad)',
-            'household_income': r'(?:Household Income|Income).*?\$[\d,]+',
-            'median_income': r'Median.*?Income.*?\$[\d,]+',
+            'college_grads': r'(\d+)%.{0,120}?(?:college|degree|grad)',
+            'household_income': r'(?:Household Income|Income).{0,120}?\$[\d,]+',
+            'median_income': r'Median.{0,120}?Income.{0,120}?\$[\d,]+',
 
             # Area Factors
-            'crime_score': r'Crime.*?(\d+)',
-            'bike_score': r'Bike.*?Score.*?(\d+)',
-            'walk_score': r'Walk.*?Score.*?(\d+)',
-            'transit_score': r'Transit.*?Score.*?(\d+)',
+            'crime_score': r'Crime.{0,120}?(\d+)',
+            'bike_score': r'Bike.{0,120}?Score.{0,120}?(\d+)',
+            'walk_score': r'Walk.{0,120}?Score.{0,120}?(\d+)',
+            'transit_score': r'Transit.{0,120}?Score.{0,120}?(\d+)',
 
             # Environmental Factors
-            'sound_risk': r'Sound.*?Risk.*?(Low|Medium|High)',
-            'flood_risk': r'Flood.*?Risk.*?(Low|Medium|High)',
-            'fire_risk': r'Fire.*?Risk.*?(Low|Medium|High)',
-            'heat_risk': r'Heat.*?Risk.*?(Low|Medium|High)',
+            'sound_risk': r'Sound.{0,120}?Risk.{0,120}?(Low|Medium|High)',
+            'flood_risk': r'Flood.{0,120}?Risk.{0,120}?(Low|Medium|High)',
+            'fire_risk': r'Fire.{0,120}?Risk.{0,120}?(Low|Medium|High)',
+            'heat_risk': r'Heat.{0,120}?Risk.{0,120}?(Low|Medium|High)',
 
             # Schools
-            'school_score': r'School.*?Score.*?(\d+)',
-            'school_grade': r'School.*?Grade.*?([A-F])',
-            'school_name': r'School.*?([\w\s]+Elementary|[\w\s]+Middle|[\w\s]+High)',
-            'school_walk_distance': r'(\d+\.?\d*)\s*(?:mi|miles?).*?school',
+            'school_score': r'School.{0,120}?Score.{0,120}?(\d+)',
+            'school_grade': r'School.{0,120}?Grade.{0,120}?([A-F])',
+            'school_name': r'School[\s\S]{0,120}?\b((?:\w+ ){1,5}?(?:Elementary|Middle|High))\b',
+            'school_walk_distance': r'(\d+\.?\d*)\s*(?:mi|miles?).{0,120}?school',
+        }
+
+        # AVM providers on the homes.com "Home Value" section (parsed by AVMSectionParser,
+        # not regex: a provider's value is the first dollar amount after its block)
+        self.avm_providers = {
+            'avm_collateral_analytics': 'Collateral Analytics',
+            'avm_ice_mortgage': 'ICE Mortgage Technology',
+            'avm_first_american': 'First American',
+            'avm_quantarium': 'Quantarium',
+            'avm_housecanary': 'HouseCanary',
+            'avm_average_value': 'Average Value',
+        }
+
+        # Landmark sections for scoped extraction (extract_from_sections): a field's
+        # pattern only runs on its own section's text, and the AVM parser only on
+        # 'avm'. Fields not listed here (e.g. custom patterns) run on every section.
+        self.section_fields = {
+            'header': ['price', 'address', 'status', 'beds', 'baths', 'sqft', 'price_per_sqft', 'estimate_value'],
+            'facts': ['property_type', 'property_type_inferred', 'year_built', 'lot_size', 'hoa_fees',
+                      'property_tax', 'mortgage_estimate', 'last_sold'],
+            'history': ['purchase_history', 'mortgage_history', 'tax_assessment', 'tax_paid', 'land_value',
+                        'improvement_value'],
+            'avm': [],
+            'schools': ['school_score', 'school_grade', 'school_name', 'school_walk_distance'],
+            'neighborhood': ['college_grads', 'household_income', 'median_income', 'crime_score', 'bike_score',
+                             'walk_score', 'transit_score'],
+            'risk': ['sound_risk', 'flood_risk', 'fire_risk', 'heat_risk'],
+        }
+
+        # Literal anchors for CompiledPatternEngine: every match contains one of
+        # 'any' ('start': and begins with it). Patterns without an entry
+        # (price, address) are always searched from the top of the page.
+        self.pattern_anchors = {
+            'beds': {'any': ['bed']},
+            'baths': {'any': ['bath']},
+            'sqft': {'any': ['sq']},
+            'property_type': {'any': ['single family', 'condo', 'townhouse', 'multi-family', 'duplex',
+                                      'single-family'], 'start': True},
+            'property_type_inferred': {'any': ['is a', 'type:', 'style:'], 'start': True},
+            'year_built': {'any': ['built']},
+            'lot_size': {'any': ['acre']},
+            'price_per_sqft': {'any': ['/sq']},
+            'status': {'any': ['for sale', 'not listed', 'off market', 'sold', 'pending'], 'start': True},
+            'last_sold': {'any': ['last sold'], 'start': True},
+            'hoa_fees': {'any': ['hoa'], 'start': True},
+            'property_tax': {'any': ['property tax', 'tax'], 'start': True},
+            'estimate_value': {'any': ['est'], 'start': True},
+            'mortgage_estimate': {'any': ['est', 'monthly payment'], 'start': True},
+            'purchase_history': {'any': ['purchase', 'bought'], 'start': True},
+            'mortgage_history': {'any': ['mortgage', 'loan'], 'start': True},
+            'tax_assessment': {'any': ['tax assessment', 'assessed value'], 'start': True},
+            'tax_paid': {'any': ['tax paid', 'property tax'], 'start': True},
+            'land_value': {'any': ['land value'], 'start': True},
+            'improvement_value': {'any': ['improvement value', 'building value'], 'start': True},
+            'college_grads': {'any': ['%']},
+            'household_income': {'any': ['household income', 'income'], 'start': True},
+            'median_income': {'any': ['median'], 'start': True},
+            'crime_score': {'any': ['crime'], 'start': True},
+            'bike_score': {'any': ['bike'], 'start': True},
+            'walk_score': {'any': ['walk'], 'start': True},
+            'transit_score': {'any': ['transit'], 'start': True},
+            'sound_risk': {'any': ['sound'], 'start': True},
+            'flood_risk': {'any': ['flood'], 'start': True},
+            'fire_risk': {'any': ['fire'], 'start': True},
+            'heat_risk': {'any': ['heat'], 'start': True},
+            'school_score': {'any': ['school'], 'start': True},
+            'school_grade': {'any': ['school'], 'start': True},
+            'school_name': {'any': ['school'], 'start': True},
+            'school_walk_distance': {'any': ['school']},
         }
 
-    def extract_from_content(self, page_content: str, min_fields: int = 3) -> Dict:
+    def engine(self, fields: Optional[Iterable[str]] = None) -> CompiledPatternEngine:
+        """Compiled engine for the current patterns, or just ``fields`` (shared by extractors with the same patterns)"""
+        if fields is None:
+            return _engine_for(self.core_patterns, self.extended_patterns, self.pattern_anchors)
+        fields = set(fields)
+        return _engine_for({f: p for f, p in self.core_patterns.items() if f in fields},
+                           {f: p for f, p in self.extended_patterns.items() if f in fields},
+                           {f: a for f, a in self.pattern_anchors.items() if f in fields})
+
+    def extract_from_content(self, page_content: str, min_fields: int = 3, quiet: Optional[bool] = None,
+                             trace: Optional[ExtractionTrace] = None) -> Dict:
         """
         Extract property data from page content using pattern recognition
 
         Args:
             page_content: Raw text content from webpage
             min_fields: Minimum fields required to consider extraction successful
+            quiet: Suppress per-match prints (default: the global setting, see set_quiet)
+            trace: Optional ExtractionTrace that records every match instead
 
         Returns:
             Dict with extracted data and metadata
         """
+        return self._extract([(page_content, None, True)], min_fields, quiet, trace)
+
+    def extract_from_sections(self, sections: Dict[str, Optional[str]], min_fields: int = 3,
+                              quiet: Optional[bool] = None, trace: Optional[ExtractionTrace] = None,
+                              fallback: Optional[str] = None) -> Dict:
+        """
+        Extract property data from landmark section texts instead of the whole page
+
+        Each pattern only scans its own section (see section_fields), which cuts
+        the text scanned and keeps e.g. property_tax from matching the tax
+        history table. Sections that are missing (None) are read from
+        ``fallback`` (typically the body text) if given, otherwise skipped.
+
+        Args:
+            sections: Section name -> text (e.g. from one page.evaluate over landmarks)
+            fallback: Whole-page text for fields whose section wasn't found
+            min_fields, quiet, trace: As in extract_from_content
+        """
+        assigned = {field for fields in self.section_fields.values() for field in fields}
+        unassigned = [field for field in [*self.core_patterns, *self.extended_patterns] if field not in assigned]
+        present = {name: text for name, text in sections.items() if text}
+
+        jobs, missing = [], []
+        for name, fields in self.section_fields.items():
+            if name in present:
+                jobs.append((present[name], fields, name == 'avm'))
+            else:
+                missing.append(name)
+
+        missing_fields = [field for name in missing for field in self.section_fields[name]] + unassigned
+        if fallback and (missing_fields or 'avm' in missing):
+            jobs.append((fallback, missing_fields, 'avm' in missing))
+        elif unassigned and present:
+            jobs.append(('\n'.join(present.values()), unassigned, False))
+
+        result = self._extract(jobs, min_fields, quiet, trace)
+        result['extraction_metadata']['sections'] = {name: len(present[name]) if name in present else None
+                                                     for name in self.section_fields}
+        result['extraction_metadata']['fallback_sections'] = missing if fallback else []
+        return result
+
+    def _extract(self, jobs: List[Tuple[str, Optional[List[str]], bool]], min_fields: int,
+                 quiet: Optional[bool], trace: Optional[ExtractionTrace]) -> Dict:
+        """Run (text, fields or None for all, parse AVM section) jobs into one result"""
         result = {
             'found': False,
             'property_data': {},
+            'avm_estimates': [],
             'extraction_metadata': {
                 'total_patterns_matched': 0,
                 'core_patterns_matched': 0,
                 'extended_patterns_matched': 0,
-                'content_length': len(page_content),
-                'patterns_attempted': len(self.core_patterns) + len(self.extended_patterns)
+                'content_length': sum(len(text) for text, _, _ in jobs if text),
+                'patterns_attempted': len(self.core_patterns) + len(self.extended_patterns) + len(self.avm_providers),
+                'patterns_skipped': 0,
             }
         }
 
-        if not page_content:
+        if not any(text for text, _, _ in jobs):
             result['extraction_metadata']['error'] = 'No content provided'
             return result
 
-        # Extract core patterns first
         core_matches = 0
-        for field, pattern in self.core_patterns.items():
-            matches = re.findall(pattern, page_content, re.IGNORECASE)
-            if matches:
-                # Handle tuple matches (from groups) vs string matches
-                if isinstance(matches[0], tuple):
-                    value = next(m for m in matches[0] if m) if matches[0] else None
-                else:
-                    value = matches[0]
+        extended_matches = 0
+        for text, fields, parse_avm in jobs:
+            if not text:
+                continue
 
-                if value:
-                    result['property_data'][field] = value.strip()
-                    core_matches += 1
-                    print(f"✅ Found {field}: {value}")
+            # One anchor scan, then a compiled first-match search per candidate pattern
+            matches, skipped = self.engine(fields).first_matches(text)
+            result['extraction_metadata']['patterns_skipped'] += skipped
 
-        # Extract extended patterns
-        extended_matches = 0
-        for field, pattern in self.extended_patterns.items():
-            matches = re.findall(pattern, page_content, re.IGNORECASE)
-            if matches:
-                # Handle tuple matches (from groups) vs string matches
-                if isinstance(matches[0], tuple):
-                    value = next(m for m in matches[0] if m) if matches[0] else None
+            for category, field, value in matches:
+                result['property_data'][field] = value.strip()
+                if category == 'core':
+                    core_matches += 1
                 else:
-                    value = matches[0]
-
-                if value:
-                    result['property_data'][field] = value.strip()
                     extended_matches += 1
-                    print(f"✅ Found {field}: {value}")
+                _emit(quiet, trace, f"✅ Found {field}: {value}", 'match', field, value)
+
+            # AVM provider values, typed, from one linear pass over the Home Value section
+            if parse_avm:
+                estimates = AVMSectionParser(self.avm_providers).parse(text)
+                result['avm_estimates'].extend(estimates)
+                for estimate in estimates:
+                    result['property_data'][estimate['field']] = estimate['text']
+                    extended_matches += 1
+                    _emit(quiet, trace, f"✅ Found {estimate['field']}: {estimate['provider']} {estimate['text']}",
+                          'avm', estimate['field'], estimate['value'])
 
         # Update metadata
         result['extraction_metadata']['core_patterns_matched'] = core_matches
@@ -153,7 +486,8 @@ class SmartPropertyExtractor:
                 # Override any detected property type with Single Family when inference suggests it
                 old_type = result['property_data'].get('property_type', 'None')
                 result['property_data']['property_type'] = 'Single Family'
-                print(f"✅ Overrode property_type: '{old_type}' -> 'Single Family' based on inference: '{result['property_data']['property_type_inferred']}'")
+                _emit(quiet, trace, f"✅ Overrode property_type: '{old_type}' -> 'Single Family' based on inference: '{result['property_data']['property_type_inferred']}'",
+                      'override', 'property_type', 'Single Family')
                 if old_type == 'None':
                     extended_matches += 1
                     result['extraction_metadata']['extended_patterns_matched'] = extended_matches
@@ -171,10 +505,76 @@ class SmartPropertyExtractor:
         """
         return self.extract_from_content(screenshot_text, min_fields=3)
 
-    def test_patterns(self, test_content: str) -> Dict:
+    def pattern_config(self) -> Dict:
+        """Picklable copy of the patterns, so pool workers extract exactly like this instance"""
+        return {
+            'core_patterns': dict(self.core_patterns),
+            'extended_patterns': dict(self.extended_patterns),
+            'pattern_anchors': {field: dict(spec) for field, spec in self.pattern_anchors.items()},
+            'avm_providers': dict(self.avm_providers),
+            'section_fields': {name: list(fields) for name, fields in self.section_fields.items()},
+        }
+
+    def extract_many(self, texts: Iterable[str], workers: Optional[int] = None, chunksize: Optional[int] = None,
+                     min_fields: int = 3, quiet: Optional[bool] = None) -> List[Dict]:
+        """
+        Extract many page texts on a process pool, results in input order
+
+        Texts are submitted in chunks (default: about four per worker) so the
+        pickling round trip is paid per chunk, not per page. Workers are kept
+        warm between calls with the patterns already compiled. With one worker
+        or one text, extraction runs inline.
+
+        Args:
+            texts: Page texts to extract
+            workers: Pool size (default: CPU count)
+            chunksize: Texts per submitted chunk
+            min_fields, quiet: As in extract_from_content
+        """
+        texts = list(texts)
+        workers = workers or os.cpu_count() or 1
+        quiet = is_quiet(quiet)
+        if workers <= 1 or len(texts) <= 1:
+            return [self.extract_from_content(text, min_fields, quiet) for text in texts]
+
+        chunksize = chunksize or max(1, math.ceil(len(texts) / (workers * 4)))
+        chunks = [texts[i:i + chunksize] for i in range(0, len(texts), chunksize)]
+        config = self.pattern_config()
+        pool = get_extraction_pool(workers)
+        results = []
+        n = len(chunks)
+        for chunk_results in pool.map(_extract_chunk, [config] * n, chunks, [min_fields] * n, [quiet] * n):
+            results.extend(chunk_results)
+        return results
+
+    async def extract_from_content_async(self, page_content: str, min_fields: int = 3,
+                                         workers: Optional[int] = None, quiet: Optional[bool] = None) -> Dict:
+        """
+        extract_from_content on the shared process pool, awaitable from an event loop
+
+        Keeps the regex work off the loop thread so Playwright I/O isn't stalled.
+        """
+        pool = get_extraction_pool(workers or os.cpu_count() or 1)
+        loop = asyncio.get_running_loop()
+        [result] = await loop.run_in_executor(pool, _extract_chunk, self.pattern_config(), [page_content],
+                                              min_fields, is_quiet(quiet))
+        return result
+
+    async def extract_from_sections_async(self, sections: Dict[str, Optional[str]], min_fields: int = 3,
+                                          workers: Optional[int] = None, quiet: Optional[bool] = None,
+                                          fallback: Optional[str] = None) -> Dict:
+        """extract_from_sections on the shared process pool (see extract_from_content_async)"""
+        pool = get_extraction_pool(workers or os.cpu_count() or 1)
+        loop = asyncio.get_running_loop()
+        [result] = await loop.run_in_executor(pool, _extract_chunk, self.pattern_config(), [(sections, fallback)],
+                                              min_fields, is_quiet(quiet))
+        return result
+
+    def test_patterns(self, test_content: str, quiet: Optional[bool] = None,
+                      trace: Optional[ExtractionTrace] = None) -> Dict:
         """
         Test all patterns against content and show what would match
-        Useful for debugging and pattern refinement
+        Useful for debugging and pattern refinement (quiet/trace as in extract_from_content)
         """
         test_results = {
             'core_patterns': {},
@@ -182,7 +582,8 @@ class SmartPropertyExtractor:
             'content_preview': test_content[:200] + '...' if len(test_content) > 200 else test_content
         }
 
-        print("🧪 Testing Core Patterns:")
+        if not is_quiet(quiet):
+            print("🧪 Testing Core Patterns:")
         for field, pattern in self.core_patterns.items():
             matches = re.findall(pattern, test_content, re.IGNORECASE)
             test_results['core_patterns'][field] = {
@@ -191,9 +592,11 @@ class SmartPropertyExtractor:
                 'found': len(matches) > 0
             }
             status = "✅" if matches else "❌"
-            print(f"  {status} {field}: {matches[:3] if matches else 'No matches'}")  # Show first 3
+            _emit(quiet, trace, f"  {status} {field}: {matches[:3] if matches else 'No matches'}",  # Show first 3
+                  'pattern_test', field, len(matches))
 
-        print("\n🧪 Testing Extended Patterns:")
+        if not is_quiet(quiet):
+            print("\n🧪 Testing Extended Patterns:")
         for field, pattern in self.extended_patterns.items():
             matches = re.findall(pattern, test_content, re.IGNORECASE)
             test_results['extended_patterns'][field] = {
@@ -202,11 +605,13 @@ class SmartPropertyExtractor:
                 'found': len(matches) > 0
             }
             status = "✅" if matches else "❌"
-            print(f"  {status} {field}: {matches[:2] if matches else 'No matches'}")  # Show first 2
+            _emit(quiet, trace, f"  {status} {field}: {matches[:2] if matches else 'No matches'}",  # Show first 2
+                  'pattern_test', field, len(matches))
 
         return test_results
 
-    def add_custom_pattern(self, field_name: str, pattern: str, category: str = 'extended'):
+    def add_custom_pattern(self, field_name: str, pattern: str, category: str = 'extended',
+                           anchors: Optional[Dict] = None, quiet: Optional[bool] = None):
         """
         Add custom extraction pattern for specific sites or data types
 
@@ -214,13 +619,53 @@ class SmartPropertyExtractor:
             field_name: Name of the field to extract
             pattern: Regular expression pattern
             category: 'core' or 'extended'
+            anchors: Optional {'any': [...], 'start': bool} literal anchors for the
+                pattern (see pattern_anchors); without them it is always searched
+            quiet: Suppress the confirmation print (default: the global setting)
         """
         if category == 'core':
             self.core_patterns[field_name] = pattern
         else:
             self.extended_patterns[field_name] = pattern
 
-        print(f"✅ Added {category} pattern for '{field_name}': {pattern}")
+        # Anchors of a replaced pattern don't describe the new one
+        self.pattern_anchors.pop(field_name, None)
+        if anchors:
+            self.pattern_anchors[field_name] = anchors
+
+        _emit(quiet, None, f"✅ Added {category} pattern for '{field_name}': {pattern}", 'pattern_added')
+
+
+# Warm extraction pools by size, reused across calls (and scraper instances)
+_POOLS = {}
+
+
+def _warm_worker():
+    """Pool initializer: compile the default patterns before the first chunk arrives"""
+    SmartPropertyExtractor().engine()
+
+
+def _extract_chunk(config: Dict, items: List, min_fields: int, quiet: bool) -> List[Dict]:
+    """Worker side: page texts go to extract_from_content, (sections, fallback) pairs to extract_from_sections"""
+    extractor = SmartPropertyExtractor()
+    for attribute, value in config.items():
+        setattr(extractor, attribute, value)
+    return [extractor.extract_from_content(item, min_fields, quiet) if isinstance(item, str)
+            else extractor.extract_from_sections(item[0], min_fields, quiet, fallback=item[1])
+            for item in items]
+
+
+def get_extraction_pool(workers: int) -> ProcessPoolExecutor:
+    """Process pool of ``workers`` pre-warmed extraction workers (created once per size)"""
+    if workers not in _POOLS:
+        _POOLS[workers] = ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker)
+    return _POOLS[workers]
+
+
+def shutdown_extraction_pools():
+    for pool in _POOLS.values():
+        pool.shutdown(wait=True, cancel_futures=True)
+    _POOLS.clear()
 
 
 def test_with_sample_content():
@@ -0,0 +1,318 @@
+"""
+Batch valuation pipeline.
+
+Runs a CSV/Parquet list of addresses through the same agents as the Streamlit
+"Analyze" button (NormalizerAgent -> fetchers -> AggregatorAgent -> AnalyzerAgent)
+with a global cap on in-flight addresses and per-site caps on concurrent fetches.
+
+Results are appended to a JSONL file one line per address as soon as each
+address finishes, so the output doubles as the checkpoint: re-running with the
+same output path skips every address that already has an 'ok' or 'invalid'
+record and retries the rest.
+
+    python -m avm_platform.batch addresses.csv results.jsonl --markets --concurrency 4
+
+Input columns: ``address`` (required), optional per-row ``purchase``, ``reno``
+and ``hold_months`` overriding DEFAULT_USER_INPUTS.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import time
+from pathlib import Path
+
+from avm_platform.agents.config import (
+    BRIGHT_DATA_API_TOKEN,
+    DEFAULT_ANALYSIS_SETTINGS,
+    DEFAULT_USER_INPUTS,
+    build_proxy,
+)
+from avm_platform.agents.normalizer import NormalizerAgent, property_key
+
+logger = logging.getLogger(__name__)
+
+SITES = ['zillow', 'redfin', 'homes', 'realtor', 'movoto']
+
+# Concurrent fetches allowed per site across the whole batch
+DEFAULT_SITE_LIMITS = {site: 2 for site in SITES}
+
+# Bright Data trigger batching for method='api'
+API_BATCH_WINDOW = float(os.getenv('BATCH_API_WINDOW', '2.0'))
+API_MAX_BATCH = int(os.getenv('BATCH_API_MAX_URLS', '50'))
+
+# Record statuses that count as done when resuming; 'error' records are retried
+COMPLETED_STATUSES = ('ok', 'invalid')
+
+
+def row_id(address):
+    """Checkpoint key for a raw input address (case/whitespace insensitive)"""
+    return ' '.join(str(address).split()).lower()
+
+
+def load_addresses(path, address_column='address'):
+    """Read a CSV or Parquet file into a list of row dicts with an 'address' key"""
+    import pandas as pd
+
+    path = Path(path)
+    if path.suffix.lower() in ('.parquet', '.pq'):
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(path)
+    if address_column not in df.columns:
+        raise ValueError(f"Input file {path} has no '{address_column}' column")
+
+    rows = []
+    for record in df.to_dict('records'):
+        address = record.get(address_column)
+        if not isinstance(address, str) or not address.strip():
+            continue
+        row = {'address': address.strip()}
+        for field in DEFAULT_USER_INPUTS:
+            value = record.get(field)
+            if value is not None and not (isinstance(value, float) and math.isnan(value)):
+                row[field] = value
+        rows.append(row)
+    return rows
+
+
+def filter_markets(rows, markets=None):
+    """Keep rows whose normalized 'City ST' is one of ``markets`` (default Config.MARKETS)"""
+    if markets is None:
+        from avm_platform.avm_platform.config import Config
+        markets = Config.MARKETS
+    wanted = {m.lower() for m in markets}
+    normalizer = NormalizerAgent()
+    kept = []
+    for row in rows:
+        address_dict = normalizer.normalize(row['address'])
+        if address_dict and f"{address_dict['city']} {address_dict['state']}".lower() in wanted:
+            kept.append(row)
+    return kept
+
+
+def read_checkpoint(output_path):
+    """Row ids already completed in an existing results file"""
+    done = set()
+    path = Path(output_path)
+    if not path.exists():
+        return done
+    with open(path) as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Partial line from a crash mid-write - that address is simply redone
+                continue
+            if record.get('status') in COMPLETED_STATUSES:
+                done.add(record['id'])
+    return done
+
+
+def _json_default(obj):
+    """Serialize numpy scalars/arrays coming out of the aggregator"""
+    if hasattr(obj, 'item'):
+        return obj.item()
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    return str(obj)
+
+
+class BatchValuationPipeline:
+    """Values many addresses concurrently, appending one JSONL record per address"""
+
+    def __init__(self, output_path, fetcher=None, scraper=None, method='browser', settings=None,
+                 concurrency=4, site_limits=None, address_timeout=600):
+        if method not in ('browser', 'api'):
+            raise ValueError(f"Unknown method '{method}' (expected 'browser' or 'api')")
+        if method == 'api' and scraper is None:
+            raise ValueError("method='api' needs a Bright Data scraper agent")
+        self.output_path = Path(output_path)
+        self.fetcher = fetcher
+        self.scraper = scraper
+        self.method = method
+        self.settings = settings or dict(DEFAULT_ANALYSIS_SETTINGS)
+        self.concurrency = concurrency
+        self.site_limits = DEFAULT_SITE_LIMITS if site_limits is None else site_limits
+        self.address_timeout = address_timeout
+        self.normalizer = NormalizerAgent()
+        self.stats = {'processed': 0, 'ok': 0, 'invalid': 0, 'error': 0, 'skipped': 0}
+
+    async def _collect(self, address_dict, limits):
+        """Gather per-site data the same way the Streamlit app does for each method"""
+        browser = self.fetcher.fetch_all(address_dict)
+        if self.method == 'browser':
+            return await browser
+
+        async def api_zillow():
+            if asyncio.iscoroutinefunction(self.scraper.scrape_zillow):
+                # Not held to the browser site limit: concurrent lookups coalesce into batched triggers
+                return await self.scraper.scrape_zillow(address_dict)
+            async with limits.get('zillow') or _NullLimit():
+                # The sync agent blocks on polling - keep it off the event loop
+                return await asyncio.to_thread(self.scraper.scrape_zillow, address_dict)
+
+        zillow_data, browser_data = await asyncio.gather(api_zillow(), browser, return_exceptions=True)
+        if isinstance(browser_data, Exception):
+            browser_data = {site: {'value': 'N/A', 'rent': 'N/A'} for site in SITES}
+        if isinstance(zillow_data, Exception):
+            zillow_data = {'value': 'API Error', 'rent': 'N/A'}
+        return {**browser_data, 'zillow': zillow_data}
+
+    async def value_address(self, row, limits=None):
+        """Run one input row through normalize -> fetch -> aggregate -> analyze"""
+        from avm_platform.agents.aggregator import AggregatorAgent
+        from avm_platform.agents.analyzer import AnalyzerAgent
+
+        record = {'id': row_id(row['address']), 'address': row['address']}
+        address_dict = self.normalizer.normalize(row['address'])
+        if not address_dict:
+            return {**record, 'status': 'invalid', 'error': 'Invalid address format'}
+        record.update(property_key=property_key(address_dict), normalized=address_dict)
+
+        data = await asyncio.wait_for(self._collect(address_dict, limits or {}), self.address_timeout)
+        aggregated, site_data = AggregatorAgent().aggregate(data)
+        user_inputs = {**DEFAULT_USER_INPUTS, **{k: row[k] for k in DEFAULT_USER_INPUTS if k in row}}
+        metrics = AnalyzerAgent(self.settings).analyze(aggregated, user_inputs)
+
+        record.update(
+            status='ok',
+            inputs=user_inputs,
+            aggregated={k: v for k, v in aggregated.items() if k != 'images'},
+            sites={site: {k: v for k, v in d.items() if k not in ('images', 'typed')} if isinstance(d, dict) else d
+                   for site, d in site_data.items()},
+            metrics=metrics,
+        )
+        return record
+
+    async def run(self, rows):
+        """Value every row not already in the output file; returns run stats"""
+        done = read_checkpoint(self.output_path)
+        pending, seen = [], set(done)
+        for row in rows:
+            key = row_id(row['address'])
+            if key in seen:
+                self.stats['skipped'] += 1
+                continue
+            seen.add(key)
+            pending.append(row)
+        logger.info(f"Batch: {len(pending)} addresses to value, {self.stats['skipped']} skipped (checkpoint/duplicates)")
+
+        # Semaphores are created here so they belong to the loop running the batch
+        gate = asyncio.Semaphore(self.concurrency)
+        limits = {site: asyncio.Semaphore(n) for site, n in self.site_limits.items()}
+        if self.fetcher is not None:
+            self.fetcher.site_limits = limits
+        write_lock = asyncio.Lock()
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(self.output_path, 'a') as out:
+            if out.tell() and not self.output_path.read_bytes().endswith(b'\n'):
+                # Terminate a line left half-written by a crash so the next record parses
+                out.write('\n')
+            async def worker(row):
+                async with gate:
+                    started = time.perf_counter()
+                    try:
+                        record = await self.value_address(row, limits)
+                    except Exception as e:
+                        logger.error(f"Batch: failed to value {row['address']}: {e!r}")
+                        record = {'id': row_id(row['address']), 'address': row['address'],
+                                  'status': 'error', 'error': repr(e)}
+                    record['elapsed_s'] = round(time.perf_counter() - started, 3)
+                async with write_lock:
+                    out.write(json.dumps(record, default=_json_default) + '\n')
+                    out.flush()
+                    self.stats['processed'] += 1
+                    self.stats[record['status']] += 1
+                    if self.stats['processed'] % 25 == 0:
+                        logger.info(f"Batch: {self.stats['processed']}/{len(pending)} done")
+
+            await asyncio.gather(*(worker(row) for row in pending))
+        return dict(self.stats)
+
+
+class _NullLimit:
+    """Stand-in for a missing per-site semaphore"""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def run_batch(input_path, output_path, method='browser', concurrency=4, site_limits=None, markets=False,
+              settings=None, cert_path=None, ignore_https_errors=False):
+    """Value every address in ``input_path``, appending results to ``output_path``.
+
+    ``markets`` may be True (filter to Config.MARKETS), a list of 'City ST'
+    strings, or False for no filtering. Returns the run stats.
+    """
+    from avm_platform.agents.bright_data import AsyncBrightDataScraperAgent
+    from avm_platform.agents.fetchers import SiteFetcherAgent, get_fetch_pool
+
+    rows = load_addresses(input_path)
+    if markets:
+        rows = filter_markets(rows, None if markets is True else markets)
+
+    proxy = build_proxy()
+    fetcher = SiteFetcherAgent(proxy, cert_path, ignore_https_errors)
+    scraper = None
+    if method == 'api':
+        # Coalesce the batch's dataset lookups into multi-URL triggers
+        scraper = AsyncBrightDataScraperAgent(BRIGHT_DATA_API_TOKEN, batch_window=API_BATCH_WINDOW,
+                                              max_batch=API_MAX_BATCH)
+    pipeline = BatchValuationPipeline(output_path, fetcher=fetcher, scraper=scraper, method=method,
+                                      settings=settings, concurrency=concurrency, site_limits=site_limits)
+    # Every address needs one pooled context, so size the pool to the batch concurrency
+    pool = get_fetch_pool(proxy, cert_path, ignore_https_errors, size=concurrency)
+    pool.start()
+
+    async def run():
+        try:
+            return await pipeline.run(rows)
+        finally:
+            if scraper is not None:
+                # Snapshots that outlived their wait were deferred - cache whatever has finished since
+                resolved = await scraper.resolve_deferred()
+                logger.info(f"Batch: resolved {resolved} deferred snapshots")
+                await scraper.aclose()
+
+    # The pipeline runs on the pool's loop: Playwright objects (and the httpx client) are bound to it
+    return pool.run(run())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Value a CSV/Parquet list of addresses")
+    parser.add_argument('input', help="CSV or Parquet file with an 'address' column")
+    parser.add_argument('output', help="JSONL results file (also the resume checkpoint)")
+    parser.add_argument('--method', choices=['browser', 'api'], default='browser')
+    parser.add_argument('--concurrency', type=int, default=int(os.getenv('BATCH_CONCURRENCY', '4')),
+                        help="addresses valued at once")
+    parser.add_argument('--site-limit', action='append', default=[], metavar='SITE=N',
+                        help="max concurrent fetches for one site, e.g. --site-limit zillow=1")
+    parser.add_argument('--markets', nargs='*', metavar='MARKET',
+                        help="only value addresses in these 'City ST' markets (default: Config.MARKETS)")
+    parser.add_argument('--cert-path')
+    parser.add_argument('--ignore-https-errors', action='store_true')
+    args = parser.parse_args(argv)
+
+    site_limits = dict(DEFAULT_SITE_LIMITS)
+    for item in args.site_limit:
+        site, _, n = item.partition('=')
+        site_limits[site.strip().lower()] = int(n)
+    markets = False if args.markets is None else (args.markets or True)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    stats = run_batch(args.input, args.output, method=args.method, concurrency=args.concurrency,
+                      site_limits=site_limits, markets=markets, cert_path=args.cert_path,
+                      ignore_https_errors=args.ignore_https_errors)
+    print(json.dumps(stats))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+Portfolio screening over many aggregated properties.
+
+Takes a DataFrame with one row per property - the aggregated ``value`` and
+``rent`` plus optional per-row ``purchase``, ``reno`` and ``hold_months`` (the
+DEFAULT_USER_INPUTS fill the gaps) - runs AnalyzerAgent's metrics for every
+row in one vectorized call, ranks the rows and flags the ones that clear the
+alert thresholds.
+
+    python -m avm_platform.portfolio results.jsonl --top 25 --threshold roi=25 --output ranked.csv
+
+where results.jsonl is the output of ``python -m avm_platform.batch``.
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from avm_platform.agents.analyzer import AnalyzerAgent
+from avm_platform.agents.config import DEFAULT_ANALYSIS_SETTINGS, DEFAULT_USER_INPUTS
+
+METRICS = ('net_profit', 'roi', 'cap_rate', 'cash_flow', 'cash_on_cash', 'irr', 'basis')
+
+# Ranking order: ROI first, ties broken by IRR, then cap rate
+DEFAULT_RANK_BY = ('roi', 'irr', 'cap_rate')
+
+
+def default_thresholds(settings):
+    """Alert thresholds from the analysis settings: the desired ROI and profit"""
+    return {'roi': settings['desired_roi'], 'net_profit': settings['desired_profit']}
+
+
+def load_batch_results(path):
+    """DataFrame of the 'ok' records in a batch results JSONL file, one row per property"""
+    rows = []
+    with open(path) as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get('status') != 'ok':
+                continue
+            aggregated = record.get('aggregated') or {}
+            rows.append({'id': record['id'], 'address': record['address'],
+                         'value': aggregated.get('value'), 'rent': aggregated.get('rent'),
+                         **(record.get('inputs') or {})})
+    return pd.DataFrame(rows)
+
+
+def analyze_portfolio(properties, settings=None, rank_by=DEFAULT_RANK_BY, thresholds=None):
+    """Metrics, ranks and alerts for every row of ``properties``.
+
+    Returns a copy with the filled-in inputs, one column per metric, ``rank_<metric>``
+    for each metric in ``rank_by`` (1 = best), the overall ``rank`` (rank_by
+    order, ties broken by the later metrics), ``alert`` (every threshold in
+    ``thresholds`` exceeded; default: desired ROI and profit from the settings).
+    Rows are sorted by ``rank``.
+    """
+    settings = settings or dict(DEFAULT_ANALYSIS_SETTINGS)
+    thresholds = default_thresholds(settings) if thresholds is None else thresholds
+    frame = properties.copy()
+    for field, default in DEFAULT_USER_INPUTS.items():
+        frame[field] = pd.to_numeric(frame[field], errors='coerce').fillna(default) if field in frame else default
+    arv, rent = (pd.to_numeric(frame[c], errors='coerce').fillna(0).to_numpy(float) if c in frame
+                 else np.zeros(len(frame)) for c in ('value', 'rent'))
+
+    metrics = AnalyzerAgent(settings).analyze_scenarios(
+        {'value': None, 'rent': None}, frame['purchase'].to_numpy(float), frame['reno'].to_numpy(float),
+        frame['hold_months'].to_numpy(float), arv=arv, rent=rent)
+    for name in METRICS:
+        frame[name] = metrics[name]
+
+    for name in rank_by:
+        frame[f"rank_{name}"] = frame[name].rank(ascending=False, method='min', na_option='bottom').astype(int)
+    order = frame.sort_values(list(rank_by), ascending=False, na_position='last', kind='stable').index
+    frame.loc[order, 'rank'] = np.arange(1, len(frame) + 1)
+    frame['rank'] = frame['rank'].astype(int)
+
+    frame['alert'] = np.logical_and.reduce([frame[name] > minimum for name, minimum in thresholds.items()]) \
+        if thresholds else False
+    return frame.sort_values('rank')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rank batch-valued properties and flag alerts")
+    parser.add_argument('results', help="JSONL output of avm_platform.batch")
+    parser.add_argument('--top', type=int, default=20, help="rows to print")
+    parser.add_argument('--threshold', action='append', default=[], metavar='METRIC=MIN',
+                        help="alert when METRIC exceeds MIN (repeatable; default desired ROI and profit)")
+    parser.add_argument('--output', help="write the full ranked table here (.csv or .parquet)")
+    args = parser.parse_args(argv)
+
+    thresholds = None
+    if args.threshold:
+        thresholds = {}
+        for item in args.threshold:
+            metric, _, minimum = item.partition('=')
+            thresholds[metric.strip()] = float(minimum)
+
+    portfolio = analyze_portfolio(load_batch_results(args.results), thresholds=thresholds)
+    if args.output:
+        output = Path(args.output)
+        if output.suffix.lower() in ('.parquet', '.pq'):
+            portfolio.to_parquet(output, index=False)
+        else:
+            portfolio.to_csv(output, index=False)
+    columns = [c for c in ('rank', 'address', 'value', 'rent', 'purchase', 'roi', 'irr', 'cap_rate', 'alert')
+               if c in portfolio]
+    print(portfolio[columns].head(args.top).to_string(index=False))
+    print(f"{int(portfolio['alert'].sum())}/{len(portfolio)} properties meet the alert thresholds")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,278 @@
+"""
+Warm Playwright browser pool shared by the site fetchers.
+
+Launching Chromium, creating a context and injecting the stealth script costs
+several seconds, so the pool keeps a small number of browser/context slots
+alive on a dedicated event loop thread and lends them out per lookup. Slots are
+health-checked on checkout and recycled after a navigation budget or a crash.
+"""
+
+import asyncio
+import atexit
+import logging
+import threading
+from contextlib import asynccontextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class _PoolSlot:
+    """One warm browser + context pair owned by the pool"""
+
+    def __init__(self, browser, context):
+        self.browser = browser
+        self.context = context
+        self.navigations = 0
+        self.leases = 0
+        self.crashed = False
+
+
+class BrowserPool:
+    """Long-lived pool of Playwright browser contexts.
+
+    All Playwright objects are bound to the pool's own event loop, which runs
+    in a daemon thread so the pool survives Streamlit reruns and repeated
+    ``asyncio.run`` calls. Use ``run()`` to execute a coroutine on that loop and
+    ``lease()`` inside it to borrow a context.
+    """
+
+    def __init__(self, launch_options=None, context_options=None, init_script=None,
+                 size=2, max_navigations=50, router=None, playwright_factory=None):
+        self.launch_options = launch_options or {}
+        # dict, or a callable returning a dict (e.g. to rotate the user agent per slot)
+        self.context_options = context_options or {}
+        self.init_script = init_script
+        self.size = max(1, int(size))
+        self.max_navigations = max_navigations
+        # Optional RequestRouter installed on every context (resource blocking + counters)
+        self.router = router
+        self._playwright_factory = playwright_factory
+        self._playwright = None
+        self._slots = []
+        self._idle = None
+        self._created = 0
+        self._loop = None
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self.stats = {'launches': 0, 'recycles': 0, 'crashes': 0, 'leases': 0}
+
+    # -- event loop ---------------------------------------------------------
+
+    @property
+    def thread(self):
+        """Thread running the pool's event loop (None until started)"""
+        return self._thread
+
+    def _ensure_loop(self):
+        with self._start_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever,
+                                                name="browser-pool", daemon=True)
+                self._thread.start()
+        return self._loop
+
+    def start(self):
+        """Start the pool's loop thread (browsers are still launched lazily on first lease)"""
+        self._ensure_loop()
+        return self
+
+    def run(self, coro, timeout=None):
+        """Run a coroutine on the pool's loop from synchronous code and return its result"""
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        return future.result(timeout)
+
+    # -- slot lifecycle -----------------------------------------------------
+
+    async def _ensure_playwright(self):
+        if self._playwright is None:
+            factory = self._playwright_factory
+            if factory is None:
+                from playwright.async_api import async_playwright
+                factory = lambda: async_playwright().start()
+            self._playwright = await factory()
+        return self._playwright
+
+    async def _launch_slot(self):
+        playwright = await self._ensure_playwright()
+        browser = await playwright.chromium.launch(**self.launch_options)
+        options = self.context_options() if callable(self.context_options) else dict(self.context_options)
+        context = await browser.new_context(**options)
+        if self.init_script:
+            await context.add_init_script(self.init_script)
+        if self.router is not None:
+            await self.router.install(context)
+        slot = _PoolSlot(browser, context)
+
+        def on_disconnected(*_):
+            slot.crashed = True
+
+        def on_page(page):
+            def on_navigated(frame):
+                if frame == page.main_frame:
+                    slot.navigations += 1
+            page.on('framenavigated', on_navigated)
+            page.on('crash', on_disconnected)
+
+        browser.on('disconnected', on_disconnected)
+        context.on('page', on_page)
+        self.stats['launches'] += 1
+        return slot
+
+    def _is_healthy(self, slot):
+        if slot.crashed:
+            return False
+        try:
+            if not slot.browser.is_connected():
+                return False
+        except Exception:
+            return False
+        if self.max_navigations and slot.navigations >= self.max_navigations:
+            return False
+        return True
+
+    async def _dispose(self, slot):
+        try:
+            await slot.context.close()
+        except Exception:
+            pass
+        try:
+            await slot.browser.close()
+        except Exception:
+            pass
+
+    async def _checkout(self):
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+        if self._idle.empty() and self._created < self.size:
+            self._created += 1
+            try:
+                slot = await self._launch_slot()
+            except Exception:
+                self._created -= 1
+                raise
+            self._slots.append(slot)
+        else:
+            slot = await self._idle.get()
+
+        if not self._is_healthy(slot):
+            if slot.crashed:
+                self.stats['crashes'] += 1
+                logger.warning("Browser pool slot crashed - relaunching")
+            else:
+                logger.info(f"Browser pool slot reached {slot.navigations} navigations - recycling")
+            self.stats['recycles'] += 1
+            self._slots.remove(slot)
+            await self._dispose(slot)
+            try:
+                slot = await self._launch_slot()
+            except Exception:
+                self._created -= 1
+                raise
+            self._slots.append(slot)
+        return slot
+
+    async def _checkin(self, slot):
+        if self._created > self.size:
+            # The pool was shrunk while this slot was out - retire it instead of returning it
+            self._created -= 1
+            self._slots.remove(slot)
+            await self._dispose(slot)
+            return
+        # Leave the context clean for the next borrower
+        for page in list(getattr(slot.context, 'pages', [])):
+            try:
+                await page.close()
+            except Exception:
+                slot.crashed = True
+        self._idle.put_nowait(slot)
+
+    def resize(self, size):
+        """Change the number of slots from synchronous code: growing launches lazily, shrinking retires
+        idle slots now and leased ones as they come back"""
+        self.size = max(1, int(size))
+        if self._loop is not None and self._idle is not None:
+            self.run(self._retire_idle())
+
+    async def _retire_idle(self):
+        while self._created > self.size and not self._idle.empty():
+            slot = self._idle.get_nowait()
+            self._created -= 1
+            self._slots.remove(slot)
+            await self._dispose(slot)
+
+    @asynccontextmanager
+    async def lease(self):
+        """Borrow a warm browser context for the duration of one lookup"""
+        if self._loop is not None and asyncio.get_running_loop() is not self._loop:
+            raise RuntimeError("BrowserPool.lease() must run on the pool loop - use BrowserPool.run()")
+        slot = await self._checkout()
+        slot.leases += 1
+        self.stats['leases'] += 1
+        try:
+            yield slot.context
+        except Exception:
+            # Anything escaping the lease may have left the browser in a bad state
+            slot.crashed = True
+            raise
+        finally:
+            await self._checkin(slot)
+
+    # -- shutdown -----------------------------------------------------------
+
+    async def aclose(self):
+        """Close every browser and stop Playwright"""
+        slots, self._slots = self._slots, []
+        for slot in slots:
+            await self._dispose(slot)
+        self._idle = None
+        self._created = 0
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+    def close(self):
+        """Shut the pool down from synchronous code and stop its loop thread"""
+        if self._loop is None:
+            return
+        try:
+            self.run(self.aclose(), timeout=30)
+        except Exception as e:
+            logger.error(f"Browser pool shutdown error: {e}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop = None
+        self._thread = None
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_browser_pool(key, factory, size=None):
+    """Return the process-wide pool registered under ``key``, creating it with ``factory()``.
+
+    With ``size``, an already registered pool of a different size is resized to it.
+    """
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = factory()
+            _pools[key] = pool
+    if size is not None and pool.size != max(1, int(size)):
+        pool.resize(size)
+    return pool
+
+
+@atexit.register
+def close_all_pools():
+    """Close every registered pool (called automatically at interpreter exit)"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -0,0 +1,173 @@
+"""
+Single-round-trip DOM field extraction for the browser fetchers.
+
+Each site is described by a declarative spec (field -> ordered fallback rules,
+plus an image rule) which is compiled once into a self-contained script, so a
+fetcher reads every field and image in one ``page.evaluate`` instead of one CDP
+round trip per field.
+
+Rule forms:
+    'css selector'                          -> innerText of document.querySelector(...)
+    {'label': 'Year Built', 'cells': 'td'}  -> innerText of the cell after the first
+                                               cell whose text contains the label
+Rules are tried in order; the first non-empty text wins, otherwise the field is None.
+"""
+
+import json
+
+SITE_FIELD_SPECS = {
+    'zillow': {
+        'fields': {
+            'value': ['[data-testid="primary-zestimate"], [data-testid="price"], .notranslate'],
+            'rent': ['[data-testid="rent-zestimate-value"], [data-testid="rent-estimate"]'],
+            'beds': ['[data-testid="bedroom-amount"], [data-testid="bed-value"]'],
+            'baths': ['[data-testid="bathroom-amount"], [data-testid="bath-value"]'],
+            'sqft': ['[data-testid="floor-space-amount"], [data-testid="sqft-value"]'],
+            'year': ['span[data-testid="year-built"]'],
+            'taxes': ['[data-testid="property-tax"]'],
+            'last_sold': ['.last-sold'],
+        },
+        'images': {'selector': 'img[alt="Gallery Image"]', 'attribute': True},
+    },
+    'redfin': {
+        'fields': {
+            'value': ['[data-rf-test-name=avm-price]', '.avm-value'],
+            'rent': ['[data-rf-test-name=rent-estimate]'],
+            'beds': ['[data-rf-test-name=bedroom-count]'],
+            'baths': ['[data-rf-test-name=bathroom-count]'],
+            'sqft': ['[data-rf-test-name=square-footage]'],
+            'year': [{'label': 'Year Built', 'cells': '.facts-table td'}],
+            'taxes': [{'label': 'Tax', 'cells': '.facts-table td'}],
+            'last_sold': [{'label': 'Sold', 'cells': '.facts-table td'}],
+        },
+        'images': {'selector': 'img[src*="ssl.cdn-redfin.com"]', 'limit': 5},
+    },
+    'homes': {
+        'fields': {
+            'value': ['.estimated-value, .price, .current-price'],
+            'rent': ['.estimated-rent, .rent-estimate'],
+            'beds': [".beds, .bedroom-count, [data-label='beds'], .fact-beds"],
+            'baths': [".baths, .bathroom-count, [data-label='baths'], .fact-baths"],
+            'sqft': [".sqft, .square-feet, [data-label='sqft'], .fact-sqft"],
+            'year': [".year-built, [data-label='year'], .fact-year"],
+            'taxes': ['.taxes, .property-tax, .tax-amount'],
+            'last_sold': ['.last-sold, .sold-date, .sale-history'],
+        },
+        'images': {'selector': 'img[src*="homes.com"], .property-image img, .gallery img',
+                   'exclude': ['icon'], 'limit': 5},
+    },
+    'realtor': {
+        'fields': {
+            'value': ['[data-testid=current-estimate], [data-testid=card-price], .price, .ldp-price'],
+            'rent': ['[data-testid=rent-estimate], .rent-estimate, .rental-estimate'],
+            'beds': ['[data-testid=property-meta-beds] span, [data-testid=bed-count], .beds'],
+            'baths': ['[data-testid=property-meta-baths] span, [data-testid=bath-count], .baths'],
+            'sqft': ['[data-testid=property-meta-sqft] span, [data-testid=sqft], .sqft'],
+            'year': ['[data-testid=property-meta-year-built] span, [data-testid=year-built], .year-built'],
+            'taxes': ['.property-tax, .taxes, .tax-amount'],
+            'last_sold': ['.last-sold, .sold-date, .sale-date'],
+        },
+        'images': {'selector': 'img[src*="realtor.com"], .gallery img, .photo-gallery img',
+                   'exclude': ['icon'], 'limit': 5},
+    },
+    'movoto': {
+        'fields': {
+            'value': ['.price, .estimated-value, .listing-price, .home-price'],
+            'rent': ['.rent-estimate, .rental-estimate'],
+            'beds': ['.beds, .bedrooms, .bed-count'],
+            'baths': ['.baths, .bathrooms, .bath-count'],
+            'sqft': ['.sqft, .square-feet, .area'],
+            'year': ['.year-built, .build-year'],
+            'taxes': ['.taxes, .property-tax, .tax-info'],
+            'last_sold': ['.last-sold, .sold-date, .sale-date'],
+        },
+        'images': {'selector': 'img[src*="movoto"], .property-image img, .photo img',
+                   'exclude': ['icon'], 'limit': 5},
+    },
+    # List spec: one record per matching item, rules evaluated inside the item
+    'redfin_comps': {
+        'items': '.result-card, .listing-result, .soldResult',
+        'limit': 5,
+        'default': 'N/A',
+        'required': 'address',
+        'fields': {
+            'address': ['.address, .listing-address'],
+            'sold_price': ['.price, .sold-price'],
+            'details': ['.bed-bath-sqft-data, .property-details'],
+            'sold_date': ['.sold-date, .status-date'],
+        },
+    },
+}
+
+# Runtime shared by every compiled spec. Bad selectors are swallowed per rule so
+# one stale selector can't take down the whole extraction.
+_RUNTIME = r"""
+(spec) => {
+    const text = (el) => (el && el.innerText) || null;
+    const query = (root, selector) => { try { return root.querySelector(selector); } catch (e) { return null; } };
+    const queryAll = (root, selector) => { try { return Array.from(root.querySelectorAll(selector)); } catch (e) { return []; } };
+    const pick = (root, rules) => {
+        for (const rule of rules) {
+            let value = null;
+            if (typeof rule === 'string') {
+                value = text(query(root, rule));
+            } else if (rule.label) {
+                const cell = queryAll(root, rule.cells).find(td => (td.innerText || '').includes(rule.label));
+                value = cell ? text(cell.nextElementSibling) : null;
+            }
+            if (value) return value;
+        }
+        return null;
+    };
+    const pickAll = (root, fields, fallback) => {
+        const out = {};
+        for (const [name, rules] of Object.entries(fields)) {
+            const value = pick(root, rules);
+            out[name] = value === null ? fallback : value;
+        }
+        return out;
+    };
+    if (spec.items) {
+        const records = queryAll(document, spec.items).slice(0, spec.limit || undefined)
+            .map(item => pickAll(item, spec.fields, spec.default === undefined ? null : spec.default));
+        return spec.required ? records.filter(r => r[spec.required] !== spec.default) : records;
+    }
+    const result = pickAll(document, spec.fields, null);
+    if (spec.images) {
+        const rule = spec.images;
+        let srcs = queryAll(document, rule.selector).map(img => rule.attribute ? img.getAttribute('src') : img.src);
+        srcs = srcs.filter(src => src && !(rule.exclude || []).some(s => src.includes(s))
+                                     && (rule.require || []).every(s => src.includes(s)));
+        result.images = rule.limit ? srcs.slice(0, rule.limit) : srcs;
+    }
+    return result;
+}
+"""
+
+_compiled = {}
+
+
+def compile_spec(spec):
+    """Compile a site spec into a zero-argument script for ``page.evaluate``"""
+    return f"() => ({_RUNTIME.strip()})({json.dumps(spec)})"
+
+
+def compiled_script(site, specs=None):
+    """Compiled script for ``site`` (cached for the built-in specs)"""
+    if specs is not None:
+        return compile_spec(specs[site])
+    if site not in _compiled:
+        _compiled[site] = compile_spec(SITE_FIELD_SPECS[site])
+    return _compiled[site]
+
+
+async def extract_fields(page, site, specs=None):
+    """Read every field (and images) for ``site`` in a single evaluate round trip"""
+    result = await page.evaluate(compiled_script(site, specs))
+    return result or {}
+
+
+async def extract_records(page, site, specs=None):
+    """Read a list spec (e.g. search-result cards) as a list of records in one evaluate"""
+    records = await page.evaluate(compiled_script(site, specs))
+    return records or []
@@ -0,0 +1,195 @@
+"""
+Event-driven page readiness waits for the site fetchers.
+
+Instead of sleeping a fixed random 5-10s after every navigation, each fetcher
+waits for the selectors / network responses its site actually needs, bounded by
+a per-site budget, plus an optional small jitter floor so we stay polite. Every
+wait is recorded against the expected length of the old fixed sleep so the
+time saved can be reported in the fetch result metadata.
+"""
+
+import asyncio
+import logging
+import random
+import time
+
+logger = logging.getLogger(__name__)
+
+# Per-site readiness specs. ``legacy_wait`` is the expected value of the fixed
+# sleeps the stage used to do and is only used for time-saved accounting.
+SITE_READINESS = {
+    'zillow': {
+        'max_wait': 12.0,
+        'jitter': (0.5, 1.5),
+        'stages': {
+            'detail': {
+                'selectors': ['[data-testid="primary-zestimate"]', '[data-testid="price"]', '[data-testid="bedroom-amount"]'],
+                'responses': ['zillow.com/graphql'],
+                'legacy_wait': 7.5,
+            },
+        },
+    },
+    'redfin': {
+        'max_wait': 12.0,
+        'jitter': (0.5, 1.5),
+        'stages': {
+            'search': {
+                'selectors': ['[data-rf-test-id="listing-link"] a', 'a[href*="/home/"]', '.listing-result a'],
+                'responses': ['/stingray/api/gis'],
+                'legacy_wait': 7.5,
+            },
+            'detail': {
+                'selectors': ['[data-rf-test-name=avm-price]', '.avm-value', '[data-rf-test-name=bedroom-count]', '.facts-table'],
+                'responses': ['/stingray/api/home/details'],
+                'legacy_wait': 6.0,
+            },
+        },
+    },
+    'homes': {
+        'max_wait': 12.0,
+        'jitter': (0.5, 1.5),
+        'stages': {
+            'search': {
+                'selectors': ['a[href*="/property/"]', '.property-card a', '.listing-card a'],
+                'responses': [],
+                'legacy_wait': 7.5,
+            },
+            'detail': {
+                'selectors': ['.estimated-value', '.price', '.current-price', '.beds', '.bedroom-count'],
+                'responses': [],
+                'legacy_wait': 6.0,
+            },
+        },
+    },
+    'realtor': {
+        'max_wait': 10.0,
+        'jitter': (0.5, 1.0),
+        'stages': {
+            'direct': {
+                'selectors': ['[data-testid=current-estimate]', '[data-testid=card-price]', '.price', '.ldp-price'],
+                'responses': [],
+                'legacy_wait': 4.5,
+            },
+            'search': {
+                'selectors': ['a[href*="/realestateandhomes-detail/"]'],
+                'responses': [],
+                'legacy_wait': 6.5,
+            },
+            'detail': {
+                'selectors': ['[data-testid=current-estimate]', '[data-testid=card-price]', '.price', '.ldp-price'],
+                'responses': [],
+                'legacy_wait': 5.5,
+            },
+        },
+    },
+    'movoto': {
+        'max_wait': 10.0,
+        'jitter': (0.5, 1.0),
+        'stages': {
+            'detail': {
+                'selectors': ['.price', '.estimated-value', '.listing-price', '.home-price'],
+                'responses': [],
+                'legacy_wait': 5.0,
+            },
+        },
+    },
+}
+
+# Post-scroll settle: give lazy-loaded sections a short chance to go network-idle
+SCROLL_SETTLE_MAX_WAIT = 1.5
+SCROLL_SETTLE_LEGACY_WAIT = 1.5
+
+
+class ReadinessWaiter:
+    """Waits for one site's pages to be ready and keeps the timing ledger for a single fetch"""
+
+    def __init__(self, site, specs=None, jitter=True, clock=time.monotonic):
+        self.site = site
+        self.spec = (specs or SITE_READINESS)[site]
+        self.jitter = jitter
+        self.clock = clock
+        self.stages = []
+
+    async def _first_ready(self, waiters, budget):
+        """Wait until any waiter succeeds, all fail, or the budget runs out"""
+        pending = set(waiters)
+        deadline = self.clock() + budget
+        ready = False
+        try:
+            while pending and not ready:
+                remaining = deadline - self.clock()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(pending, timeout=remaining,
+                                                   return_when=asyncio.FIRST_COMPLETED)
+                ready = any(not task.cancelled() and task.exception() is None for task in done)
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        return ready
+
+    async def wait(self, page, stage):
+        """Wait for ``stage`` of this site to be ready; returns True if a readiness signal fired"""
+        stage_spec = self.spec['stages'][stage]
+        budget = stage_spec.get('max_wait', self.spec['max_wait'])
+        start = self.clock()
+
+        waiters = []
+        if stage_spec.get('selectors'):
+            waiters.append(asyncio.ensure_future(page.wait_for_selector(
+                ', '.join(stage_spec['selectors']), state='attached', timeout=budget * 1000)))
+        if stage_spec.get('responses'):
+            patterns = stage_spec['responses']
+            waiters.append(asyncio.ensure_future(page.wait_for_response(
+                lambda response: response.status < 400 and any(p in response.url for p in patterns),
+                timeout=budget * 1000)))
+
+        ready = await self._first_ready(waiters, budget) if waiters else False
+        if not ready:
+            logger.warning(f"{self.site} {stage}: no readiness signal within {budget}s")
+
+        await self._jitter_floor(start)
+        self._record(stage, start, stage_spec['legacy_wait'], ready)
+        return ready
+
+    async def settle(self, page):
+        """Short network-idle wait after a human-like scroll, replacing the fixed 1-3s sleeps"""
+        start = self.clock()
+        ready = True
+        try:
+            await page.wait_for_load_state('networkidle', timeout=SCROLL_SETTLE_MAX_WAIT * 1000)
+        except Exception:
+            # Pages with long-polling trackers never go idle - the cap is the wait
+            ready = False
+        self._record('scroll', start, SCROLL_SETTLE_LEGACY_WAIT, ready)
+        return ready
+
+    async def _jitter_floor(self, start):
+        if not self.jitter:
+            return
+        low, high = self.spec.get('jitter', (0.0, 0.0))
+        floor = random.uniform(low, high)
+        remaining = floor - (self.clock() - start)
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+
+    def _record(self, stage, start, legacy_wait, ready):
+        self.stages.append({
+            'stage': stage,
+            'waited_s': round(self.clock() - start, 3),
+            'legacy_wait_s': legacy_wait,
+            'ready': ready,
+        })
+
+    def metadata(self):
+        """Timing summary for the fetch result: total waited vs. the old fixed-sleep budget"""
+        waited = sum(s['waited_s'] for s in self.stages)
+        legacy = sum(s['legacy_wait_s'] for s in self.stages)
+        return {
+            'waited_s': round(waited, 3),
+            'legacy_wait_s': round(legacy, 3),
+            'time_saved_s': round(legacy - waited, 3),
+            'stages': list(self.stages),
+        }
@@ -0,0 +1,158 @@
+"""
+Request interception for scraping contexts.
+
+We only read DOM text and image ``src`` attributes, so downloading images,
+fonts, video and analytics beacons through the paid residential proxy is pure
+cost. ``RequestRouter`` is installed on every pooled context and aborts requests
+by resource type and domain, using per-site allow/deny lists keyed by the host
+of the page making the request. Blocked requests are counted with an estimated
+transfer size so we can see what the blocking saves.
+"""
+
+import logging
+import weakref
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Analytics / ad / session-replay hosts that never carry property data
+TRACKER_DOMAINS = [
+    'google-analytics.com',
+    'googletagmanager.com',
+    'googlesyndication.com',
+    'doubleclick.net',
+    'adservice.google.com',
+    'facebook.net',
+    'connect.facebook.net',
+    'hotjar.com',
+    'segment.io',
+    'segment.com',
+    'nr-data.net',
+    'newrelic.com',
+    'quantserve.com',
+    'scorecardresearch.com',
+    'criteo.com',
+    'adsrvr.org',
+    'bat.bing.com',
+    'tiktok.com',
+    'pinterest.com',
+    'optimizely.com',
+    'fullstory.com',
+]
+
+# Anti-bot challenge providers must always load or the page never renders
+ANTI_BOT_DOMAINS = ['px-cdn.net', 'px-cloud.net', 'perimeterx.net', 'captcha-delivery.com', 'hcaptcha.com']
+
+DEFAULT_ROUTING = {
+    'block_types': ['image', 'media', 'font'],
+    'block_domains': TRACKER_DOMAINS,
+    'allow_domains': ANTI_BOT_DOMAINS,
+}
+
+# Per-site overrides, keyed by the host suffix of the page making the request.
+# Keys not given fall back to DEFAULT_ROUTING, e.g. {'block_types': ['image', 'media']}
+# to let a site's fonts through.
+SITE_ROUTING = {
+    'zillow.com': {},
+    'redfin.com': {},
+    'homes.com': {},
+    'realtor.com': {},
+    'movoto.com': {},
+}
+
+# Typical transfer sizes, used to estimate bytes saved for requests never made
+ESTIMATED_BYTES = {
+    'image': 80_000,
+    'media': 500_000,
+    'font': 40_000,
+    'stylesheet': 30_000,
+    'script': 60_000,
+    'xhr': 5_000,
+    'fetch': 5_000,
+    'other': 5_000,
+}
+
+
+def _host_matches(host, domains):
+    return any(host == d or host.endswith('.' + d) for d in domains)
+
+
+def _new_stats():
+    return {'blocked_requests': 0, 'allowed_requests': 0, 'bytes_saved': 0, 'blocked_by_type': {}}
+
+
+class RequestRouter:
+    """Aborts unneeded requests on a browser context and keeps bytes-saved counters"""
+
+    def __init__(self, site_routing=None, default=None):
+        self.site_routing = SITE_ROUTING if site_routing is None else site_routing
+        self.default = DEFAULT_ROUTING if default is None else default
+        self.stats = _new_stats()
+        self._page_stats = weakref.WeakKeyDictionary()
+
+    def policy_for(self, page_url):
+        """Routing policy for requests made by a page at ``page_url``"""
+        host = urlparse(page_url or '').hostname or ''
+        for suffix, overrides in self.site_routing.items():
+            if _host_matches(host, [suffix]):
+                return {**self.default, **overrides}
+        return self.default
+
+    def should_block(self, url, resource_type, page_url=None):
+        """Decide whether a request should be aborted (allow list wins over both deny lists)"""
+        policy = self.policy_for(page_url)
+        host = urlparse(url).hostname or ''
+        if _host_matches(host, policy.get('allow_domains', [])):
+            return False
+        if resource_type == 'document':
+            # Never block navigations - the fetcher needs the page itself
+            return False
+        if resource_type in policy.get('block_types', []):
+            return True
+        return _host_matches(host, policy.get('block_domains', []))
+
+    def _record(self, page, blocked, resource_type):
+        targets = [self.stats]
+        if page is not None:
+            try:
+                targets.append(self._page_stats.setdefault(page, _new_stats()))
+            except TypeError:
+                pass
+        for stats in targets:
+            if blocked:
+                stats['blocked_requests'] += 1
+                stats['bytes_saved'] += ESTIMATED_BYTES.get(resource_type, ESTIMATED_BYTES['other'])
+                stats['blocked_by_type'][resource_type] = stats['blocked_by_type'].get(resource_type, 0) + 1
+            else:
+                stats['allowed_requests'] += 1
+
+    async def handle(self, route, request):
+        """Playwright route handler"""
+        page = None
+        page_url = None
+        try:
+            page = request.frame.page
+            page_url = page.url
+        except Exception:
+            # Service worker requests have no frame - judge them on their own URL
+            pass
+        resource_type = request.resource_type
+        blocked = self.should_block(request.url, resource_type, page_url)
+        self._record(page, blocked, resource_type)
+        try:
+            if blocked:
+                await route.abort('blockedbyclient')
+            else:
+                await route.continue_()
+        except Exception as e:
+            # Route already handled (page closed mid-request) - nothing to do
+            logger.debug(f"Route handling skipped for {request.url}: {e}")
+
+    async def install(self, context):
+        """Attach the router to a browser context"""
+        await context.route('**/*', self.handle)
+
+    def page_stats(self, page):
+        """Counters for requests made by one page (e.g. one site fetch)"""
+        stats = self._page_stats.get(page)
+        return dict(stats, blocked_by_type=dict(stats['blocked_by_type'])) if stats else _new_stats()
@@ -0,0 +1,67 @@
+"""
+Offline fixture corpus for the extraction benchmarks.
+
+Each fixture is a directory under ``benchmarks/fixtures/``:
+
+    <site>-<address-slug>[-variant]/
+        expected.json   site, address, source, and the expected values per extractor:
+                        'smart' (SmartPropertyExtractor property_data fields) and
+                        optionally 'dom' (extract_fields fields, None = absent) and
+                        'images' (expected image count)
+        page.txt        visible page text, as fed to extract_from_content
+        page.html       optional rendered page for the DOM extractors
+        sections.json   optional landmark section -> text, as scrape_property's scoped
+                        mode reads them (SmartPropertyExtractor.extract_from_sections)
+
+Fields an extractor returns that are not in ``expected`` are reported but not scored.
+"""
+
+import json
+from pathlib import Path
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+class Fixture:
+    """One saved page plus its expected fields"""
+
+    def __init__(self, name, path, expected):
+        self.name = name
+        self.path = Path(path)
+        self.expected = expected
+        self.site = expected['site']
+
+    @property
+    def text_path(self):
+        return self.path / "page.txt"
+
+    @property
+    def html_path(self):
+        path = self.path / "page.html"
+        return path if path.exists() else None
+
+    @property
+    def sections_path(self):
+        path = self.path / "sections.json"
+        return path if path.exists() else None
+
+    def text(self):
+        return self.text_path.read_text()
+
+    def sections(self):
+        return json.loads(self.sections_path.read_text()) if self.sections_path else None
+
+    def __repr__(self):
+        return f"Fixture({self.name!r})"
+
+
+def load_corpus(root=FIXTURES_DIR, sites=None):
+    """All fixtures under ``root`` (sorted by name), optionally limited to ``sites``"""
+    fixtures = []
+    for expected_path in sorted(Path(root).glob("*/expected.json")):
+        fixture = Fixture(expected_path.parent.name, expected_path.parent, json.loads(expected_path.read_text()))
+        if not fixture.text_path.exists():
+            raise FileNotFoundError(f"Fixture {fixture.name} has no page.txt")
+        if sites is None or fixture.site in sites:
+            fixtures.append(fixture)
+    return fixtures
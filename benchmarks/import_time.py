@@ -0,0 +1,122 @@
+"""
+Import cost of the Streamlit app.
+
+Streamlit re-executes app.py on every widget interaction, so whatever the
+script imports at module level is paid on the cold start of every server
+process (and by anything that imports the app's agents, tests included).
+This runs app.py's import statements, without the rest of the script, in a
+fresh interpreter and reports:
+
+    startup_s   module-level imports, cold (what the first page load waits on)
+    rerun_s     the same imports again in the warm process (every rerun)
+    analyze_s   the imports app.py defers to the Analyze click, after startup
+    heavy       which of HEAVY_MODULES the module-level imports pulled in
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --runs 10 --json > baseline.json
+    python -m benchmarks.import_time --baseline baseline.json --tolerance 0.2
+
+``--root`` points at another checkout (e.g. a git worktree of an older
+commit) to measure its app.py for a before/after comparison.
+"""
+
+import argparse
+import ast
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules worth keeping off the startup path (import time alone is 50-900 ms each)
+HEAVY_MODULES = ('pandas', 'matplotlib', 'httpx', 'requests', 'playwright', 'numpy_financial')
+
+_PROBE = """
+import json, sys, time
+startup, deferred = json.loads(sys.argv[1])
+timings = {}
+started = time.perf_counter()
+exec(compile(startup, 'app.py', 'exec'), {})
+timings['startup_s'] = time.perf_counter() - started
+heavy = [name for name in json.loads(sys.argv[2]) if name in sys.modules]
+started = time.perf_counter()
+exec(compile(startup, 'app.py', 'exec'), {})
+timings['rerun_s'] = time.perf_counter() - started
+started = time.perf_counter()
+exec(compile(deferred, 'app.py', 'exec'), {})
+timings['analyze_s'] = time.perf_counter() - started
+print(json.dumps({**timings, 'heavy': heavy}))
+"""
+
+
+def app_imports(path):
+    """(module-level, deferred) import statements of a script, as source text"""
+    tree = ast.parse(Path(path).read_text())
+    imports = (ast.Import, ast.ImportFrom)
+    startup = [node for node in tree.body if isinstance(node, imports)]
+    deferred = [node for node in ast.walk(tree) if isinstance(node, imports) and node not in startup]
+    return tuple(ast.unparse(ast.Module(body=nodes, type_ignores=[])) for nodes in (startup, deferred))
+
+
+def measure(root=ROOT, runs=5):
+    """Median timings over ``runs`` fresh interpreters importing ``root``/app.py's modules"""
+    root = Path(root)
+    startup, deferred = app_imports(root / 'app.py')
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join(filter(None, [str(root), os.environ.get('PYTHONPATH')]))}
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', _PROBE, json.dumps([startup, deferred]),
+                                 json.dumps(HEAVY_MODULES)],
+                                cwd=root, env=env, capture_output=True, text=True, check=True).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    report = {'root': str(root), 'runs': runs, 'heavy': samples[-1]['heavy']}
+    for key in ('startup_s', 'rerun_s', 'analyze_s'):
+        report[key] = statistics.median(sample[key] for sample in samples)
+    return report
+
+
+def compare_to_baseline(report, baseline, tolerance=0.2):
+    """Regressions of ``report`` against a saved baseline, as human-readable strings"""
+    regressions = []
+    if report['startup_s'] > baseline['startup_s'] * (1 + tolerance):
+        regressions.append(f"startup {report['startup_s']:.3f} s > baseline {baseline['startup_s']:.3f} s "
+                           f"+{tolerance:.0%}")
+    added = sorted(set(report['heavy']) - set(baseline['heavy']))
+    if added:
+        regressions.append(f"startup now imports {', '.join(added)}")
+    return regressions
+
+
+def format_report(report):
+    return '\n'.join([
+        f"{report['root']}/app.py ({report['runs']} runs, median)",
+        f"  startup imports  {report['startup_s'] * 1000:8.1f} ms   heavy: {', '.join(report['heavy']) or 'none'}",
+        f"  rerun imports    {report['rerun_s'] * 1000:8.1f} ms",
+        f"  Analyze imports  {report['analyze_s'] * 1000:8.1f} ms",
+    ])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark app.py's import time")
+    parser.add_argument("--root", default=str(ROOT), help="checkout whose app.py to measure")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters to take the median over")
+    parser.add_argument("--json", action='store_true', help="print the report as JSON")
+    parser.add_argument("--baseline", help="saved --json output to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed startup time growth vs baseline")
+    args = parser.parse_args(argv)
+
+    report = measure(args.root, args.runs)
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    if args.baseline:
+        regressions = compare_to_baseline(report, json.loads(Path(args.baseline).read_text()), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
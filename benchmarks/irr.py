@@ -0,0 +1,75 @@
+"""
+Batched IRR solver vs. numpy_financial.irr one row at a time.
+
+Cash flows look like AnalyzerAgent's deals: an equity outlay, a level monthly
+cash flow (negative for some deals) over a random hold, then the sale.
+Reports both timings, the speedup and the largest disagreement between the
+two (rows where only one finds an IRR are counted separately).
+
+    python -m benchmarks.irr                    # 100k cash-flow vectors
+    python -m benchmarks.irr --rows 20000 --json
+"""
+
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+import numpy_financial as npf
+
+from avm_platform.agents.irr import irr_batch, level_cashflows
+
+
+def deal_cashflows(rows, seed=0):
+    """(padded cash-flow matrix, hold months per row) for ``rows`` random deals"""
+    rng = np.random.default_rng(seed)
+    hold_months = rng.integers(3, 37, rows)
+    cashflows = level_cashflows(-rng.uniform(20e3, 60e3, rows), rng.uniform(-500, 800, rows), hold_months,
+                                rng.uniform(0, 150e3, rows))
+    return cashflows, hold_months
+
+
+def compare(rows=100_000, seed=0):
+    cashflows, hold_months = deal_cashflows(rows, seed)
+
+    started = time.perf_counter()
+    batched = irr_batch(cashflows)
+    batch_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    # Unpadded rows, exactly as AnalyzerAgent used to build them
+    reference = np.array([npf.irr(row[:months + 2]) for row, months in zip(cashflows, hold_months)])
+    npf_s = time.perf_counter() - started
+
+    both = np.isfinite(batched) & np.isfinite(reference)
+    return {
+        'rows': rows,
+        'batch_s': batch_s,
+        'numpy_financial_s': npf_s,
+        'speedup': npf_s / batch_s if batch_s else None,
+        'max_abs_diff': float(np.abs(batched[both] - reference[both]).max()) if both.any() else 0.0,
+        'nan_mismatches': int((np.isfinite(batched) != np.isfinite(reference)).sum()),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark irr_batch against numpy_financial.irr")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action='store_true')
+    args = parser.parse_args(argv)
+
+    report = compare(args.rows, args.seed)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"{report['rows']} cash-flow vectors")
+        print(f"  irr_batch            {report['batch_s']:.3f} s")
+        print(f"  numpy_financial.irr  {report['numpy_financial_s']:.3f} s   ({report['speedup']:.1f}x)")
+        print(f"  max |difference|     {report['max_abs_diff']:.2e}   NaN mismatches {report['nan_mismatches']}")
+    return 0 if report['nan_mismatches'] == 0 and report['max_abs_diff'] < 1e-8 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,291 @@
+"""
+Extraction benchmark over the offline fixture corpus.
+
+Serves the fixtures from a local static server, runs the text extractor
+(SmartPropertyExtractor.extract_from_content on page.txt), its scoped mode
+(extract_from_sections on sections.json) and/or the per-site DOM extractors
+(dom_extract.extract_fields on page.html in Playwright), and
+reports per-field accuracy against expected.json plus throughput and p50/p95
+latency. Only the extraction call is timed; fetching the page is not.
+
+    python -m benchmarks.run_extraction                       # smart + scoped + dom
+    python -m benchmarks.run_extraction --mode smart --iterations 200 --scale 10
+    python -m benchmarks.run_extraction --json > baseline.json
+    python -m benchmarks.run_extraction --baseline baseline.json --tolerance 0.2
+
+With ``--baseline`` the exit status is 1 if accuracy dropped or p95 latency grew
+by more than ``--tolerance`` (a fraction) relative to the saved report.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import statistics
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+from benchmarks.corpus import load_corpus
+from benchmarks.server import FixtureServer
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SMART_EXTRACTOR_DIR = REPO_ROOT / "avm_platform/avm_platform/2025/homes-scraper-smart"
+
+MODES = ('smart', 'scoped', 'dom')
+
+
+def load_smart_extractor():
+    """SmartPropertyExtractor class from the homes smart scraper (a script directory, not a package)"""
+    if str(SMART_EXTRACTOR_DIR) not in sys.path:
+        sys.path.insert(0, str(SMART_EXTRACTOR_DIR))
+    from smart_extraction import SmartPropertyExtractor
+    return SmartPropertyExtractor
+
+
+def percentile(samples, q):
+    """Nearest-rank percentile of ``samples`` (q in 0..100)"""
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    rank = max(0, min(len(ordered) - 1, math.ceil(q / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def _fetch(url):
+    with urllib.request.urlopen(url, timeout=10) as response:
+        return response.read().decode('utf-8')
+
+
+class _Scorer:
+    """Per-field correct/total counters and the mismatches behind them"""
+
+    def __init__(self):
+        self.fields = {}
+        self.failures = []
+        self.unscored = {}
+
+    def score(self, fixture, expected, actual):
+        for field, want in expected.items():
+            got = actual.get(field)
+            counts = self.fields.setdefault(field, {'correct': 0, 'total': 0})
+            counts['total'] += 1
+            if got == want:
+                counts['correct'] += 1
+            else:
+                self.failures.append({'fixture': fixture.name, 'field': field, 'expected': want, 'actual': got})
+        for field in actual:
+            if field not in expected and actual[field] is not None:
+                self.unscored.setdefault(field, []).append(fixture.name)
+
+    def summary(self):
+        fields = {name: dict(counts, accuracy=counts['correct'] / counts['total'])
+                  for name, counts in sorted(self.fields.items())}
+        correct = sum(c['correct'] for c in fields.values())
+        total = sum(c['total'] for c in fields.values())
+        return {'accuracy': correct / total if total else None, 'fields': fields,
+                'failures': self.failures, 'unscored': self.unscored}
+
+
+def _report(mode, fixtures, timings, sizes, scorer, iterations, **extra):
+    elapsed = sum(timings)
+    total_bytes = sum(sizes) * iterations
+    return {
+        'mode': mode,
+        'fixtures': len(fixtures),
+        'iterations': iterations,
+        'documents': len(timings),
+        'bytes': total_bytes,
+        'latency_ms': {
+            'p50': percentile(timings, 50) * 1000 if timings else None,
+            'p95': percentile(timings, 95) * 1000 if timings else None,
+            'mean': statistics.fmean(timings) * 1000 if timings else None,
+        },
+        'docs_per_sec': len(timings) / elapsed if elapsed else None,
+        'mb_per_sec': total_bytes / elapsed / 1e6 if elapsed else None,
+        **scorer.summary(),
+        **extra,
+    }
+
+
+def bench_smart(fixtures, server, iterations=20, scale=1):
+    """Time SmartPropertyExtractor.extract_from_content on each fixture's page.txt.
+
+    ``scale`` repeats the page text to model larger pages; the first match of
+    every pattern is unchanged, so accuracy is still scored against expected.json.
+    """
+    extractor = load_smart_extractor()()
+    fixtures = [f for f in fixtures if 'smart' in f.expected]
+    scorer = _Scorer()
+    timings, sizes = [], []
+    for fixture in fixtures:
+        content = _fetch(server.url(fixture, 'page.txt')) * scale
+        sizes.append(len(content.encode('utf-8')))
+        result = None
+        for _ in range(iterations):
+            started = time.perf_counter()
+            result = extractor.extract_from_content(content, quiet=True)
+            timings.append(time.perf_counter() - started)
+        scorer.score(fixture, fixture.expected['smart'], result['property_data'])
+    return _report('smart', fixtures, timings, sizes, scorer, iterations, scale=scale)
+
+
+def bench_scoped(fixtures, server, iterations=20, scale=1):
+    """Time SmartPropertyExtractor.extract_from_sections on each fixture's sections.json.
+
+    Scored against the same expected 'smart' fields; ``bytes`` counts only the
+    section text scanned, so it compares directly with the smart report.
+    """
+    extractor = load_smart_extractor()()
+    fixtures = [f for f in fixtures if f.sections_path and 'smart' in f.expected]
+    scorer = _Scorer()
+    timings, sizes = [], []
+    for fixture in fixtures:
+        sections = {name: text * scale for name, text in
+                    json.loads(_fetch(server.url(fixture, 'sections.json'))).items()}
+        sizes.append(sum(len(text.encode('utf-8')) for text in sections.values()))
+        result = None
+        for _ in range(iterations):
+            started = time.perf_counter()
+            result = extractor.extract_from_sections(sections, quiet=True)
+            timings.append(time.perf_counter() - started)
+        scorer.score(fixture, fixture.expected['smart'], result['property_data'])
+    return _report('scoped', fixtures, timings, sizes, scorer, iterations, scale=scale)
+
+
+async def _bench_dom(fixtures, server, iterations):
+    from playwright.async_api import async_playwright
+
+    from avm_platform.scraping.dom_extract import extract_fields
+
+    scorer = _Scorer()
+    timings, sizes = [], []
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            page = await browser.new_page()
+            for fixture in fixtures:
+                await page.goto(server.url(fixture, 'page.html'))
+                sizes.append(fixture.html_path.stat().st_size)
+                result = None
+                for _ in range(iterations):
+                    started = time.perf_counter()
+                    result = await extract_fields(page, fixture.site)
+                    timings.append(time.perf_counter() - started)
+                actual = {k: v for k, v in result.items() if k != 'images'}
+                expected = dict(fixture.expected['dom'])
+                if 'images' in fixture.expected:
+                    actual['images'] = len(result.get('images') or [])
+                    expected['images'] = fixture.expected['images']
+                scorer.score(fixture, expected, actual)
+        finally:
+            await browser.close()
+    return timings, sizes, scorer
+
+
+def bench_dom(fixtures, server, iterations=20):
+    """Time dom_extract.extract_fields on each fixture's page.html in headless Chromium.
+
+    Returns a report with a 'skipped' reason instead when Playwright or a
+    browser binary is not available.
+    """
+    fixtures = [f for f in fixtures if f.html_path and 'dom' in f.expected]
+    try:
+        from playwright.async_api import Error as PlaywrightError
+    except ImportError as e:
+        return {'mode': 'dom', 'fixtures': len(fixtures), 'skipped': f"playwright not installed ({e})"}
+    try:
+        timings, sizes, scorer = asyncio.run(_bench_dom(fixtures, server, iterations))
+    except PlaywrightError as e:
+        # Typically no browser binary (run `playwright install chromium`)
+        reason = str(e).strip().splitlines()[0] if str(e).strip() else type(e).__name__
+        return {'mode': 'dom', 'fixtures': len(fixtures), 'skipped': reason}
+    return _report('dom', fixtures, timings, sizes, scorer, iterations)
+
+
+def run(modes=MODES, iterations=20, scale=1, fixtures=None):
+    """Run the requested benchmark modes against the corpus and return their reports"""
+    fixtures = load_corpus() if fixtures is None else fixtures
+    reports = {}
+    with FixtureServer() as server:
+        if 'smart' in modes:
+            reports['smart'] = bench_smart(fixtures, server, iterations, scale)
+        if 'scoped' in modes:
+            reports['scoped'] = bench_scoped(fixtures, server, iterations, scale)
+        if 'dom' in modes:
+            reports['dom'] = bench_dom(fixtures, server, iterations)
+    return reports
+
+
+def compare_to_baseline(reports, baseline, tolerance=0.2):
+    """Regressions of ``reports`` against a saved baseline, as human-readable strings"""
+    regressions = []
+    for mode, report in reports.items():
+        base = baseline.get(mode)
+        if not base or 'skipped' in report or 'skipped' in base:
+            continue
+        if base.get('accuracy') is not None and (report['accuracy'] or 0) < base['accuracy']:
+            regressions.append(f"{mode}: accuracy {report['accuracy']:.1%} < baseline {base['accuracy']:.1%}")
+        for field, counts in base.get('fields', {}).items():
+            current = report['fields'].get(field)
+            if current and current['accuracy'] < counts['accuracy']:
+                regressions.append(f"{mode}: {field} accuracy {current['accuracy']:.1%} < baseline {counts['accuracy']:.1%}")
+        base_p95 = (base.get('latency_ms') or {}).get('p95')
+        if base_p95 and report['latency_ms']['p95'] > base_p95 * (1 + tolerance):
+            regressions.append(f"{mode}: p95 {report['latency_ms']['p95']:.2f} ms > baseline {base_p95:.2f} ms "
+                               f"+{tolerance:.0%}")
+    return regressions
+
+
+def format_report(report):
+    if 'skipped' in report:
+        return f"[{report['mode']}] skipped: {report['skipped']}"
+    latency = report['latency_ms']
+    lines = [
+        f"[{report['mode']}] {report['fixtures']} fixtures x {report['iterations']} iterations "
+        f"({report['documents']} documents, {report['bytes'] / 1e6:.2f} MB)",
+        f"  latency  p50 {latency['p50']:.3f} ms   p95 {latency['p95']:.3f} ms   mean {latency['mean']:.3f} ms",
+        f"  throughput  {report['docs_per_sec']:.1f} docs/s   {report['mb_per_sec']:.2f} MB/s",
+        f"  accuracy  {report['accuracy']:.1%}",
+    ]
+    for field, counts in report['fields'].items():
+        lines.append(f"    {field:<28} {counts['correct']}/{counts['total']}  {counts['accuracy']:.0%}")
+    for failure in report['failures']:
+        actual = repr(failure['actual'])
+        actual = actual if len(actual) <= 60 else actual[:57] + '...'
+        lines.append(f"  MISS {failure['fixture']} {failure['field']}: expected {failure['expected']!r}, got {actual}")
+    if report['unscored']:
+        lines.append(f"  unscored fields: {', '.join(sorted(report['unscored']))}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark property extraction on the offline fixture corpus")
+    parser.add_argument("--mode", choices=MODES + ('all',), default='all')
+    parser.add_argument("--iterations", type=int, default=20, help="timed extractions per fixture")
+    parser.add_argument("--scale", type=int, default=1, help="repeat page/section text N times (smart, scoped)")
+    parser.add_argument("--site", action='append', help="only fixtures for this site (repeatable)")
+    parser.add_argument("--json", action='store_true', help="print the reports as JSON")
+    parser.add_argument("--baseline", help="saved --json output to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed p95 latency growth vs baseline")
+    args = parser.parse_args(argv)
+
+    modes = MODES if args.mode == 'all' else (args.mode,)
+    reports = run(modes, args.iterations, args.scale, load_corpus(sites=args.site))
+
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    else:
+        print('\n\n'.join(format_report(report) for report in reports.values()))
+
+    if args.baseline:
+        regressions = compare_to_baseline(reports, json.loads(Path(args.baseline).read_text()), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
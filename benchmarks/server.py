@@ -0,0 +1,51 @@
+"""
+Local static server for the fixture corpus.
+
+Serves ``benchmarks/fixtures`` over HTTP on an ephemeral port from a daemon
+thread, so the benchmarks exercise the same fetch-then-extract path as the
+scrapers without touching the network.
+"""
+
+import functools
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks.corpus import FIXTURES_DIR
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureServer:
+    """Context manager serving ``root`` at ``http://127.0.0.1:<port>/``"""
+
+    def __init__(self, root=FIXTURES_DIR, host="127.0.0.1", port=0):
+        handler = functools.partial(_QuietHandler, directory=str(root))
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, fixture, filename):
+        return f"{self.base_url}/{fixture.name}/{filename}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fixture-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,91 @@
+"""
+Compiled pattern engine vs. the original findall loop in SmartPropertyExtractor.
+
+For every fixture page (optionally repeated to model bigger pages) both paths
+run on the same text; their property_data must be identical, and the report
+shows median latency and the speedup per fixture and scale.
+
+    python -m benchmarks.smart_engine
+    python -m benchmarks.smart_engine --scales 1 10 100 --iterations 20 --json
+"""
+
+import argparse
+import json
+import re
+import statistics
+import sys
+import time
+
+from benchmarks.corpus import load_corpus
+from benchmarks.run_extraction import load_smart_extractor
+
+
+def legacy_property_data(extractor, text):
+    """property_data as extract_from_content computed it before the compiled engine: findall(...)[0] per pattern"""
+    data = {}
+    for patterns in (extractor.core_patterns, extractor.extended_patterns):
+        for field, pattern in patterns.items():
+            matches = re.findall(pattern, text, re.IGNORECASE)
+            if matches:
+                value = next((m for m in matches[0] if m), None) if isinstance(matches[0], tuple) else matches[0]
+                if value:
+                    data[field] = value.strip()
+    return data
+
+
+def engine_property_data(extractor, text):
+    matches, _ = extractor.engine().first_matches(text)
+    return {field: value.strip() for _, field, value in matches}
+
+
+def _median_ms(fn, iterations):
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+
+def compare(fixtures=None, scales=(1, 10, 100), iterations=10):
+    """Per fixture and scale: legacy/engine median ms, speedup and whether outputs match"""
+    extractor = load_smart_extractor()()
+    extractor.engine()  # compile outside the timings
+    rows = []
+    for fixture in load_corpus() if fixtures is None else fixtures:
+        for scale in scales:
+            text = fixture.text() * scale
+            legacy_ms = _median_ms(lambda: legacy_property_data(extractor, text), iterations)
+            engine_ms = _median_ms(lambda: engine_property_data(extractor, text), iterations)
+            rows.append({
+                'fixture': fixture.name,
+                'scale': scale,
+                'chars': len(text),
+                'legacy_ms': legacy_ms,
+                'engine_ms': engine_ms,
+                'speedup': legacy_ms / engine_ms if engine_ms else None,
+                'identical': legacy_property_data(extractor, text) == engine_property_data(extractor, text),
+            })
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the compiled SmartPropertyExtractor engine to findall")
+    parser.add_argument("--scales", type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--json", action='store_true')
+    args = parser.parse_args(argv)
+
+    rows = compare(scales=args.scales, iterations=args.iterations)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print(f"{'fixture':<52} {'scale':>5} {'chars':>9} {'findall ms':>11} {'engine ms':>10} {'speedup':>8}  same")
+        for row in rows:
+            print(f"{row['fixture']:<52} {row['scale']:>5} {row['chars']:>9} {row['legacy_ms']:>11.3f} "
+                  f"{row['engine_ms']:>10.3f} {row['speedup']:>7.1f}x  {'yes' if row['identical'] else 'NO'}")
+    return 0 if all(row['identical'] for row in rows) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,227 @@
+"""
+Rebuild the offline fixture corpus from the archived debug runs.
+
+We never saved raw pages from the live scrapes, only what the extractor pulled
+out of them (debug-scrapers/archive/debug-results-*/debug_results_*.json) and
+the screenshot transcription in smart_extraction.py. This script reassembles a
+homes.com-like page from those artifacts - the AVM provider blocks are the
+archived text verbatim, whitespace included - so that the archived extractor
+output is reproduced exactly. Expected values are the ground truth, not the
+archived output: where the extractor returned a 500-char blob, the expected
+value is the number in it.
+
+    python -m benchmarks.synthesize_fixtures
+"""
+
+import html
+import json
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+ARCHIVE = REPO_ROOT / "avm_platform/avm_platform/debug-scrapers/archive/debug-results-2025-09-18"
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+SOURCE_RUN = "debug_results_20250918_220742.json"
+ADDRESS = "1240 Pondview Ave, Akron, OH 44305"
+
+INDENT = "\n\t\t\t\t\t\n\t\t\t\t\t\t\n\t\t\t\t\t\t\t"
+
+
+# Landmark wrapper class per section, matching scrape_property.HOMES_SECTION_LANDMARKS
+LANDMARK_CLASSES = {
+    'header': 'property-info',
+    'facts': 'property-details',
+    'history': 'property-history',
+    'avm': 'home-value',
+    'schools': 'schools',
+}
+
+
+def _page_sections(archived):
+    """(landmark section or None, [(tag, css class, text)]) groups in page order; tag None is a bare text node"""
+    data = archived['property_data']
+    return [
+        (None, [
+            (None, None, "\n\t\tHomes.com\n\t\tBuy\n\t\tRent\n\t\tSell\n\t\tFind an Agent\n\t\tSign In\n\t\t"),
+        ]),
+        ('header', [
+            ('h1', 'property-info-address-main', "1240 Pondview Ave"),
+            (None, None, "\n\t\t"),
+            ('p', 'property-info-address-citystatezip', "Akron, OH 44305"),
+            (None, None, "\n\t\t"),
+            ('span', 'listing-status', "For Sale"),
+            (None, None, "\n\t\t"),
+            ('span', 'price', "$92,000 - $118,000"),
+            (None, None, "\n\t\t"),
+            ('div', 'estimated-value', "Estimated Value: $92,000"),
+            (None, None, "\n\t\t"),
+            ('span', 'beds', "5 Beds"),
+            (None, None, "\n\t\t"),
+            ('span', 'baths', "1 Bath"),
+            (None, None, "\n\t\t"),
+            ('span', 'sqft', "1,589 Sq Ft"),
+            (None, None, "\n\t\t"),
+            ('span', 'price-per-sqft', "$65/Sq Ft"),
+            (None, None, "\n\t\t"),
+        ]),
+        ('facts', [
+            ('p', 'property-description',
+             "This is a home located in Akron, OH. Contact an agent for a tour of this property."),
+            (None, None, "\n\t\tProperty Details\n\t\tProperty Type\n\t\t"),
+            ('span', 'property-type', "Single Family"),
+        ]),
+        ('avm', [
+            (None, None, "\n\t\tHome Value\n\t\t"),
+            # AVM provider blocks exactly as archived; the gaps keep each greedy
+            # {0,500} match from reaching the next provider's price
+            ('div', 'avm-provider', data['avm_collateral_analytics']),
+            (None, None, INDENT),
+            ('div', 'avm-provider', data['avm_ice_mortgage']),
+            (None, None, INDENT),
+            ('div', 'avm-provider', data['avm_first_american']),
+            (None, None, INDENT),
+            ('div', 'avm-provider', data['avm_quantarium']),
+            (None, None, "\n\t\t\t" + "\n\t\t\t".join([
+                "Home value estimates are provided by independent third parties and are not appraisals.",
+                "Values are refreshed as new public records and listing activity become available.",
+                "Contact a local agent for a comparative market analysis of this home.",
+            ]) + "\n\t\t"),
+        ]),
+        ('history', [
+            ('div', 'tax-history',
+             "Tax HistoryAssessment History2013201420152016201720182019202020212022202320242025$1.2K"),
+            (None, None, "\n\t\t"),
+            ('div', 'mortgage-history', "Mortgage HistoryDate08/26/1998StatusPrevious OwnerTotal Amount$41,163"),
+        ]),
+        ('schools', [
+            (None, None, "\n\t\tSchools\n    \n    \n        "),
+            ('span', 'school-name', "Search Middle"),
+            (None, None, "\n\t\t"),
+            ('span', 'school-distance', "4 mi walk to the nearest school"),
+            (None, None, "\n\t"),
+        ]),
+    ]
+
+
+def _render(groups, title):
+    """(page text, page html, landmark section texts); the html's body text equals the page text"""
+    def render(segments):
+        return ''.join(html.escape(text) if tag is None else f'<{tag} class="{cls}">{html.escape(text)}</{tag}>'
+                       for tag, cls, text in segments)
+
+    sections = {section: ''.join(text for _, _, text in segments) for section, segments in groups if section}
+    text = ''.join(text for _, segments in groups for _, _, text in segments)
+    body = ''.join(render(segments) if section is None else
+                   f'<div class="{LANDMARK_CLASSES[section]}">{render(segments)}</div>'
+                   for section, segments in groups)
+    page = (f'<!DOCTYPE html>\n<html lang="en"><head><meta charset="utf-8"><title>{html.escape(title)}</title></head>'
+            f'<body>{body}<div class="gallery"><img src="/photos/1240-pondview-1.jpg" alt="Front">'
+            f'<img src="/photos/1240-pondview-2.jpg" alt="Kitchen"><img src="/icons/icon-heart.svg" alt=""></div>'
+            f'</body></html>\n')
+    return text, page, sections
+
+
+# Screenshot transcription from smart_extraction.test_with_sample_content
+SCREENSHOT_TEXT = """
+    1240 Pondview Ave, Akron, OH 44305
+
+    $92,000 - $118,000
+
+    3 beds • 1 bath • 1,589 Sq Ft
+    $65/Sq Ft Est. Value
+
+    Single Family Home
+    Built in 1952
+
+    Property Details:
+    Lot Size: 0.25 acres
+    Property Tax: $1,250/year
+    Est. mortgage: $450/month
+
+    Status: For Sale
+    Last sold: March 2020 for $85,000
+    """
+
+
+def build():
+    archived = json.loads((ARCHIVE / SOURCE_RUN).read_text())
+    text, page, sections = _render(_page_sections(archived), ADDRESS)
+
+    fixtures = {
+        'homes-1240-pondview-ave-akron-oh-44305': {
+            'expected': {
+                'site': 'homes',
+                'address': ADDRESS,
+                'source': f"Reassembled from archive/debug-results-2025-09-18/{SOURCE_RUN}",
+                'smart': {
+                    'price': '92,000 - $118,000',
+                    'beds': '5',
+                    'baths': '1',
+                    'sqft': '1,589',
+                    'address': '1240 Pondview Ave',
+                    'property_type': 'Single Family',
+                    'property_type_inferred': 'home',
+                    'price_per_sqft': '65',
+                    'status': 'For Sale',
+                    'estimate_value': 'Estimated Value: $92,000',
+                    'avm_collateral_analytics': '$118,000',
+                    'avm_ice_mortgage': '$111,000',
+                    'avm_first_american': '$92,000',
+                    'avm_quantarium': '$95,195',
+                    'avm_average_value': '$104,049',
+                    'mortgage_history': 'Mortgage HistoryDate08/26/1998StatusPrevious OwnerTotal Amount$41,163',
+                    'school_name': 'Search Middle',
+                    'school_walk_distance': '4',
+                },
+                'dom': {
+                    'value': 'Estimated Value: $92,000',
+                    'rent': None,
+                    'beds': '5 Beds',
+                    'baths': '1 Bath',
+                    'sqft': '1,589 Sq Ft',
+                    'year': None,
+                    'taxes': None,
+                    'last_sold': None,
+                },
+                'images': 2,
+            },
+            'page.txt': text,
+            'page.html': page,
+            'sections.json': json.dumps(sections, indent=2, ensure_ascii=False) + '\n',
+        },
+        'homes-1240-pondview-ave-akron-oh-44305-screenshot': {
+            'expected': {
+                'site': 'homes',
+                'address': ADDRESS,
+                'source': "Screenshot transcription in smart_extraction.test_with_sample_content",
+                'smart': {
+                    'price': '92,000 - $118,000',
+                    'beds': '3',
+                    'baths': '1',
+                    'sqft': '1,589',
+                    'address': '1240 Pondview Ave',
+                    'property_type': 'Single Family',
+                    'year_built': '1952',
+                    'lot_size': '0.25',
+                    'price_per_sqft': '65',
+                    'status': 'For Sale',
+                    'last_sold': 'Last sold: March 2020 for $85,000',
+                    'property_tax': 'Property Tax: $1,250',
+                    'mortgage_estimate': 'Est. mortgage: $450',
+                },
+            },
+            'page.txt': SCREENSHOT_TEXT,
+        },
+    }
+
+    for name, files in fixtures.items():
+        directory = FIXTURES / name
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / 'expected.json').write_text(json.dumps(files.pop('expected'), indent=2, ensure_ascii=False) + '\n')
+        for filename, content in files.items():
+            (directory / filename).write_text(content)
+        print(f"wrote {directory.relative_to(REPO_ROOT)}")
+
+
+if __name__ == '__main__':
+    build()
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+
+from avm_platform.agents.aggregator import AggregatorAgent, observations_frame
+
+
+def test_aggregate_frame_matches_per_property_aggregate():
+    rng = np.random.default_rng(7)
+    properties = {}
+    for i in range(300):
+        properties[f"p{i}"] = {
+            'zillow': {'value': int(rng.integers(80, 400)) * 1000, 'beds': int(rng.integers(1, 6)),
+                       'taxes': f"${rng.integers(500, 5000):,}/year"},
+            'homes': {'value': f"${rng.integers(80, 400) * 1000:,} - ${rng.integers(400, 500) * 1000:,}",
+                      'sqft': f"{rng.integers(800, 3000):,} Sq Ft", 'taxes': '$1.2K'},
+            'redfin': {'value': 'Failed', 'rent': 'Failed'} if i % 3 else {'value': '$150,000', 'rent': '$1,200/mo'},
+        }
+
+    agent = AggregatorAgent()
+    consensus = agent.aggregate_frame(observations_frame(properties))
+    assert len(consensus) == 300
+    for property_id in ('p0', 'p1', 'p299'):
+        aggregated, _ = agent.aggregate(properties[property_id])
+        row = consensus.loc[property_id]
+        for field in ('value', 'rent', 'beds', 'baths', 'sqft', 'year', 'taxes'):
+            assert aggregated[field] == (None if pd.isna(row[field]) else row[field])
+        assert row['sources'] == len(aggregated['successful_sites'])
+    assert consensus.loc['p0', 'sources'] == 3 and consensus.loc['p1', 'sources'] == 2
+
+
+def test_aggregate_frame_accepts_raw_observation_tables():
+    observations = pd.DataFrame({
+        'property_id': [1, 1, 1, 2, 2],
+        'site': ['zillow', 'homes', 'homes', 'zillow', 'zillow'],
+        'field': ['value', 'value', 'taxes', 'beds', 'status'],
+        'value': [100000, 120000, 1500, 3, 'For Sale'],
+    })
+    consensus = AggregatorAgent().aggregate_frame(observations)
+    assert consensus.loc[1, 'value'] == 110000.0
+    assert consensus.loc[1, 'taxes'] == 1500.0
+    assert consensus.loc[2, 'beds'] == 3.0 and pd.isna(consensus.loc[2, 'value'])
+    assert list(consensus['sources']) == [2, 0]
+    assert 'status' not in consensus.columns
+
+
+def _observations(rows):
+    return pd.DataFrame(rows, columns=['property_id', 'site', 'field', 'value'])
+
+
+def test_estimators_and_outlier_rejection():
+    # homes picked up a list price three times the other sites' estimates
+    observations = _observations([
+        (1, 'zillow', 'value', 100000), (1, 'redfin', 'value', 110000), (1, 'realtor', 'value', 105000),
+        (1, 'homes', 'value', 330000), (1, 'zillow', 'beds', 3),
+    ])
+    plain = AggregatorAgent('mean', reject_outliers=False).consensus(observations).set_index('field')
+    assert plain.at['value', 'estimate'] == 161250.0
+    assert AggregatorAgent('median', reject_outliers=False).aggregate_frame(observations).at[1, 'value'] == 107500.0
+    assert AggregatorAgent('trimmed_mean', reject_outliers=False).aggregate_frame(observations).at[1, 'value'] == 107500.0
+
+    robust = AggregatorAgent('mean', reject_outliers=True).consensus(observations).set_index('field')
+    assert robust.at['value', 'estimate'] == 105000.0
+    assert (robust.at['value', 'sources'], robust.at['value', 'rejected']) == (3, 1)
+    assert robust.at['value', 'spread'] < plain.at['value', 'spread']
+    assert robust.at['value', 'confidence'] > plain.at['value', 'confidence']
+    assert robust.at['beds', 'spread'] == 0.0
+
+
+def test_learned_site_reliability_weights_the_mean():
+    rows = []
+    for i in range(20):
+        base = 100000 + 1000 * i
+        rows += [(i, 'zillow', 'value', base), (i, 'redfin', 'value', base * 1.01),
+                 (i, 'realtor', 'value', base * 0.99), (i, 'homes', 'value', base * 1.6)]
+    observations = _observations(rows)
+    agent = AggregatorAgent('weighted_mean', reject_outliers=False)
+    weights = agent.learn_weights(observations)
+    assert weights['homes'] < 0.1 < min(weights['zillow'], weights['redfin'], weights['realtor'])
+
+    # Two sources only: no majority to reject by, the learned weights decide
+    pair = _observations([(0, 'zillow', 'value', 200000), (0, 'homes', 'value', 320000)])
+    assert AggregatorAgent('weighted_mean', site_weights={}).aggregate_frame(pair).at[0, 'value'] == 260000.0
+    assert agent.aggregate_frame(pair).at[0, 'value'] < 210000
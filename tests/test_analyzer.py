@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from avm_platform.agents.analyzer import AnalyzerAgent
+from avm_platform.agents.config import DEFAULT_ANALYSIS_SETTINGS
+
+AGGREGATED = {'value': 150000.0, 'rent': 1400.0}
+
+
+def test_analyze_grid_matches_scalar_analyze():
+    analyzer = AnalyzerAgent(DEFAULT_ANALYSIS_SETTINGS)
+    purchases = np.arange(80000, 121000, 10000)
+    renos = [10000, 25000]
+    grid = analyzer.analyze_grid(AGGREGATED, purchases, renos, hold_months=[6, 18], interest=[5.5, 7.0])
+    assert grid['irr'].shape == (5, 2, 2, 2)
+
+    for (i, purchase), (j, reno), (k, hold), (m, rate) in [((0, 80000), (1, 25000), (0, 6), (1, 7.0)),
+                                                          ((4, 120000), (0, 10000), (1, 18), (0, 5.5))]:
+        scalar = AnalyzerAgent(dict(DEFAULT_ANALYSIS_SETTINGS, interest=rate)).analyze(
+            AGGREGATED, {'purchase': purchase, 'reno': reno, 'hold_months': hold})
+        for name, value in scalar.items():
+            assert grid[name][i, j, k, m] == pytest.approx(value)
+
+
+def test_analyze_scenarios_broadcasts_and_handles_zero_rate_loans():
+    analyzer = AnalyzerAgent(DEFAULT_ANALYSIS_SETTINGS)
+    metrics = analyzer.analyze_scenarios(AGGREGATED, [90000, 100000], 20000, 12, ltv=[[0], [80]], interest=0)
+    assert metrics['cash_flow'].shape == (2, 2)
+    # All cash: no mortgage payment; 0% loan: straight principal over 30 years
+    assert metrics['cash_flow'][0, 0] == pytest.approx(1400 * 0.77)
+    assert metrics['cash_flow'][1, 0] == pytest.approx(1400 * 0.77 - 72000 / 360)
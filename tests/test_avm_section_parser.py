@@ -0,0 +1,50 @@
+import time
+
+from benchmarks.corpus import load_corpus
+from benchmarks.run_extraction import load_smart_extractor
+
+SmartPropertyExtractor = load_smart_extractor()
+from smart_extraction import AVMSectionParser, parse_dollar_amount  # noqa: E402
+
+PROVIDERS = SmartPropertyExtractor().avm_providers
+
+
+def test_archived_home_value_section_parses_to_typed_values():
+    [page] = [f for f in load_corpus() if f.name == 'homes-1240-pondview-ave-akron-oh-44305']
+    estimates = AVMSectionParser(PROVIDERS).parse(page.text())
+    assert [(e['provider'], e['value']) for e in estimates] == [
+        ('Collateral Analytics', 118000),
+        ('ICE Mortgage Technology', 111000),
+        ('First American', 92000),
+        ('Quantarium', 95195),
+        ('Average Value', 104049),
+    ]
+    assert estimates[0]['text'] == '$118,000'
+
+
+def test_blocks_without_a_value_stay_empty():
+    text = ("Quantarium has no estimate for this home. First American\n$250,000 "
+            "Collateral Analytics" + " " * 2000 + "$1 Quantarium $9,999")
+    estimates = AVMSectionParser(PROVIDERS).parse(text)
+    # Quantarium's first block runs into First American; Collateral's value is out of the window
+    assert [(e['field'], e['value']) for e in estimates] == [('avm_first_american', 250000),
+                                                             ('avm_quantarium', 9999)]
+    assert AVMSectionParser(PROVIDERS).parse("no providers here $5") == []
+
+
+def test_parse_dollar_amount():
+    assert parse_dollar_amount('1,250') == 1250
+    assert parse_dollar_amount('1.2', 'K') == 1200
+    assert parse_dollar_amount(',') is None
+
+
+def test_extraction_stays_linear_on_multi_megabyte_pages():
+    # Labels whose values never follow: the old unbounded patterns backtracked
+    # quadratically here (School...[\w\s]+Middle alone took minutes on 100 KB)
+    chunk = ("School Crime Walk Bike Sound Risk Tax Mortgage Last sold HOA Median Income 12 "
+             "Collateral Analytics Quantarium First American 45% 7 mi 1234 Maple ")
+    text = chunk * (2_000_000 // len(chunk))
+    started = time.perf_counter()
+    result = SmartPropertyExtractor().extract_from_content(text, quiet=True)
+    assert time.perf_counter() - started < 20
+    assert result['avm_estimates'] == []
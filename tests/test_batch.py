@@ -0,0 +1,74 @@
+import asyncio
+import json
+
+import pytest
+
+from avm_platform.batch import BatchValuationPipeline, filter_markets, load_addresses, read_checkpoint
+
+
+class FakeFetcher:
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.site_limits = {}
+        self.active = 0
+        self.peak = 0
+        self.calls = []
+
+    async def fetch_all(self, address_dict):
+        self.calls.append(address_dict['street'])
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        if address_dict['street'].startswith('13'):
+            raise RuntimeError("proxy blocked")
+        site = {'value': '$150,000', 'rent': '$1,200/mo', 'beds': '3', 'images': ['a.jpg']}
+        return {'zillow': site, 'redfin': dict(site, value='$160,000')}
+
+
+ROWS = [
+    {'address': '1841 Marks Ave, Akron, OH 44305'},
+    {'address': '12 Elm St, Tampa, FL 33602', 'purchase': 90000},
+    {'address': '1300 Oak Rd, Atlanta, GA 30301'},
+    {'address': 'not an address'},
+    {'address': '1841  marks ave, akron, oh 44305'},
+]
+
+
+def test_load_addresses_reads_optional_inputs(tmp_path):
+    path = tmp_path / "in.csv"
+    path.write_text("address,purchase\n\"1841 Marks Ave, Akron, OH 44305\",90000\n\"12 Elm St, Tampa, FL 33602\",\n,5\n")
+    rows = load_addresses(path)
+    assert rows == [
+        {'address': '1841 Marks Ave, Akron, OH 44305', 'purchase': 90000.0},
+        {'address': '12 Elm St, Tampa, FL 33602'},
+    ]
+    assert filter_markets(rows, ['Tampa FL']) == rows[1:]
+
+
+@pytest.mark.asyncio
+async def test_run_bounds_concurrency_and_resumes(tmp_path):
+    out = tmp_path / "results.jsonl"
+    fetcher = FakeFetcher()
+    stats = await BatchValuationPipeline(out, fetcher=fetcher, concurrency=2).run(ROWS)
+
+    assert stats == {'processed': 4, 'ok': 2, 'invalid': 1, 'error': 1, 'skipped': 1}
+    assert fetcher.peak <= 2
+    assert set(fetcher.site_limits) >= {'zillow', 'redfin'}
+    records = {r['address']: r for r in map(json.loads, out.read_text().splitlines())}
+    ok = records['12 Elm St, Tampa, FL 33602']
+    assert ok['aggregated']['value'] == 155000.0
+    assert ok['inputs']['purchase'] == 90000
+    assert 'images' not in ok['sites']['zillow']
+    assert records['1300 Oak Rd, Atlanta, GA 30301']['status'] == 'error'
+
+    # Completed and invalid rows are skipped on resume; the failed one is retried
+    with out.open('a') as f:
+        f.write('{"id": "truncated')
+    assert len(read_checkpoint(out)) == 3
+    fetcher = FakeFetcher()
+    stats = await BatchValuationPipeline(out, fetcher=fetcher).run(ROWS)
+    assert fetcher.calls == ['1300 Oak Rd']
+    assert stats['skipped'] == 4
+    # The retried record starts on its own line after the truncated one
+    assert json.loads(out.read_text().splitlines()[-1])['address'] == '1300 Oak Rd, Atlanta, GA 30301'
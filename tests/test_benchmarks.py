@@ -0,0 +1,40 @@
+import copy
+
+from benchmarks.corpus import load_corpus
+from benchmarks.run_extraction import compare_to_baseline, percentile, run
+
+CORE_FIELDS = ('price', 'beds', 'baths', 'sqft', 'address')
+
+
+def test_corpus_fixtures_have_text_and_expected_fields():
+    fixtures = load_corpus()
+    assert fixtures
+    for fixture in fixtures:
+        assert fixture.site == 'homes'
+        assert fixture.text()
+        assert set(CORE_FIELDS) <= set(fixture.expected['smart'])
+
+
+def test_smart_benchmark_reports_accuracy_and_latency():
+    report = run(modes=('smart',), iterations=1)['smart']
+
+    assert report['documents'] == report['fixtures'] == len(load_corpus())
+    assert report['latency_ms']['p50'] <= report['latency_ms']['p95']
+    assert report['docs_per_sec'] > 0
+    for field in CORE_FIELDS:
+        assert report['fields'][field]['accuracy'] == 1.0
+    assert 0 < report['accuracy'] <= 1
+
+    # An unchanged run is not a regression; a slower or less accurate one is
+    assert compare_to_baseline({'smart': report}, {'smart': report}) == []
+    better = copy.deepcopy(report)
+    better['accuracy'] = 1.5
+    better['latency_ms']['p95'] = report['latency_ms']['p95'] / 10
+    assert len(compare_to_baseline({'smart': report}, {'smart': better}, tolerance=0.2)) == 2
+
+
+def test_percentile_nearest_rank():
+    samples = list(range(1, 101))
+    assert percentile(samples, 50) == 50
+    assert percentile(samples, 95) == 95
+    assert percentile([3.0], 95) == 3.0
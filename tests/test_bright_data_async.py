@@ -0,0 +1,174 @@
+import asyncio
+import json
+import subprocess
+import sys
+
+import httpx
+import pytest
+
+from avm_platform.agents import bright_data
+from avm_platform.agents.bright_data import AsyncBrightDataScraperAgent, records_for_url
+from avm_platform.agents.polling import AdaptivePoller
+from avm_platform.agents.snapshot_cache import SnapshotCache
+
+ADDRESS = {'street': '12 Elm St', 'city': 'Tampa', 'state': 'FL', 'zip': '33602'}
+
+
+def make_transport(progress=('running', 'ready')):
+    calls = []
+    statuses = list(progress)
+
+    def handler(request):
+        calls.append(request.url.path.split('/')[3])  # /datasets/v3/<endpoint>/...
+        assert request.headers['Authorization'] == 'Bearer tok'
+        if request.url.path.endswith('/trigger'):
+            return httpx.Response(200, json={'snapshot_id': 's_1'})
+        if '/progress/' in request.url.path:
+            return httpx.Response(200, json={'status': statuses.pop(0) if len(statuses) > 1 else statuses[0]})
+        return httpx.Response(200, json=[{'price': 250000, 'rentZestimate': 1900, 'photos': ['a', 'b']}])
+
+    return httpx.MockTransport(handler), calls
+
+
+@pytest.fixture(autouse=True)
+def fast_polls(monkeypatch):
+    cache = SnapshotCache(':memory:')
+    monkeypatch.setattr(bright_data, 'get_snapshot_cache', lambda: cache)
+    monkeypatch.setattr(bright_data, 'AdaptivePoller',
+                        lambda cache: AdaptivePoller(cache, initial=0.01, max_interval=0.02))
+
+
+@pytest.mark.asyncio
+async def test_scrape_zillow_trigger_wait_fetch_and_cache():
+    transport, calls = make_transport()
+    async with AsyncBrightDataScraperAgent('tok', client=httpx.AsyncClient(transport=transport)) as agent:
+        result = await agent.scrape_zillow(ADDRESS)
+        assert result['value'] == 250000
+        assert result['rent'] == 1900
+        assert calls == ['trigger', 'progress', 'progress', 'snapshot']
+        assert agent.cache.get_snapshot('12-elm-st-tampa-fl-33602', 'zillow') == 's_1'
+
+        # Second lookup is served from the result cache without any API call
+        assert await agent.scrape_zillow(ADDRESS) == result
+        assert len(calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_failed_snapshot_and_concurrent_calls():
+    transport, _ = make_transport(progress=('failed',))
+    agent = AsyncBrightDataScraperAgent('tok', client=httpx.AsyncClient(transport=transport))
+    zillow, realtor = await asyncio.gather(agent.scrape_zillow(ADDRESS), agent.scrape_realtor(ADDRESS))
+    assert zillow == realtor == {'value': 'Failed', 'rent': 'Failed'}
+    assert agent.cache.pending_items() == []
+    await agent.aclose()
+
+
+@pytest.mark.asyncio
+async def test_batched_triggers_demux_records_by_input_url():
+    triggers = []
+
+    def handler(request):
+        endpoint = request.url.path.split('/')[3]
+        if endpoint == 'trigger':
+            triggers.append([item['url'] for item in json.loads(request.content)])
+            return httpx.Response(200, json={'snapshot_id': 's_batch'})
+        if endpoint == 'progress':
+            return httpx.Response(200, json={'status': 'ready'})
+        records = [{'input': {'url': url}, 'price': 100000 * (i + 1)} for i, url in enumerate(triggers[0])]
+        records.append({'input': {'url': triggers[0][2]}, 'error': 'not found'})
+        return httpx.Response(200, json=records[:1] + records[2:] + records[1:2])
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    agent = AsyncBrightDataScraperAgent('tok', client=client, batch_window=0.05, max_batch=10)
+    addresses = [dict(ADDRESS, street=f'{n} Elm St') for n in (1, 2, 3)]
+    results = await asyncio.gather(*(agent.scrape_zillow(a) for a in addresses))
+
+    assert len(triggers) == 1 and len(triggers[0]) == 3
+    assert [r['value'] for r in results] == [100000, 200000, 300000]
+    batcher = agent.batchers[bright_data.BRIGHT_DATA_ZILLOW_DATASET]
+    assert batcher.stats == {'lookups': 3, 'triggers': 1, 'urls': 3}
+    await agent.aclose()
+
+
+def test_records_for_url_strict_mode():
+    records = [{'price': 1}]
+    assert records_for_url(records, 'https://x/a') == records
+    assert records_for_url(records, 'https://x/a', strict=True) == []
+    assert records_for_url([{'url': 'https://x/a/', 'price': 2}], 'https://X/a') == [{'url': 'https://x/a/', 'price': 2}]
+
+
+@pytest.mark.asyncio
+async def test_timed_out_snapshot_is_deferred_then_resolved():
+    progress = ['running']
+    calls = []
+
+    def handler(request):
+        endpoint = request.url.path.split('/')[3]
+        calls.append(endpoint)
+        if endpoint == 'trigger':
+            return httpx.Response(200, json={'snapshot_id': 's_slow'})
+        if endpoint == 'progress':
+            return httpx.Response(200, json={'status': progress[0]})
+        return httpx.Response(200, json=[{'price': 99000}])
+
+    agent = AsyncBrightDataScraperAgent('tok', client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+                                        max_wait_minutes=0.001)
+    assert (await agent.scrape_zillow(ADDRESS))['value'] == 'Processing...'
+    [pending] = agent.cache.pending_items()
+    assert pending['snapshot_id'] == 's_slow'
+
+    # Still running: stays pending
+    assert await agent.resolve_deferred() == 0
+    progress[0] = 'ready'
+    assert await agent.resolve_deferred() == 1
+    assert agent.cache.pending_items() == []
+
+    # Served from the cache; the slow snapshot was never re-triggered
+    assert (await agent.scrape_zillow(ADDRESS))['value'] == 99000
+    assert calls.count('trigger') == 1
+    await agent.aclose()
+
+
+class FakeSession:
+    """requests.Session stand-in answering the Bright Data endpoints"""
+
+    def __init__(self, progress):
+        self.progress = progress
+        self.calls = []
+
+    def _respond(self, url, payload):
+        self.calls.append(url.split('/')[5].split('?')[0])
+        return httpx.Response(200, json=payload)
+
+    def post(self, url, **kwargs):
+        return self._respond(url, {'snapshot_id': 's_sync'})
+
+    def get(self, url, **kwargs):
+        if '/progress/' in url:
+            return self._respond(url, {'status': self.progress[0]})
+        return self._respond(url, [{'price': 123000, 'rentZestimate': 1500}])
+
+
+def test_sync_agent_defers_then_resumes_without_retriggering():
+    pytest.importorskip('requests')
+    agent = bright_data.BrightDataScraperAgent('tok', max_wait_minutes=0.001)
+    agent.session = FakeSession(['running'])
+
+    assert agent.scrape_zillow(ADDRESS) == {'value': 'Processing...', 'rent': 'Processing...'}
+    assert agent.cache.pending_items()[0]['snapshot_id'] == 's_sync'
+
+    agent.session.progress[0] = 'ready'
+    assert agent.scrape_zillow(ADDRESS)['value'] == 123000
+    assert agent.cache.pending_items() == []
+    assert agent.session.calls.count('trigger') == 1
+
+    # Served from the result cache
+    calls = len(agent.session.calls)
+    assert agent.scrape_zillow(ADDRESS)['rent'] == 1500
+    assert len(agent.session.calls) == calls
+
+
+def test_module_imports_without_requests():
+    # requests is only used by the sync agent and is not in requirements.txt
+    code = "import sys; sys.modules['requests'] = None; import avm_platform.agents.bright_data"
+    subprocess.run([sys.executable, '-c', code], check=True)
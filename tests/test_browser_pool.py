@@ -0,0 +1,154 @@
+import asyncio
+
+from avm_platform.scraping.browser_pool import BrowserPool, get_browser_pool
+
+
+class FakePage:
+    def __init__(self):
+        self.main_frame = object()
+        self.closed = False
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    async def goto(self, url):
+        self.handlers['framenavigated'](self.main_frame)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+        self.init_scripts = []
+        self.page_handler = None
+
+    def on(self, event, handler):
+        self.page_handler = handler
+
+    async def add_init_script(self, script):
+        self.init_scripts.append(script)
+
+    async def new_page(self):
+        page = FakePage()
+        self.pages.append(page)
+        self.page_handler(page)
+        return page
+
+    async def close(self):
+        pass
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+
+    def on(self, event, handler):
+        pass
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **options):
+        return FakeContext()
+
+    async def close(self):
+        self.connected = False
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.chromium = self
+        self.launched = []
+
+    async def launch(self, **options):
+        browser = FakeBrowser()
+        self.launched.append(browser)
+        return browser
+
+    async def stop(self):
+        pass
+
+
+def make_pool(**kwargs):
+    playwright = FakePlaywright()
+
+    async def factory():
+        return playwright
+
+    pool = BrowserPool(init_script="// stealth", playwright_factory=factory, **kwargs)
+    return pool, playwright
+
+
+def test_pool_reuses_warm_context():
+    pool, playwright = make_pool(size=1)
+
+    async def lookup():
+        async with pool.lease() as context:
+            page = await context.new_page()
+            await page.goto("https://example.com")
+            return context
+
+    try:
+        first = pool.run(lookup())
+        second = pool.run(lookup())
+    finally:
+        pool.close()
+    assert first is second
+    assert len(playwright.launched) == 1
+    assert first.init_scripts == ["// stealth"]
+    assert all(page.closed for page in first.pages)
+
+
+def test_pool_recycles_after_navigation_budget_and_crash():
+    pool, playwright = make_pool(size=1, max_navigations=2)
+
+    async def navigate(times):
+        async with pool.lease() as context:
+            page = await context.new_page()
+            for _ in range(times):
+                await page.goto("https://example.com")
+
+    try:
+        pool.run(navigate(2))
+        pool.run(navigate(1))
+        assert len(playwright.launched) == 2
+        playwright.launched[-1].connected = False
+        pool.run(navigate(1))
+        assert len(playwright.launched) == 3
+        assert pool.stats['recycles'] == 2
+    finally:
+        pool.close()
+
+
+def test_registered_pool_is_resized_to_the_requested_size():
+    created = []
+
+    def factory():
+        pool, _ = make_pool(size=1)
+        created.append(pool)
+        return pool
+
+    key = ('resize-test',)
+    pool = get_browser_pool(key, factory)
+
+    async def lease_all(count):
+        async def hold():
+            async with pool.lease():
+                await asyncio.sleep(0.01)
+        await asyncio.gather(*(hold() for _ in range(count)))
+
+    try:
+        assert get_browser_pool(key, factory, size=3) is pool and pool.size == 3
+        pool.run(lease_all(3))
+        assert len(pool._slots) == 3
+
+        get_browser_pool(key, factory, size=1)
+        assert pool.size == 1 and len(pool._slots) == 1
+        pool.run(lease_all(2))
+        assert len(pool._slots) == 1
+        assert len(created) == 1
+    finally:
+        pool.close()
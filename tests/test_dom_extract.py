@@ -0,0 +1,45 @@
+import json
+
+import pytest
+
+from avm_platform.scraping.dom_extract import (
+    SITE_FIELD_SPECS,
+    compiled_script,
+    extract_fields,
+    extract_records,
+)
+
+
+class FakePage:
+    def __init__(self, result):
+        self.result = result
+        self.scripts = []
+
+    async def evaluate(self, script):
+        self.scripts.append(script)
+        return self.result
+
+
+def test_compiled_script_embeds_spec_and_is_cached():
+    script = compiled_script('redfin')
+    assert script is compiled_script('redfin')
+    assert json.dumps(SITE_FIELD_SPECS['redfin']) in script
+    assert script.startswith('() => (')
+
+
+@pytest.mark.parametrize('site', ['zillow', 'redfin', 'homes', 'realtor', 'movoto'])
+@pytest.mark.asyncio
+async def test_extract_fields_uses_one_round_trip(site):
+    fields = {name: None for name in SITE_FIELD_SPECS[site]['fields']}
+    page = FakePage({**fields, 'value': '$100,000', 'images': []})
+    result = await extract_fields(page, site)
+    assert len(page.scripts) == 1
+    assert result['value'] == '$100,000'
+    assert set(result) == set(fields) | {'images'}
+
+
+@pytest.mark.asyncio
+async def test_extract_records_returns_empty_list_for_no_matches():
+    page = FakePage(None)
+    assert await extract_records(page, 'redfin_comps') == []
+    assert len(page.scripts) == 1
@@ -0,0 +1,27 @@
+import asyncio
+
+from benchmarks.corpus import load_corpus
+from benchmarks.run_extraction import load_smart_extractor
+
+SmartPropertyExtractor = load_smart_extractor()
+from smart_extraction import shutdown_extraction_pools  # noqa: E402
+
+
+def test_extract_many_on_pool_matches_serial(capfd):
+    texts = [f.text() for f in load_corpus()] * 3 + ["", "3 beds"]
+    extractor = SmartPropertyExtractor()
+    serial = [extractor.extract_from_content(text, quiet=True) for text in texts]
+    try:
+        assert extractor.extract_many(texts, workers=2, chunksize=3, quiet=True) == serial
+        assert 'Found' not in capfd.readouterr().out
+        assert extractor.extract_many(texts, workers=1) == serial
+
+        # Workers use the caller's patterns, not the defaults
+        extractor.add_custom_pattern('garage', r'(\d+)-car garage')
+        [result] = extractor.extract_many(["2-car garage, 3 beds"] * 2, workers=2)[:1]
+        assert result['property_data']['garage'] == '2'
+
+        result = asyncio.run(extractor.extract_from_content_async(texts[0], workers=2))
+        assert result['property_data'] == serial[0]['property_data']
+    finally:
+        shutdown_extraction_pools()
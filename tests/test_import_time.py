@@ -0,0 +1,22 @@
+import pytest
+
+from benchmarks.import_time import ROOT, app_imports, compare_to_baseline, measure
+
+
+def test_app_defers_scraping_imports_to_analyze():
+    startup, deferred = app_imports(ROOT / 'app.py')
+    assert 'avm_platform.agents.renderer' in startup
+    for module in ('aggregator', 'fetchers', 'bright_data'):
+        assert f'avm_platform.agents.{module}' in deferred
+        assert f'avm_platform.agents.{module}' not in startup
+
+
+def test_app_startup_skips_heavy_modules():
+    # The probe imports app.py's startup modules, streamlit among them
+    pytest.importorskip("streamlit")
+    report = measure(runs=1)
+    assert report['heavy'] == []
+
+    assert compare_to_baseline(report, report) == []
+    slower = {**report, 'startup_s': report['startup_s'] * 2, 'heavy': ['pandas']}
+    assert len(compare_to_baseline(slower, report)) == 2
@@ -0,0 +1,48 @@
+import numpy as np
+import numpy_financial as npf
+import pytest
+
+from avm_platform.agents.analyzer import AnalyzerAgent
+from avm_platform.agents.config import DEFAULT_ANALYSIS_SETTINGS
+from avm_platform.agents.irr import irr_batch, level_cashflows
+from benchmarks.irr import compare
+
+
+def test_irr_batch_matches_numpy_financial():
+    rng = np.random.default_rng(3)
+    conventional = np.column_stack([-rng.uniform(1e4, 1e5, 200), rng.uniform(0, 3e3, (200, 12)),
+                                    rng.uniform(0, 2e5, 200)])
+    # Several sign changes: numpy_financial picks the root closest to 0%
+    mixed = np.column_stack([-rng.uniform(1e4, 1e5, 200), rng.uniform(-2e3, 3e3, (200, 12)),
+                             rng.uniform(-1e4, 2e5, 200)])
+    for cashflows in (conventional, mixed):
+        expected = np.array([npf.irr(row) for row in cashflows])
+        assert np.allclose(irr_batch(cashflows), expected, rtol=0, atol=1e-9, equal_nan=True)
+
+
+def test_irr_batch_edge_rows():
+    rates = irr_batch([[-100, 110, 0, 0], [100, 10, 10, 0], [0, 0, 0, 0], [-100, 0, 121, 0]])
+    assert rates[0] == pytest.approx(0.1)
+    assert np.isnan(rates[1]) and np.isnan(rates[2])
+    assert rates[3] == pytest.approx(0.1)
+
+
+def test_level_cashflows_pads_ragged_holds():
+    cashflows = level_cashflows([-10, -20], 1, [1, 3], 30)
+    assert cashflows.tolist() == [[-10, 1, 30, 0, 0], [-20, 1, 1, 1, 30]]
+
+
+def test_analyzer_irr_uses_batched_solver():
+    analyzer = AnalyzerAgent(DEFAULT_ANALYSIS_SETTINGS)
+    metrics = analyzer.analyze({'value': 150000.0, 'rent': 1400.0}, {'purchase': 90000, 'reno': 20000, 'hold_months': 12})
+    down = 90000 * 0.2
+    carrying = 630 * (60 + 14) / 30
+    terminal = 150000 - down - carrying - 150000 * 0.045
+    expected = npf.irr([-down - 20000] + [metrics['cash_flow']] * 12 + [terminal]) * 100
+    assert metrics['irr'] == pytest.approx(expected)
+
+
+def test_irr_benchmark_agrees():
+    report = compare(rows=300)
+    assert report['nan_mismatches'] == 0
+    assert report['max_abs_diff'] < 1e-8
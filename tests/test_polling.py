@@ -0,0 +1,76 @@
+import sqlite3
+
+from avm_platform.agents.polling import AdaptivePoller
+from avm_platform.agents.snapshot_cache import SnapshotCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def run_schedule(poller, dataset_id, max_wait):
+    delays = []
+    for delay in poller.schedule(dataset_id, max_wait):
+        delays.append(delay)
+        poller.clock.now += delay
+    return delays
+
+
+def test_backs_off_and_stops_at_deadline():
+    poller = AdaptivePoller(initial=0.5, factor=2, max_interval=4, clock=Clock())
+    delays = run_schedule(poller, 'gd_x', 20)
+    assert delays[:5] == [0.5, 1.0, 2.0, 4.0, 4.0]
+    assert sum(delays) == 20
+
+
+def test_jumps_to_learned_completion_window():
+    cache = SnapshotCache(':memory:')
+    for seconds in [12, 13, 14, 15, 16, 17, 18, 19, 20, 21]:
+        cache.record_completion('gd_x', seconds)
+    poller = AdaptivePoller(cache, initial=0.5, clock=Clock())
+    p10, _, p90 = poller.quantiles('gd_x')
+    assert (p10, p90) == (13, 21)
+
+    delays = run_schedule(poller, 'gd_x', 30)
+    assert delays[0] == 13
+    # Dense polling inside the window instead of 5s steps
+    assert max(delays[1:5]) <= (p90 - p10) / 6
+    assert poller.quantiles('other') is None
+
+
+def test_timed_out_snapshots_keep_the_window_wide():
+    cache = SnapshotCache(':memory:')
+    for seconds in [10, 11, 12, 13, 14]:
+        cache.record_completion('gd_slow', seconds)
+    poller = AdaptivePoller(cache, clock=Clock())
+    assert poller.quantiles('gd_slow')[2] == 14
+
+    # Half the runs never finished inside a 30s wait: p90 is at least that, not the fast runs' p90
+    for _ in range(5):
+        poller.record('gd_slow', 30, censored=True)
+    p10, p50, p90 = poller.quantiles('gd_slow')
+    assert p10 == 11 and p90 == 30
+    assert sorted(cache.completion_times('gd_slow')) == [10, 11, 12, 13, 14]
+
+    # Censored runs alone are not enough to learn from
+    for _ in range(10):
+        poller.record('gd_new', 30, censored=True)
+    assert poller.quantiles('gd_new') is None
+
+
+def test_old_cache_files_gain_the_censored_column(tmp_path):
+    path = tmp_path / 'old.sqlite3'
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE completion_times (dataset_id TEXT NOT NULL, seconds REAL NOT NULL, "
+                 "recorded_at REAL NOT NULL)")
+    conn.execute("INSERT INTO completion_times VALUES ('gd_x', 12.0, 1.0)")
+    conn.commit()
+    conn.close()
+
+    cache = SnapshotCache(path)
+    cache.record_completion('gd_x', 40.0, censored=True)
+    assert sorted(cache.completion_observations('gd_x')) == [(12.0, False), (40.0, True)]
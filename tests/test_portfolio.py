@@ -0,0 +1,46 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from avm_platform.agents.analyzer import AnalyzerAgent
+from avm_platform.agents.config import DEFAULT_ANALYSIS_SETTINGS
+from avm_platform.portfolio import analyze_portfolio, load_batch_results
+
+
+def test_analyze_portfolio_matches_analyzer_and_ranks():
+    properties = pd.DataFrame({
+        'id': ['a', 'b', 'c', 'd'],
+        'value': [150000, 200000, None, 120000],
+        'rent': [1400, 1600, 1000, None],
+        'purchase': [90000, np.nan, 80000, 110000],
+        'reno': [20000, 30000, 10000, 5000],
+    })
+    portfolio = analyze_portfolio(properties, thresholds={'roi': 50})
+    by_id = portfolio.set_index('id')
+
+    analyzer = AnalyzerAgent(DEFAULT_ANALYSIS_SETTINGS)
+    expected = analyzer.analyze({'value': 200000, 'rent': 1600},
+                                {'purchase': 100000.0, 'reno': 30000, 'hold_months': 12})
+    for name, value in expected.items():
+        assert by_id.at['b', name] == pytest.approx(value)
+
+    assert list(portfolio['rank']) == [1, 2, 3, 4]
+    assert portfolio['roi'].is_monotonic_decreasing
+    assert by_id.at['a', 'rank_roi'] == by_id.at['a', 'rank']
+    assert list(portfolio.loc[portfolio['alert'], 'id']) == list(portfolio.loc[portfolio['roi'] > 50, 'id'])
+
+
+def test_load_batch_results_reads_ok_records(tmp_path):
+    path = tmp_path / "results.jsonl"
+    records = [
+        {'id': '1', 'address': '1 A St', 'status': 'ok', 'aggregated': {'value': 150000.0, 'rent': 1200.0},
+         'inputs': {'purchase': 90000, 'reno': 20000, 'hold_months': 12}},
+        {'id': '2', 'address': '2 B St', 'status': 'error', 'error': 'boom'},
+    ]
+    path.write_text('\n'.join(map(json.dumps, records)) + '\n{"id": "trunc')
+    frame = load_batch_results(path)
+    assert frame.to_dict('records') == [{'id': '1', 'address': '1 A St', 'value': 150000.0, 'rent': 1200.0,
+                                         'purchase': 90000, 'reno': 20000, 'hold_months': 12}]
+    assert analyze_portfolio(frame)['alert'].dtype == bool
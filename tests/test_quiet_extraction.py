@@ -0,0 +1,33 @@
+from benchmarks.run_extraction import load_smart_extractor
+
+SmartPropertyExtractor = load_smart_extractor()
+import smart_extraction  # noqa: E402
+from smart_extraction import ExtractionTrace, set_quiet  # noqa: E402
+
+TEXT = "This is a home located in Akron. 3 beds • 1 bath • 1,589 Sq Ft. Quantarium $95,195"
+
+
+def test_quiet_call_records_trace_instead_of_printing(capsys):
+    trace = ExtractionTrace()
+    result = SmartPropertyExtractor().extract_from_content(TEXT, quiet=True, trace=trace)
+    assert capsys.readouterr().out == ''
+    assert trace.fields() == [field for field in result['property_data']
+                              if field not in ('avm_quantarium', 'property_type')]
+    assert trace.counters == {'match': 5, 'avm': 1, 'override': 1}
+    assert ('avm', 'avm_quantarium', 95195) in trace.events
+
+
+def test_global_switch_and_per_call_override(capsys, monkeypatch):
+    monkeypatch.setattr(smart_extraction, '_QUIET', False)
+    extractor = SmartPropertyExtractor()
+    set_quiet()
+    extractor.add_custom_pattern('garage', r'(\d+)-car garage')
+    extractor.extract_from_content(TEXT)
+    extractor.test_patterns(TEXT)
+    assert capsys.readouterr().out == ''
+
+    extractor.extract_from_content(TEXT, quiet=False)
+    assert "✅ Found beds: 3" in capsys.readouterr().out
+    set_quiet(False)
+    extractor.extract_from_content(TEXT)
+    assert "✅ Found beds: 3" in capsys.readouterr().out
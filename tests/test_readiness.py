@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from avm_platform.scraping.readiness import ReadinessWaiter
+
+SPECS = {
+    'example': {
+        'max_wait': 0.3,
+        'jitter': (0.0, 0.0),
+        'stages': {
+            'detail': {'selectors': ['.price'], 'responses': ['/api/home'], 'legacy_wait': 7.5},
+        },
+    },
+}
+
+
+class FakePage:
+    def __init__(self, selector_delay=None):
+        self.selector_delay = selector_delay
+        self.selectors = []
+
+    async def wait_for_selector(self, selector, state=None, timeout=None):
+        self.selectors.append(selector)
+        if self.selector_delay is None:
+            await asyncio.sleep(timeout / 1000)
+            raise TimeoutError("selector timeout")
+        await asyncio.sleep(self.selector_delay)
+        return object()
+
+    async def wait_for_response(self, predicate, timeout=None):
+        await asyncio.sleep(3600)
+
+    async def wait_for_load_state(self, state, timeout=None):
+        return None
+
+
+@pytest.mark.asyncio
+async def test_wait_returns_as_soon_as_selector_appears():
+    waiter = ReadinessWaiter('example', specs=SPECS, jitter=False)
+    page = FakePage(selector_delay=0.01)
+    assert await waiter.wait(page, 'detail') is True
+    await waiter.settle(page)
+
+    meta = waiter.metadata()
+    assert page.selectors == ['.price']
+    assert meta['waited_s'] < 0.3
+    assert meta['legacy_wait_s'] == 9.0
+    assert meta['time_saved_s'] > 8.5
+    assert [s['stage'] for s in meta['stages']] == ['detail', 'scroll']
+
+
+@pytest.mark.asyncio
+async def test_wait_gives_up_at_site_budget():
+    waiter = ReadinessWaiter('example', specs=SPECS, jitter=False)
+    assert await waiter.wait(FakePage(), 'detail') is False
+    stage = waiter.metadata()['stages'][0]
+    assert stage['ready'] is False
+    assert 0.25 <= stage['waited_s'] < 1.0
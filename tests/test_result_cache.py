@@ -0,0 +1,43 @@
+from avm_platform.agents.result_cache import ResultCache
+
+ADDRESS = {'street': '1841 Marks Ave', 'city': 'Akron', 'state': 'OH', 'zip': '44305'}
+OTHER = {'street': '12 Oak St', 'city': 'Akron', 'state': 'OH', 'zip': '44305'}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_hit_keyed_by_address_and_method_until_ttl():
+    clock = Clock()
+    cache = ResultCache(ttl=60, clock=clock)
+    cache.put(ADDRESS, 'api', {'value': 150000})
+
+    clock.now += 30
+    assert cache.get(ADDRESS, 'api') == ({'value': 150000}, 30)
+    assert cache.get(ADDRESS, 'browser') is None
+    assert cache.get(OTHER, 'api') is None
+
+    clock.now += 30
+    assert cache.get(ADDRESS, 'api') is None
+    assert len(cache) == 0
+
+
+def test_evicts_least_recently_used_and_invalidates():
+    cache = ResultCache(max_entries=2, clock=Clock())
+    cache.put(ADDRESS, 'api', 1)
+    cache.put(ADDRESS, 'browser', 2)
+    cache.get(ADDRESS, 'api')
+    cache.put(OTHER, 'api', 3)
+    assert cache.get(ADDRESS, 'browser') is None
+    assert cache.get(ADDRESS, 'api')[0] == 1
+
+    cache.invalidate(ADDRESS)
+    assert cache.get(ADDRESS, 'api') is None
+    assert cache.get(OTHER, 'api')[0] == 3
+    cache.invalidate()
+    assert len(cache) == 0
@@ -0,0 +1,59 @@
+import pytest
+
+from avm_platform.scraping.routing import ESTIMATED_BYTES, RequestRouter
+
+
+class FakePage:
+    url = "https://www.zillow.com/homes/1841-Marks-Ave-Akron-OH-44305_rb/"
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type, page):
+        self.url = url
+        self.resource_type = resource_type
+        self.frame = type("Frame", (), {"page": page})()
+
+
+class FakeRoute:
+    def __init__(self):
+        self.action = None
+
+    async def abort(self, reason):
+        self.action = "abort"
+
+    async def continue_(self):
+        self.action = "continue"
+
+
+def test_should_block_by_type_and_domain():
+    router = RequestRouter()
+    page_url = FakePage.url
+    assert router.should_block("https://photos.zillowstatic.com/a.jpg", "image", page_url)
+    assert router.should_block("https://www.google-analytics.com/collect", "xhr", page_url)
+    assert not router.should_block("https://www.zillow.com/graphql", "xhr", page_url)
+    assert not router.should_block("https://www.zillow.com/homes/x", "document", page_url)
+    # anti-bot challenge scripts are always allowed
+    assert not router.should_block("https://client.px-cloud.net/a.js", "script", page_url)
+
+
+def test_site_overrides_replace_defaults():
+    router = RequestRouter(site_routing={"zillow.com": {"block_types": ["media"]}})
+    assert not router.should_block("https://photos.zillowstatic.com/a.jpg", "image", FakePage.url)
+    assert router.should_block("https://photos.example.com/a.jpg", "image", "https://www.redfin.com/")
+
+
+@pytest.mark.asyncio
+async def test_handle_counts_bytes_saved_per_page():
+    router = RequestRouter()
+    page = FakePage()
+    blocked, allowed = FakeRoute(), FakeRoute()
+    await router.handle(blocked, FakeRequest("https://photos.zillowstatic.com/a.jpg", "image", page))
+    await router.handle(allowed, FakeRequest("https://www.zillow.com/graphql", "fetch", page))
+
+    assert (blocked.action, allowed.action) == ("abort", "continue")
+    stats = router.page_stats(page)
+    assert stats["blocked_requests"] == 1
+    assert stats["allowed_requests"] == 1
+    assert stats["bytes_saved"] == ESTIMATED_BYTES["image"]
+    assert stats["blocked_by_type"] == {"image": 1}
+    assert router.stats["bytes_saved"] == ESTIMATED_BYTES["image"]
@@ -0,0 +1,47 @@
+import numpy as np
+import numpy_financial as npf
+import pytest
+
+from avm_platform.agents.analyzer import AnalyzerAgent
+from avm_platform.agents.config import DEFAULT_ANALYSIS_SETTINGS
+from avm_platform.agents.schedule import amortization_schedule, cash_flow_schedule
+
+
+def test_fixed_rate_schedule_amortizes_to_zero():
+    loans = amortization_schedule([72000, 100000], [5.5, 0], months=372, amortization_years=30)
+    assert loans['payment'].shape == (2, 372)
+    assert loans['payment'][0, 0] == pytest.approx(-npf.pmt(0.055 / 12, 360, 72000))
+    assert loans['payment'][1, 0] == pytest.approx(100000 / 360)
+    assert loans['principal'][:, :360].sum(axis=1) == pytest.approx([72000, 100000])
+    assert np.allclose(loans['balance'][:, 359:], 0) and not loans['payment'][:, 360:].any()
+    assert loans['interest'][0, 0] == pytest.approx(72000 * 0.055 / 12)
+
+
+def test_arm_resets_and_reamortizes():
+    loan = amortization_schedule(72000, 5.5, months=360, arm_length=5, adjustable_rate=1)
+    assert loan['rate'][0, [0, 59, 60, 72, 359]].tolist() == [5.5, 5.5, 6.5, 7.5, 10.5]
+    balance = loan['balance'][0, 59]
+    assert loan['payment'][0, 60] == pytest.approx(-npf.pmt(0.065 / 12, 300, balance))
+    assert loan['balance'][0, -1] == pytest.approx(0, abs=1e-6)
+
+
+def test_cash_flow_schedule_charges_vacancy_and_turnover_at_lease_end():
+    settings = DEFAULT_ANALYSIS_SETTINGS
+    schedule = cash_flow_schedule([1400, 0], [72000, 72000], settings, months=24)
+    payment = schedule['payment'][0, 0]
+    steady = 1400 * (1 - 0.18) - payment
+    assert schedule['cash_flow'][0, 0] == pytest.approx(steady)
+    assert schedule['cash_flow'][0, 11] == pytest.approx(steady - 1400 * 12 * 0.05 - 1500)
+    assert schedule['cumulative'][0, -1] == pytest.approx(schedule['cash_flow'][0].sum())
+    # No rent, no turnover costs
+    assert schedule['cash_flow'][1, 11] == pytest.approx(-payment)
+
+
+def test_analyzer_schedule_matches_its_payment():
+    analyzer = AnalyzerAgent(DEFAULT_ANALYSIS_SETTINGS)
+    aggregated, inputs = {'value': 150000.0, 'rent': 1400.0}, {'purchase': 90000, 'reno': 20000, 'hold_months': 12}
+    schedule = analyzer.schedule(aggregated, inputs, months=12)
+    metrics = analyzer.analyze(aggregated, inputs)
+    # The analyzer spreads vacancy evenly; the schedule books it at turnover
+    vacancy = 1400 * 0.05
+    assert schedule['cash_flow'][0, 0] - vacancy == pytest.approx(metrics['cash_flow'])
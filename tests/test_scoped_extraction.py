@@ -0,0 +1,52 @@
+import asyncio
+
+from benchmarks.corpus import load_corpus
+from benchmarks.run_extraction import load_smart_extractor
+
+SmartPropertyExtractor = load_smart_extractor()
+from smart_extraction import shutdown_extraction_pools  # noqa: E402
+
+[PAGE] = [f for f in load_corpus() if f.sections_path]
+
+
+def test_sections_give_the_same_fields_without_the_tax_history_false_match():
+    extractor = SmartPropertyExtractor()
+    body = extractor.extract_from_content(PAGE.text(), quiet=True)
+    scoped = extractor.extract_from_sections(PAGE.sections(), quiet=True)
+
+    expected = PAGE.expected['smart']
+    assert {field: scoped['property_data'].get(field) for field in expected} == expected
+    assert body['property_data']['property_tax'].startswith('Tax HistoryAssessment History')
+    assert 'property_tax' not in scoped['property_data']
+    # Positions are relative to the section text, values are the same
+    assert [e['value'] for e in scoped['avm_estimates']] == [e['value'] for e in body['avm_estimates']]
+    metadata = scoped['extraction_metadata']
+    assert metadata['content_length'] < body['extraction_metadata']['content_length']
+    assert metadata['sections']['risk'] is None
+
+
+def test_missing_sections_fall_back_to_the_body_text():
+    extractor = SmartPropertyExtractor()
+    sections = dict(PAGE.sections(), avm=None, schools=None)
+
+    without = extractor.extract_from_sections(sections, quiet=True)
+    assert 'avm_quantarium' not in without['property_data']
+    assert 'school_name' not in without['property_data']
+
+    with_fallback = extractor.extract_from_sections(sections, quiet=True, fallback=PAGE.text())
+    assert with_fallback['property_data']['avm_quantarium'] == '$95,195'
+    assert with_fallback['property_data']['school_name'] == 'Search Middle'
+    assert with_fallback['extraction_metadata']['fallback_sections'] == ['avm', 'schools', 'neighborhood', 'risk']
+
+    # Fields outside section_fields (custom patterns) run on every section
+    extractor.add_custom_pattern('listing_status', r'(For Sale)', quiet=True)
+    assert extractor.extract_from_sections(PAGE.sections(), quiet=True)['property_data']['listing_status'] == 'For Sale'
+
+
+def test_sections_on_the_pool():
+    extractor = SmartPropertyExtractor()
+    try:
+        result = asyncio.run(extractor.extract_from_sections_async(PAGE.sections(), workers=2, quiet=True))
+    finally:
+        shutdown_extraction_pools()
+    assert result == extractor.extract_from_sections(PAGE.sections(), quiet=True)
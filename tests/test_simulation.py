@@ -0,0 +1,39 @@
+import pytest
+
+from avm_platform.agents.analyzer import AnalyzerAgent
+from avm_platform.agents.config import DEFAULT_ANALYSIS_SETTINGS
+from avm_platform.agents.simulation import deal_distributions
+
+AGGREGATED = {'value': 150000.0, 'rent': 1400.0, 'spread': {'value': 0.2, 'rent': 0.0},
+              'confidence': {'value': 0.8, 'rent': 0.4}}
+INPUTS = {'purchase': 90000, 'reno': 20000, 'hold_months': 12}
+
+
+def test_simulate_returns_ordered_reproducible_bands():
+    analyzer = AnalyzerAgent(DEFAULT_ANALYSIS_SETTINGS)
+    result = analyzer.simulate(AGGREGATED, INPUTS, paths=20000, seed=7)
+    assert result == analyzer.simulate(AGGREGATED, INPUTS, paths=20000, seed=7)
+    assert result['paths'] == 20000
+    for metric in ('net_profit', 'roi', 'irr', 'cash_flow'):
+        bands = result[metric]
+        assert bands['p5'] < bands['p25'] < bands['p50'] < bands['p75'] < bands['p95']
+    assert 0 < result['probability_of_loss'] < 0.5
+
+
+def test_distributions_follow_site_spread_and_confidence():
+    specs = deal_distributions(AGGREGATED, INPUTS, DEFAULT_ANALYSIS_SETTINGS)
+    # Spread wins for ARV (20% range -> 10% sd); low confidence sets the floor for rent
+    assert specs['arv'] == ('normal', 150000.0, pytest.approx(15000.0))
+    assert specs['rent'] == ('normal', 1400.0, pytest.approx(1400 * 0.11))
+    assert specs['hold_months'] == ('triangular', pytest.approx(9.6), 12.0, 18.0)
+
+
+def test_fixed_distributions_reproduce_the_point_estimate():
+    analyzer = AnalyzerAgent(DEFAULT_ANALYSIS_SETTINGS)
+    fixed = {'arv': ('fixed', 150000.0), 'rent': ('fixed', 1400.0), 'reno_overrun': ('fixed', 1.0),
+             'hold_months': ('fixed', 12), 'interest': ('fixed', DEFAULT_ANALYSIS_SETTINGS['interest'])}
+    result = analyzer.simulate(AGGREGATED, INPUTS, paths=10, distributions=fixed)
+    point = analyzer.analyze(AGGREGATED, INPUTS)
+    for metric in ('net_profit', 'roi', 'irr', 'cash_flow'):
+        assert result[metric]['p5'] == pytest.approx(point[metric])
+        assert result[metric]['p95'] == pytest.approx(point[metric])
@@ -0,0 +1,37 @@
+import pytest
+
+from benchmarks.corpus import load_corpus
+from benchmarks.run_extraction import load_smart_extractor
+from benchmarks.smart_engine import engine_property_data, legacy_property_data
+
+SmartPropertyExtractor = load_smart_extractor()
+
+EDGE_CASES = [
+    "",
+    "LAST SOLD for $85,000 • 3 BEDS • Built in 1952",
+    # Characters re.IGNORECASE folds to ASCII letters that str.lower() does not
+    "Laſt ſold: $85,000 • Prİce • 2 beds",
+    "Tax paid $1,000 then Property Tax $2,000, HOA $40",
+    "Walk Score 91, School Grade B, 0.4 mi to the school, 45% college grads",
+]
+
+
+@pytest.mark.parametrize("text", [f.text() for f in load_corpus()] + EDGE_CASES)
+def test_compiled_engine_matches_findall(text):
+    extractor = SmartPropertyExtractor()
+    assert engine_property_data(extractor, text) == legacy_property_data(extractor, text)
+
+
+def test_anchors_skip_absent_patterns_and_custom_patterns_drop_them(capsys):
+    extractor = SmartPropertyExtractor()
+    result = extractor.extract_from_content("3 beds • 1 bath • 1,589 Sq Ft")
+    assert result['found']
+    assert result['extraction_metadata']['patterns_skipped'] > 30
+
+    # A replaced pattern must not inherit the old field's anchors
+    extractor.add_custom_pattern('hoa_fees', r'Association dues\D*(\d+)')
+    assert extractor.extract_from_content("Association dues $55")['property_data']['hoa_fees'] == '55'
+
+    with pytest.raises(ValueError):
+        extractor.add_custom_pattern('walk_score', r'Walk (\d+)', anchors={'any': ['Walk']})
+        extractor.engine()
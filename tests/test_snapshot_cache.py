@@ -0,0 +1,51 @@
+from avm_platform.agents.snapshot_cache import DAY, SnapshotCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+RESULT = {'value': 250000, 'rent': 1900, 'beds': 3, 'year': 1952, 'taxes': 2100, 'images': ['a.jpg']}
+
+
+def test_field_classes_expire_independently(tmp_path):
+    clock = Clock()
+    cache = SnapshotCache(tmp_path / "cache.sqlite3", clock=clock)
+    cache.put_result('k', 'zillow', RESULT)
+    cache.put_snapshot('k', 'zillow', 's_1')
+
+    assert cache.get_result('k', 'zillow') == (RESULT, set())
+    clock.now += 2 * DAY
+    fields, missing = cache.get_result('k', 'zillow')
+    assert 'value' not in fields and fields['year'] == 1952
+    assert 'avm' in missing
+    assert cache.get_snapshot('k', 'zillow') is None
+    assert cache.get_result('other', 'zillow') == ({}, {'avm', 'history', 'facts', 'media'})
+
+    metrics = cache.metrics()
+    assert (metrics['hits'], metrics['partial_hits'], metrics['misses']) == (1, 1, 1)
+    assert metrics['snapshot_misses'] == 1
+
+    # Persisted across instances
+    assert SnapshotCache(tmp_path / "cache.sqlite3", clock=clock).get_result('k', 'zillow')[0]['year'] == 1952
+
+
+def test_evict_drops_expired_then_least_recently_used():
+    clock = Clock()
+    cache = SnapshotCache(':memory:', max_entries=4, clock=clock)
+    for key in ('a', 'b', 'c'):
+        cache.put_result(key, 'zillow', {'value': 1, 'beds': 2})
+        clock.now += 1
+    cache.get_result('a', 'zillow')  # 'a' is now the most recently used
+    clock.now += 2 * DAY  # all 'avm' rows expire, 'facts' rows remain
+
+    assert cache.evict() == 3
+    cache.put_result('d', 'zillow', {'beds': 4})
+    cache.put_result('e', 'zillow', {'beds': 5})
+    assert cache.evict() == 1
+    assert cache.get_result('b', 'zillow')[0] == {}
+    assert cache.get_result('a', 'zillow')[0] == {'beds': 2}
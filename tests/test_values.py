@@ -0,0 +1,76 @@
+import pytest
+
+from avm_platform.agents.values import normalize_smart_data, parse_typed, typed_fields, with_typed
+
+
+def test_parse_typed_ranges_units_and_periods():
+    price = parse_typed("$92,000 - $118,000", 'money')
+    assert (price['value'], price['low'], price['high'], price['unit']) == (105000.0, 92000.0, 118000.0, 'usd')
+    assert price['confidence'] < parse_typed("$92,000", 'money')['confidence']
+
+    assert parse_typed("3 beds", 'count')['value'] == 3.0
+    assert parse_typed("Studio", 'count')['value'] == 0.0
+    assert parse_typed("1,589 Sq Ft", 'area')['value'] == 1589.0
+    assert parse_typed("$1,200/mo", 'rent')['value'] == 1200.0
+    assert parse_typed("$14,400/yr", 'rent')['value'] == 1200.0
+    assert parse_typed("$104/month", 'tax')['value'] == 1248.0
+    assert parse_typed("$1.2K", 'tax')['value'] == 1200.0
+    assert parse_typed("$1.5M", 'money')['value'] == 1500000.0
+    assert parse_typed("10,890 sqft", 'lot')['value'] == 0.25
+    assert parse_typed("Built in 1952", 'year')['value'] == 1952
+    assert parse_typed("Last sold: March 2020 for $85,000", 'money')['value'] == 85000.0
+    assert parse_typed(2.5, 'count') == {'value': 2.5, 'low': 2.5, 'high': 2.5, 'unit': 'count',
+                                         'confidence': 1.0, 'raw': 2.5}
+
+
+@pytest.mark.parametrize("raw", [None, 'Failed', 'Processing...', ' N/A ', 'Contact agent', True, [1]])
+def test_parse_typed_rejects_placeholders(raw):
+    assert parse_typed(raw, 'money') is None
+
+
+def test_parse_typed_rejects_implausible_values():
+    assert parse_typed("$65", 'money') is None
+    assert parse_typed("1240 beds", 'count') is None
+    assert parse_typed(3025, 'year') is None
+
+
+def test_typed_fields_reuses_ingestion_values_until_raw_changes():
+    site = with_typed({'value': '$150,000', 'rent': 'Failed', 'beds': 3})
+    assert set(site['typed']) == {'value', 'beds'}
+    site['typed']['beds']['value'] = 4.0  # marker: a reused entry is not re-parsed
+    site['value'] = 'Timeout'
+    typed = typed_fields(site)
+    assert typed['beds']['value'] == 4.0
+    assert 'value' not in typed
+    assert 'typed' not in with_typed({'value': 'Failed', 'rent': 'Failed'})
+
+
+def test_normalize_smart_data_maps_extractor_fields():
+    typed = normalize_smart_data({
+        'price': '92,000 - $118,000', 'beds': '5', 'sqft': '1,589', 'year_built': '1952',
+        'lot_size': '0.25', 'property_tax': 'Property Tax: $1,250', 'avm_quantarium': '$95,195',
+        'status': 'For Sale',
+    })
+    assert typed['value']['value'] == 105000.0
+    assert typed['beds']['value'] == 5.0
+    assert typed['year']['value'] == 1952
+    assert typed['lot_size']['value'] == 0.25
+    assert typed['taxes']['value'] == 1250.0
+    assert typed['avm_quantarium']['value'] == 95195.0
+    assert 'status' not in typed
+
+
+def test_aggregator_averages_range_midpoints():
+    from avm_platform.agents.aggregator import AggregatorAgent
+
+    aggregated, _ = AggregatorAgent().aggregate({
+        'homes': {'value': '$92,000 - $118,000', 'beds': '5 Beds', 'sqft': '1,589 Sq Ft', 'taxes': '$1.2K'},
+        'zillow': with_typed({'value': 115000, 'beds': 5, 'rent': '$1,100/mo'}),
+        'redfin': {'value': 'Failed', 'rent': 'Failed'},
+    })
+    assert aggregated['value'] == 110000.0
+    assert aggregated['beds'] == 5.0
+    assert aggregated['rent'] == 1100.0
+    assert aggregated['taxes'] == 1200.0
+    assert aggregated['successful_sites'] == ['Homes', 'Zillow']
+    assert aggregated['failed_sites'] == ['Redfin']